@@ -87,3 +87,7 @@ def pytest_generate_tests(metafunc):
 def pytest_addoption(parser):
     parser.addoption('--dev_str', action="store", default="cpu:0")
     parser.addoption('--backend', action="store", default="all")
+    parser.addoption('--record_overhead_budgets', action="store_true", default=False,
+                     help="re-record the dispatch overhead budgets of ivy core functions, rather than checking them")
+    parser.addoption('--overhead_tolerance', action="store", default=0.5, type=float,
+                     help="fraction by which measured dispatch overheads may exceed their budgets")
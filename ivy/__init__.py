@@ -2,6 +2,11 @@ from .core import *
 from . import neural_net as nn
 from .neural_net import *
 from . import verbosity
+from . import instrumentation
+from . import tracer
+from . import usage
+from .threads import set_num_threads, get_num_threads, num_threads
+from .auto import auto_backend
 from .framework_handler import get_framework, set_framework, unset_framework, framework_stack
 
 
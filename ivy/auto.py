@@ -0,0 +1,312 @@
+"""
+Opt-in automatic backend selection, routing each ivy call to the backend measured to be cheapest for its function, input
+device, dtypes and shapes, with the measured costs kept in a persistent cost table.
+"""
+
+# global
+import os
+import sys
+import json
+import time
+import types
+import logging
+import threading
+import importlib
+import numpy as _np
+
+# local
+from ivy import framework_handler as _framework_handler
+from ivy.instrumentation import array_args, dtype_name
+
+MODULES = ['ivy.core.general', 'ivy.core.linalg', 'ivy.core.logic', 'ivy.core.math', 'ivy.core.reductions',
+           'ivy.neural_net.activations', 'ivy.neural_net.layers', 'ivy.neural_net.losses']
+# functions which create, convert or describe arrays, rather than computing with them
+EXCLUDED = ['array', 'to_numpy', 'to_list', 'shape', 'get_num_dims', 'dev', 'dev_to_str', 'dev_str',
+            'gpu_is_available', 'tpu_is_available', 'dtype', 'dtype_to_str', 'dtype_str', 'compile_fn']
+BACKENDS = ['numpy', 'jax', 'tensorflow', 'torch', 'mxnd']
+
+_active = list()
+_patched = list()
+_local = threading.local()
+
+
+# Conversion #
+# -----------#
+
+def _backend_of(value):
+    module_name = _framework_handler._array_types.get(value.__class__.__module__)
+    return module_name.split('.')[-1] if module_name is not None else None
+
+
+def _to_numpy(x, backend):
+    if backend == 'numpy':
+        return x
+    if backend == 'torch':
+        # shares memory with tensors on the cpu
+        return x.detach().cpu().numpy()
+    if backend == 'tensorflow':
+        return x.numpy()
+    return importlib.import_module('ivy.' + backend).to_numpy(x)
+
+
+def _tf_tape_recording():
+    # gradient tapes are not exposed in the public api, and the module tracking them has moved between versions
+    for module_name in ['tensorflow.python.eager.record', 'tensorflow.python.eager.tape']:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        if hasattr(module, 'could_possibly_record'):
+            return module.could_possibly_record()
+    return True
+
+
+def _tracks_gradients(x, backend):
+    if backend == 'torch':
+        return x.requires_grad
+    if backend == 'tensorflow':
+        tf = sys.modules['tensorflow']
+        return isinstance(x, tf.Variable) or not tf.executing_eagerly() or _tf_tape_recording()
+    if backend == 'jax':
+        return isinstance(x, sys.modules['jax'].core.Tracer)
+    if backend == 'mxnd':
+        return x.grad is not None or sys.modules['mxnet'].autograd.is_recording()
+    return False
+
+
+def _dev_str_of(x, backend):
+    return importlib.import_module('ivy.' + backend).dev_str(x)
+
+
+def _from_numpy(x, backend, dev_str=None):
+    if backend == 'numpy':
+        return x
+    x = _np.asarray(x)
+    if dev_str is not None and not dev_str.startswith('cpu'):
+        # outputs are returned to the device of the inputs
+        return importlib.import_module('ivy.' + backend).array(x if x.flags.writeable else x.copy(), dev_str=dev_str)
+    if backend == 'torch':
+        # shares memory with writable numpy arrays
+        return sys.modules['torch'].as_tensor(x if x.flags.writeable else x.copy())
+    if backend == 'tensorflow':
+        return sys.modules['tensorflow'].convert_to_tensor(x)
+    return importlib.import_module('ivy.' + backend).array(x)
+
+
+def _convert(value, source, target, dev_str=None):
+    if isinstance(value, (list, tuple)):
+        return type(value)([_convert(item, source, target, dev_str) for item in value])
+    if isinstance(value, dict):
+        return dict([(key, _convert(item, source, target, dev_str)) for key, item in value.items()])
+    if _backend_of(value) != source:
+        return value
+    return _from_numpy(_to_numpy(value, source), target, dev_str)
+
+
+# Cost Keys #
+# ----------#
+
+def _bucket(dim):
+    # dimensions are rounded up to powers of two, so that similar shapes share costs
+    return 1 if dim is None or dim <= 1 else 1 << (int(dim) - 1).bit_length()
+
+
+def _cost_key(name, source, dev_str, arrays):
+    dtypes = ','.join([dtype_name(array.dtype) for array in arrays])
+    shapes = ','.join(['x'.join([str(_bucket(dim)) for dim in array.shape]) or 'scalar' for array in arrays])
+    return '|'.join([name, source, dev_str, dtypes, shapes])
+
+
+# Routing #
+# --------#
+
+def _wrap(fn, name):
+
+    def _auto(*args, **kwargs):
+        if getattr(_local, 'routing', False) or not _active or kwargs.get('f') is not None or\
+                _framework_handler.framework_stack or any([isinstance(arg, types.ModuleType) for arg in args]):
+            # calls with an explicit framework, and calls made within a routed call, are left alone
+            return fn(*args, **kwargs)
+        arrays = list(array_args(list(args) + list(kwargs.values())))
+        sources = set([_backend_of(array) for array in arrays])
+        if len(sources) != 1 or None in sources:
+            return fn(*args, **kwargs)
+        source = sources.pop()
+        if any([_tracks_gradients(array, source) for array in arrays]):
+            # converting through numpy would detach the outputs from autograd and tracing
+            return fn(*args, **kwargs)
+        dev_strs = set([_dev_str_of(array, source) for array in arrays])
+        if len(dev_strs) != 1:
+            return fn(*args, **kwargs)
+        _local.routing = True
+        try:
+            return _active[-1]._call(fn, name, source, dev_strs.pop(), arrays, args, kwargs)
+        finally:
+            _local.routing = False
+
+    _auto.__name__ = fn.__name__
+    _auto.__doc__ = fn.__doc__
+    _auto.__module__ = fn.__module__
+    _auto.__wrapped__ = fn
+    return _auto
+
+
+def _install():
+    wrappers = dict()
+    for module_name in MODULES:
+        module = importlib.import_module(module_name)
+        for key, value in list(module.__dict__.items()):
+            if key[0] == '_' or key in EXCLUDED or not isinstance(value, types.FunctionType) or\
+                    value.__module__ != module_name:
+                continue
+            wrappers[id(value)] = _wrap(value, key)
+    for name, module in list(sys.modules.items()):
+        if module is None or (name != 'ivy' and not name.startswith('ivy.')) or name == __name__:
+            continue
+        for key, value in list(module.__dict__.items()):
+            if id(value) in wrappers:
+                setattr(module, key, wrappers[id(value)])
+                _patched.append((module, key, value))
+
+
+def _uninstall():
+    while _patched:
+        module, key, value = _patched.pop(-1)
+        setattr(module, key, value)
+
+
+class auto_backend:
+
+    def __init__(self, filepath=None, backends=None, num_warmup=1, num_iterations=5):
+        """
+        Context manager which routes ivy calls to the cheapest backend. The first call of each function for a given
+        input backend, device, input dtypes and input shapes, with each dimension rounded up to a power of two, is
+        timed on every candidate backend, including the conversion of inputs and outputs. Later calls with the same
+        key are run on the cheapest backend, with inputs converted to it through numpy, sharing buffers where the
+        frameworks allow, and outputs converted back to the backend and device of the inputs. Calls given an explicit
+        framework, made while a framework is set, with inputs from several backends or devices, or with inputs which
+        require gradients or are being traced, are run as normal. Costs are specific to the machine they were measured
+        on.
+
+        :param filepath: Json file of the cost table, loaded on entry if it exists, and written on exit. Default is to
+                         keep the cost table in memory only.
+        :type filepath: str, optional
+        :param backends: Candidate backends. Default is every backend whose native framework is already imported.
+        :type backends: sequence of strs, optional
+        :param num_warmup: Untimed calls on each candidate before timing. Default is 1.
+        :type num_warmup: int, optional
+        :param num_iterations: Timed calls on each candidate, of which the median is the cost. Default is 5.
+        :type num_iterations: int, optional
+        """
+        self._filepath = filepath
+        self._backends = backends
+        self._num_warmup = num_warmup
+        self._num_iterations = num_iterations
+        self._frameworks = dict()
+        self._lock = threading.Lock()
+        # cost key to a dict from backend to median call time in seconds, or None for backends which failed
+        self.costs = dict()
+        # backend to number of calls routed to it
+        self.counts = dict()
+
+    def _load_backends(self):
+        from ivy.bench.runner import NATIVE_MODULES
+        backends = [backend for backend in BACKENDS if NATIVE_MODULES[backend] in sys.modules]\
+            if self._backends is None else self._backends
+        for backend in backends:
+            try:
+                self._frameworks[backend] = importlib.import_module('ivy.' + backend)
+            except Exception as e:
+                logging.warning('Backend {} could not be imported, and will not be a candidate: {}'.format(backend, e))
+
+    def _run(self, fn, source, dev_str, target, args, kwargs):
+        if target == source:
+            # inputs are left on their device
+            return fn(*args, **kwargs)
+        target_kwargs = _convert(kwargs, source, target)
+        target_kwargs['f'] = self._frameworks[target]
+        return _convert(fn(*_convert(args, source, target), **target_kwargs), target, source, dev_str)
+
+    def _time(self, fn, source, dev_str, target, args, kwargs):
+        from ivy.bench.runner import _block
+        times = list()
+        ret = None
+        for i in range(self._num_warmup + self._num_iterations):
+            start = time.perf_counter()
+            ret = self._run(fn, source, dev_str, target, args, kwargs)
+            _block(ret)
+            if i >= self._num_warmup:
+                times.append(time.perf_counter() - start)
+        return float(_np.median(times)), ret
+
+    def _profile(self, fn, key, source, dev_str, args, kwargs):
+        costs = dict()
+        rets = dict()
+        for backend in self._frameworks.keys():
+            try:
+                costs[backend], rets[backend] = self._time(fn, source, dev_str, backend, args, kwargs)
+            except Exception:
+                # functions or dtypes which the backend does not support
+                costs[backend] = None
+        with self._lock:
+            self.costs[key] = costs
+        return rets
+
+    def _choose(self, key, source):
+        valid = [(cost, backend) for backend, cost in self.costs[key].items()
+                 if cost is not None and backend in self._frameworks]
+        return min(valid)[1] if valid else source
+
+    def _call(self, fn, name, source, dev_str, arrays, args, kwargs):
+        key = _cost_key(name, source, dev_str, arrays)
+        rets = self._profile(fn, key, source, dev_str, args, kwargs) if key not in self.costs else dict()
+        backend = self._choose(key, source)
+        with self._lock:
+            self.counts[backend] = self.counts.get(backend, 0) + 1
+        if backend in rets:
+            return rets[backend]
+        return self._run(fn, source, dev_str, backend, args, kwargs)
+
+    def load(self, filepath):
+        """
+        Add the costs stored in a cost table file, replacing any measured for the same keys.
+
+        :param filepath: Json file of the cost table.
+        :type filepath: str
+        """
+        with open(filepath, 'r') as file:
+            costs = json.loads(file.read())
+        with self._lock:
+            self.costs.update(costs)
+
+    def save(self, filepath):
+        """
+        Write the cost table as json, merged with any costs already stored in the file for other keys.
+
+        :param filepath: Json file of the cost table.
+        :type filepath: str
+        """
+        costs = dict()
+        if os.path.exists(filepath):
+            with open(filepath, 'r') as file:
+                costs = json.loads(file.read())
+        with self._lock:
+            costs.update(self.costs)
+        with open(filepath, 'w') as file:
+            file.write(json.dumps(costs, indent=4, sort_keys=True))
+
+    def __enter__(self):
+        if _active:
+            raise Exception('Only one auto_backend context can be active at a time.')
+        self._load_backends()
+        if self._filepath is not None and os.path.exists(self._filepath):
+            self.load(self._filepath)
+        _install()
+        _active.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active.remove(self)
+        _uninstall()
+        if self._filepath is not None:
+            self.save(self._filepath)
@@ -0,0 +1,21 @@
+"""
+Cross-backend benchmarking of ivy ops, sweeping sizes, dtypes, batch shapes, thread counts and compiled or eager modes,
+with a result store for detecting regressions between revisions, peak memory profiling, dispatch overhead budgets,
+and compiled versus eager comparisons.
+"""
+
+from . import ops
+from .ops import OPS, BenchOp, register_op
+from . import stats
+from .stats import summarise, mann_whitney_u
+from . import runner
+from .runner import load_backend, backend_version, make_inputs, benchmark, sweep, overhead_crossovers, \
+    thread_layouts
+from . import store
+from .store import ResultStore, current_git_rev, compare, format_report
+from . import memory
+from .memory import profile_memory, memory_sweep, rank_by_allocation, format_memory_report
+from . import overhead
+from .overhead import calibration_time, measure_overhead, measure_budgets, load_budgets, save_budgets
+from . import compiled
+from .compiled import break_even_calls, compile_benchmark, compile_matrix, format_compile_report
@@ -0,0 +1,5 @@
+import sys
+
+from ivy.bench.cli import main
+
+sys.exit(main())
@@ -0,0 +1,228 @@
+"""
+Command line interfaces for sweeping benchmark ops across backends, sizes, dtypes, batch shapes and thread counts,
+either timing them or profiling their memory, for comparing stored results against a baseline revision, for
+measuring dispatch overhead budgets, and for comparing compiled and eager execution.
+"""
+
+# global
+import csv
+import sys
+import json
+import argparse
+
+# local
+from ivy.bench.ops import OPS
+from ivy.bench.runner import BACKENDS, sweep, overhead_crossovers, thread_layouts
+from ivy.bench.store import ResultStore, compare, format_report
+from ivy.bench.memory import memory_sweep, format_memory_report
+from ivy.bench.overhead import measure_budgets, save_budgets
+from ivy.bench.compiled import COMPILE_OPS, COMPILE_BACKENDS, compile_matrix, format_compile_report
+
+CONFIG_FIELDS = ['op', 'backend', 'size', 'dtype', 'batch_shape', 'mode', 'num_threads', 'num_iterations']
+
+
+def _parse_list(string, type_fn=str):
+    return [type_fn(item) for item in string.split(',') if item]
+
+
+def _parse_batch_shape(string):
+    # batch shapes are written as 8x4, with none for no batch dimensions
+    return tuple() if string == 'none' else tuple(int(dim) for dim in string.split('x'))
+
+
+def _format_batch_shape(batch_shape):
+    return 'x'.join([str(dim) for dim in batch_shape]) if batch_shape else 'none'
+
+
+def write_json(results, file):
+    """
+    Write benchmark results or comparisons as a json list.
+
+    :param results: Result dicts, as returned by sweep or compare.
+    :type results: sequence of dicts
+    :param file: File to write to.
+    :type file: file object
+    """
+    file.write(json.dumps(results, indent=4))
+
+
+def write_csv(results, file):
+    """
+    Write benchmark results or comparisons as csv, with one row per result and batch shapes written as 8x4. Call times
+    are left out, and are only written to json.
+
+    :param results: Result dicts, as returned by sweep or compare.
+    :type results: sequence of dicts
+    :param file: File to write to.
+    :type file: file object
+    """
+    fields = [field for field in CONFIG_FIELDS if any([field in result for result in results])]
+    for result in results:
+        fields += [key for key in result.keys() if key not in fields and key != 'times']
+    csv_writer = csv.DictWriter(file, fields, restval='', extrasaction='ignore')
+    csv_writer.writeheader()
+    for result in results:
+        csv_writer.writerow(dict(result, batch_shape=_format_batch_shape(result['batch_shape'])))
+
+
+def _write_output(results, filepath):
+    with open(filepath, 'w') as file:
+        if filepath.endswith('.csv'):
+            write_csv(results, file)
+        else:
+            write_json(results, file)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='ivy-bench', description='Sweep benchmark ops across backends, sizes, '
+                                                                   'dtypes and batch shapes.')
+    parser.add_argument('--ops', type=_parse_list, default=list(OPS.keys()),
+                        help='comma separated ops, from {}'.format(','.join(OPS.keys())))
+    parser.add_argument('--backends', type=_parse_list, default=BACKENDS,
+                        help='comma separated backends, from {}'.format(','.join(BACKENDS)))
+    parser.add_argument('--sizes', type=lambda s: _parse_list(s, lambda item: int(float(item))),
+                        default=[10 ** i for i in range(7)], help='comma separated input sizes, such as 1,1e3,1e6')
+    parser.add_argument('--dtypes', type=_parse_list, default=['float32'], help='comma separated float dtypes')
+    parser.add_argument('--batch_shapes', type=lambda s: _parse_list(s, _parse_batch_shape), default=[()],
+                        help='comma separated batch shapes, such as none,8,4x8')
+    parser.add_argument('--modes', type=_parse_list, default=['eager'], help='comma separated modes, eager,compiled')
+    parser.add_argument('--warmup', type=int, default=10, help='untimed calls before timing')
+    parser.add_argument('--iterations', type=int, default=100, help='timed calls')
+    parser.add_argument('--dev_str', default=None, help='device to run on')
+    parser.add_argument('--threads', type=lambda s: _parse_list(s, int), default=None,
+                        help='comma separated intra-op thread counts, such as 1,2,4, default is unchanged')
+    parser.add_argument('--cores', type=int, default=None,
+                        help='cores to lay out processes on when sweeping thread counts, default is all cores')
+    parser.add_argument('--threshold', type=float, default=0.05,
+                        help='overhead fraction below which dispatch overhead is reported as negligible')
+    parser.add_argument('-o', '--output', default=None,
+                        help='output file, written as csv for a .csv extension and json otherwise')
+    parser.add_argument('--store', default=None, help='sqlite result store to add the results to')
+    parser.add_argument('--git_rev', default=None, help='revision to store the results under, default is the ivy '
+                                                         'git revision')
+    parser.add_argument('--memory', action='store_true',
+                        help='profile peak memory instead of timing, and print ops ranked by bytes per output byte')
+    parsed = parser.parse_args(args)
+
+    if parsed.memory:
+        results = memory_sweep(parsed.ops, parsed.backends, parsed.sizes, parsed.dtypes, parsed.batch_shapes,
+                               parsed.warmup, parsed.dev_str)
+        if parsed.output is not None:
+            _write_output(results, parsed.output)
+        print(format_memory_report(results))
+        return
+
+    results = sweep(parsed.ops, parsed.backends, parsed.sizes, parsed.dtypes, parsed.batch_shapes, parsed.modes,
+                    parsed.warmup, parsed.iterations, parsed.dev_str, parsed.threads)
+
+    if parsed.store is not None:
+        with ResultStore(parsed.store) as store:
+            store.add(results, parsed.git_rev)
+    if parsed.output is None:
+        write_json(results, sys.stdout)
+        sys.stdout.write('\n')
+    else:
+        _write_output(results, parsed.output)
+    # the summary goes to stderr when the results are written to stdout, so that they remain valid json
+    summary_file = sys.stdout if parsed.output is not None else sys.stderr
+    for crossover in overhead_crossovers(results, parsed.threshold):
+        description = '{} {} {} batch {}'.format(crossover['op'], crossover['backend'], crossover['dtype'],
+                                                 _format_batch_shape(crossover['batch_shape']))
+        if crossover['crossover_size'] is None:
+            print('{}: overhead never below {:.0%}'.format(description, parsed.threshold), file=summary_file)
+        else:
+            print('{}: overhead below {:.0%} from size {}'.format(
+                description, parsed.threshold, crossover['crossover_size']), file=summary_file)
+    if parsed.threads is not None and len(parsed.threads) > 1:
+        for layout in thread_layouts(results, parsed.cores):
+            print('{} {} {} {} batch {} size {}: best layout is {} processes of {} threads, {:.1f} calls/s'.format(
+                layout['op'], layout['backend'], layout['mode'], layout['dtype'],
+                _format_batch_shape(layout['batch_shape']), layout['size'], layout['num_processes'],
+                layout['num_threads'], layout['throughput']), file=summary_file)
+
+
+def compare_main(args=None):
+    parser = argparse.ArgumentParser(prog='ivy-bench-compare', description='Compare stored benchmark results against '
+                                                                           'a baseline revision.')
+    parser.add_argument('--store', required=True, help='sqlite result store')
+    parser.add_argument('--baseline', required=True, help='baseline git revision')
+    parser.add_argument('--current', default=None, help='git revision to compare, default is the most recently '
+                                                         'stored revision other than the baseline')
+    parser.add_argument('--backends', type=_parse_list, default=None, help='comma separated backends to compare')
+    parser.add_argument('--ops', type=_parse_list, default=None, help='comma separated ops to compare')
+    parser.add_argument('--threshold', type=float, default=0.05,
+                        help='relative slowdown of the median above which a significant change is a regression')
+    parser.add_argument('--alpha', type=float, default=0.01, help='significance level of the Mann-Whitney U test')
+    parser.add_argument('-o', '--output', default=None,
+                        help='file to also write the comparisons to, as csv for a .csv extension and json otherwise')
+    parsed = parser.parse_args(args)
+
+    with ResultStore(parsed.store) as store:
+        current_rev = parsed.current
+        if current_rev is None:
+            revisions = [rev for rev in store.revisions() if rev != parsed.baseline]
+            if not revisions:
+                raise Exception('The store has no revisions other than the baseline {}.'.format(parsed.baseline))
+            current_rev = revisions[-1]
+        baseline, current = store.query(parsed.baseline), store.query(current_rev)
+    if not baseline:
+        raise Exception('The store has no results for the baseline {}.'.format(parsed.baseline))
+    if parsed.backends is not None:
+        current = [result for result in current if result['backend'] in parsed.backends]
+    if parsed.ops is not None:
+        current = [result for result in current if result['op'] in parsed.ops]
+
+    comparisons = compare(baseline, current, parsed.threshold, parsed.alpha)
+    print(format_report(comparisons, parsed.baseline, current_rev))
+    if parsed.output is not None:
+        _write_output(comparisons, parsed.output)
+    # a non-zero exit status lets scripts stop a rollout on regressions
+    return 1 if any([comparison['status'] == 'regression' for comparison in comparisons]) else 0
+
+
+def budgets_main(args=None):
+    parser = argparse.ArgumentParser(prog='ivy-bench-budgets', description='Measure dispatch overhead budgets for '
+                                                                           'every ivy core function and input case.')
+    parser.add_argument('-o', '--output', required=True, help='json file of budgets, merged case by case with the '
+                                                              'budgets already stored')
+    parser.add_argument('--backends', type=_parse_list, default=BACKENDS,
+                        help='comma separated backends, from {}'.format(','.join(BACKENDS)))
+    parser.add_argument('--headroom', type=float, default=3., help='factor between measured overhead and budget')
+    parser.add_argument('--min_budget', type=float, default=10., help='smallest budget, in python call times')
+    parser.add_argument('--iterations', type=int, default=100, help='calls in each measurement')
+    parser.add_argument('--dev_str', default=None, help='device to run on')
+    parsed = parser.parse_args(args)
+
+    budgets = measure_budgets(parsed.backends, parsed.headroom, parsed.min_budget, parsed.dev_str, parsed.iterations)
+    save_budgets(budgets, parsed.output)
+    for backend, backend_budgets in budgets.items():
+        print('{}: {} budgets'.format(backend, len(backend_budgets)))
+
+
+def compile_main(args=None):
+    parser = argparse.ArgumentParser(prog='ivy-bench-compile', description='Compare compiled and eager execution of '
+                                                                           'benchmark ops across backends.')
+    parser.add_argument('--ops', type=_parse_list, default=COMPILE_OPS,
+                        help='comma separated ops, from {}'.format(','.join(OPS.keys())))
+    parser.add_argument('--backends', type=_parse_list, default=COMPILE_BACKENDS,
+                        help='comma separated backends, from {}'.format(','.join(BACKENDS)))
+    parser.add_argument('--sizes', type=lambda s: _parse_list(s, lambda item: int(float(item))),
+                        default=[10 ** 2, 10 ** 4, 10 ** 6], help='comma separated input sizes, such as 1e2,1e4')
+    parser.add_argument('--dtypes', type=_parse_list, default=['float32'], help='comma separated float dtypes')
+    parser.add_argument('--batch_shapes', type=lambda s: _parse_list(s, _parse_batch_shape), default=[()],
+                        help='comma separated batch shapes, such as none,8,4x8')
+    parser.add_argument('--iterations', type=int, default=100, help='timed steady state calls')
+    parser.add_argument('--dev_str', default=None, help='device to run on')
+    parser.add_argument('-o', '--output', default=None,
+                        help='file to also write the results to, as csv for a .csv extension and json otherwise')
+    parsed = parser.parse_args(args)
+
+    results = compile_matrix(parsed.ops, parsed.backends, parsed.sizes, parsed.dtypes, parsed.batch_shapes,
+                             parsed.iterations, parsed.dev_str)
+    if parsed.output is not None:
+        _write_output(results, parsed.output)
+    print(format_compile_report(results))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
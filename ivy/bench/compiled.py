@@ -0,0 +1,170 @@
+"""
+Collection of functions for comparing compiled and eager execution of benchmark ops, measuring the compile latency, the
+steady state call times, and the number of calls after which compiling pays off.
+"""
+
+# global
+import math
+import time
+import numpy as _np
+
+# local
+from ivy.bench.ops import OPS
+from ivy.bench.runner import load_backend, backend_version, make_inputs, _block, _time_calls
+
+# backends whose compile_fn compiles, rather than returning the function unmodified
+COMPILE_BACKENDS = ['jax', 'tensorflow', 'torch']
+# representative functions, and small models composed of them
+COMPILE_OPS = ['sin', 'softmax', 'reduce_sum', 'matmul', 'linear', 'conv2d', 'mlp', 'conv_block']
+
+
+def _time_first_call(fn, inputs):
+    start = time.perf_counter()
+    _block(fn(*inputs))
+    return time.perf_counter() - start
+
+
+def break_even_calls(eager_first, eager_median, compile_latency, compiled_median):
+    """
+    Find the number of calls after which compiling takes less total time than running eagerly, with the first call
+    of each including its one-off cost.
+
+    :param eager_first: Time of the first eager call, in seconds.
+    :type eager_first: float
+    :param eager_median: Steady state time of each eager call, in seconds.
+    :type eager_median: float
+    :param compile_latency: Time to compile and make the first compiled call, in seconds.
+    :type compile_latency: float
+    :param compiled_median: Steady state time of each compiled call, in seconds.
+    :type compiled_median: float
+    :return: Smallest number of calls for which compiling is no slower in total, or None if compiled calls are never
+             faster.
+    """
+    if compile_latency <= eager_first:
+        return 1
+    if compiled_median >= eager_median:
+        return None
+    return 1 + int(math.ceil((compile_latency - eager_first) / (eager_median - compiled_median)))
+
+
+def compile_benchmark(op, f, size, dtype_str='float32', batch_shape=(), num_iterations=100, dev_str=None):
+    """
+    Time a benchmark op for one backend and configuration both eagerly and compiled with the backend compile_fn. The
+    first eager call is made before compiling, so that one-off costs shared by both, such as loading kernels, are
+    counted against eager execution.
+
+    :param op: Op to benchmark, or its name.
+    :type op: BenchOp or str
+    :param f: Backend to benchmark.
+    :type f: ml_framework
+    :param size: Number of elements in each batch entry of the main input.
+    :type size: int
+    :param dtype_str: Floating point dtype of the inputs. Default is float32.
+    :type dtype_str: str, optional
+    :param batch_shape: Leading batch dimensions of the inputs. Default is no batch dimensions.
+    :type batch_shape: sequence of ints, optional
+    :param num_iterations: Number of timed steady state calls of each. Default is 100.
+    :type num_iterations: int, optional
+    :param dev_str: Device on which to run. Default is the backend default.
+    :type dev_str: str, optional
+    :return: Dict describing the configuration, with the first eager call time, the compile time, the first compiled
+             call time, the compile latency being their sum, the median steady state call times, the speedup of
+             compiled over eager steady state calls, and the break even number of calls. Times are in seconds.
+    """
+    op = OPS[op] if isinstance(op, str) else op
+    inputs = make_inputs(op, f, size, dtype_str, batch_shape, dev_str)
+    eager_fn = lambda *args: op.fn(*args, f=f)
+    eager_first = _time_first_call(eager_fn, inputs)
+    eager_median = float(_np.median(_time_calls(eager_fn, inputs, num_iterations)))
+    start = time.perf_counter()
+    compiled_fn = f.compile_fn(lambda *args: op.fn(*args, f=f), False, tuple(inputs))
+    compile_time = time.perf_counter() - start
+    # tracing compilers compile on the first call
+    compiled_first = _time_first_call(compiled_fn, inputs)
+    compiled_median = float(_np.median(_time_calls(compiled_fn, inputs, num_iterations)))
+    compile_latency = compile_time + compiled_first
+    return {'op': op.name,
+            'backend': f.__name__.split('.')[-1],
+            'backend_version': backend_version(f),
+            'size': size,
+            'dtype': dtype_str,
+            'batch_shape': list(batch_shape),
+            'num_iterations': num_iterations,
+            'eager_first': eager_first,
+            'eager_median': eager_median,
+            'compile_time': compile_time,
+            'compiled_first': compiled_first,
+            'compile_latency': compile_latency,
+            'compiled_median': compiled_median,
+            'speedup': eager_median / compiled_median if compiled_median > 0 else float('inf'),
+            'break_even_calls': break_even_calls(eager_first, eager_median, compile_latency, compiled_median)}
+
+
+def compile_matrix(ops=None, backends=None, sizes=None, dtype_strs=None, batch_shapes=None, num_iterations=100,
+                   dev_str=None):
+    """
+    Benchmark every combination of ops, backends, sizes, dtypes and batch shapes both eagerly and compiled.
+    Combinations which raise an exception, such as ops the compiler cannot trace, are returned with an error entry.
+
+    :param ops: Names of the ops to benchmark. Default is COMPILE_OPS.
+    :type ops: sequence of strs, optional
+    :param backends: Names of the backends to benchmark. Default is COMPILE_BACKENDS.
+    :type backends: sequence of strs, optional
+    :param sizes: Input sizes. Default is 1e2, 1e4 and 1e6.
+    :type sizes: sequence of ints, optional
+    :param dtype_strs: Floating point dtypes. Default is float32.
+    :type dtype_strs: sequence of strs, optional
+    :param batch_shapes: Leading batch dimensions. Default is no batch dimensions.
+    :type batch_shapes: sequence of sequences of ints, optional
+    :param num_iterations: Number of timed steady state calls of each. Default is 100.
+    :type num_iterations: int, optional
+    :param dev_str: Device on which to run. Default is the backend default.
+    :type dev_str: str, optional
+    :return: List of result dicts, as returned by compile_benchmark.
+    """
+    ops = COMPILE_OPS if ops is None else ops
+    backends = COMPILE_BACKENDS if backends is None else backends
+    sizes = [10 ** 2, 10 ** 4, 10 ** 6] if sizes is None else sizes
+    dtype_strs = ['float32'] if dtype_strs is None else dtype_strs
+    batch_shapes = [()] if batch_shapes is None else batch_shapes
+    results = list()
+    for backend in backends:
+        f = load_backend(backend)
+        if f is None:
+            continue
+        for op in ops:
+            for dtype_str in dtype_strs:
+                for batch_shape in batch_shapes:
+                    for size in sizes:
+                        try:
+                            results.append(compile_benchmark(op, f, size, dtype_str, batch_shape, num_iterations,
+                                                             dev_str))
+                        except Exception as e:
+                            results.append({'op': op, 'backend': backend, 'size': size, 'dtype': dtype_str,
+                                            'batch_shape': list(batch_shape),
+                                            'error': '{}: {}'.format(type(e).__name__, e)})
+    return results
+
+
+def format_compile_report(results):
+    """
+    Format compile matrix results as a table, with times in microseconds.
+
+    :param results: Result dicts, as returned by compile_matrix.
+    :type results: sequence of dicts
+    :return: The report, as a string.
+    """
+    lines = ['{:<12} {:<12} {:>9} {:>12} {:>12} {:>12} {:>12} {:>8} {:>10}'.format(
+        'op', 'backend', 'size', 'eager_us', 'compiled_us', 'latency_us', 'eager_1st_us', 'speedup', 'break_even')]
+    for result in results:
+        if 'error' in result:
+            # tracing errors can span many lines
+            lines.append('{:<12} {:<12} {:>9} {}'.format(result['op'], result['backend'], result['size'],
+                                                         result['error'].split('\n')[0]))
+            continue
+        break_even = result['break_even_calls']
+        lines.append('{:<12} {:<12} {:>9} {:>12.1f} {:>12.1f} {:>12.1f} {:>12.1f} {:>7.2f}x {:>10}'.format(
+            result['op'], result['backend'], result['size'], result['eager_median'] * 1e6,
+            result['compiled_median'] * 1e6, result['compile_latency'] * 1e6, result['eager_first'] * 1e6,
+            result['speedup'], 'never' if break_even is None else break_even))
+    return '\n'.join(lines)
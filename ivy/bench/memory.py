@@ -0,0 +1,221 @@
+"""
+Collection of functions for profiling the peak memory and allocations of benchmark ops.
+"""
+
+# global
+import re
+import sys
+import resource
+import tracemalloc
+import numpy as _np
+
+# local
+from ivy.bench.ops import OPS
+from ivy.bench.runner import BACKENDS, load_backend, backend_version, make_inputs
+
+_PROC_STATUS = '/proc/self/status'
+_PROC_CLEAR_REFS = '/proc/self/clear_refs'
+
+
+# Resident Set Size #
+# ------------------#
+
+def _proc_status_bytes(field):
+    with open(_PROC_STATUS, 'r') as file:
+        return int(re.search(field + r':\s+(\d+) kB', file.read()).group(1)) * 1024
+
+
+def _reset_peak_rss():
+    # on linux, writing 5 to clear_refs resets the peak resident set size of the process to the current one
+    try:
+        with open(_PROC_CLEAR_REFS, 'w') as file:
+            file.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _max_rss():
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macos and in kilobytes elsewhere
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def _rss_peak_delta(fn, inputs):
+    if _reset_peak_rss():
+        start = _proc_status_bytes('VmRSS')
+        ret = fn(*inputs)
+        return _proc_status_bytes('VmHWM') - start, ret
+    # without a resettable peak, only growth beyond the lifetime peak of the process is seen
+    start = _max_rss()
+    ret = fn(*inputs)
+    return _max_rss() - start, ret
+
+
+# Allocators #
+# -----------#
+
+def _tracemalloc_peak(fn, inputs):
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    ret = fn(*inputs)
+    peak = tracemalloc.get_traced_memory()[1] - start
+    if not was_tracing:
+        tracemalloc.stop()
+    del ret
+    return peak
+
+
+def _torch_allocations(fn, inputs):
+    # the autograd profiler records the cpu allocator, without torch.profiler importing the compiler stack
+    from torch.autograd.profiler import profile
+    with profile(profile_memory=True) as prof:
+        ret = fn(*inputs)
+    del ret
+    # self memory usage is positive for allocations made by an op itself, and negative for frees
+    changes = [event.self_cpu_memory_usage for event in sorted(prof.function_events, key=lambda e: e.time_range.start)
+               if event.self_cpu_memory_usage]
+    allocated = sum([change for change in changes if change > 0])
+    peak = max([0] + list(_np.cumsum(changes)))
+    return int(allocated), int(peak)
+
+
+def _output_bytes(ret, f):
+    if isinstance(ret, (list, tuple)):
+        return sum([_output_bytes(item, f) for item in ret])
+    return int(_np.prod(f.shape(ret))) * _np.dtype(f.dtype_str(ret)).itemsize
+
+
+# Profiling #
+# ----------#
+
+def profile_memory(op, f, size, dtype_str='float32', batch_shape=(), num_warmup=1, dev_str=None):
+    """
+    Profile the memory used by a single call of a benchmark op. The inputs are created beforehand, and so are not
+    counted, whereas the output is. The measures are the peak resident set size delta, which on linux is exact and
+    elsewhere only sees growth beyond the lifetime peak of the process, the tracemalloc peak, which includes numpy
+    allocations, and for torch the allocations recorded by the torch profiler.
+
+    :param op: Op to profile, or its name.
+    :type op: BenchOp or str
+    :param f: Backend to profile.
+    :type f: ml_framework
+    :param size: Number of elements in each batch entry of the main input.
+    :type size: int
+    :param dtype_str: Floating point dtype of the inputs. Default is float32.
+    :type dtype_str: str, optional
+    :param batch_shape: Leading batch dimensions of the inputs. Default is no batch dimensions.
+    :type batch_shape: sequence of ints, optional
+    :param num_warmup: Number of calls before profiling, so that one-off allocations are not counted. Default is 1.
+    :type num_warmup: int, optional
+    :param dev_str: Device on which to run. Default is the backend default.
+    :type dev_str: str, optional
+    :return: Dict describing the configuration, with output_bytes, rss_peak_delta and tracemalloc_peak, plus
+             torch_allocated and torch_peak for torch. Peak_bytes is the allocator peak of the backend where measured,
+             being tracemalloc for numpy and the profiler for torch, and the peak rss delta otherwise, and
+             bytes_per_output_byte is its ratio to the output size.
+    """
+    op = OPS[op] if isinstance(op, str) else op
+    backend = f.__name__.split('.')[-1]
+    inputs = make_inputs(op, f, size, dtype_str, batch_shape, dev_str)
+    fn = lambda *args: op.fn(*args, f=f)
+    for _ in range(num_warmup):
+        fn(*inputs)
+    rss_peak_delta, ret = _rss_peak_delta(fn, inputs)
+    output_bytes = _output_bytes(ret, f)
+    del ret
+    result = {'op': op.name,
+              'backend': backend,
+              'backend_version': backend_version(f),
+              'size': size,
+              'dtype': dtype_str,
+              'batch_shape': list(batch_shape),
+              'output_bytes': output_bytes,
+              'rss_peak_delta': rss_peak_delta,
+              'tracemalloc_peak': _tracemalloc_peak(fn, inputs)}
+    if backend == 'torch':
+        result['torch_allocated'], result['torch_peak'] = _torch_allocations(fn, inputs)
+    result['peak_bytes'] = {'numpy': result['tracemalloc_peak'],
+                            'torch': result.get('torch_peak')}.get(backend, rss_peak_delta)
+    result['bytes_per_output_byte'] = result['peak_bytes'] / output_bytes if output_bytes > 0 else float('inf')
+    return result
+
+
+def memory_sweep(ops=None, backends=None, sizes=None, dtype_strs=None, batch_shapes=None, num_warmup=1, dev_str=None):
+    """
+    Profile the memory of every combination of ops, backends, sizes, dtypes and batch shapes. Combinations which raise
+    an exception are returned with an error entry rather than measurements.
+
+    :param ops: Names of the ops to profile. Default is all registered ops.
+    :type ops: sequence of strs, optional
+    :param backends: Names of the backends to profile. Default is all backends which can be imported.
+    :type backends: sequence of strs, optional
+    :param sizes: Input sizes. Default is powers of 10 from 1 to 1e6.
+    :type sizes: sequence of ints, optional
+    :param dtype_strs: Floating point dtypes. Default is float32.
+    :type dtype_strs: sequence of strs, optional
+    :param batch_shapes: Batch shapes. Default is no batch dimensions.
+    :type batch_shapes: sequence of sequences of ints, optional
+    :param num_warmup: Number of calls before profiling each combination. Default is 1.
+    :type num_warmup: int, optional
+    :param dev_str: Device on which to run. Default is the backend default.
+    :type dev_str: str, optional
+    :return: List of result dicts, as returned by profile_memory.
+    """
+    ops = list(OPS.keys()) if ops is None else ops
+    backends = BACKENDS if backends is None else backends
+    sizes = [10 ** i for i in range(7)] if sizes is None else sizes
+    dtype_strs = ['float32'] if dtype_strs is None else dtype_strs
+    batch_shapes = [()] if batch_shapes is None else batch_shapes
+    results = list()
+    for backend in backends:
+        f = load_backend(backend)
+        if f is None:
+            continue
+        for op in ops:
+            for dtype_str in dtype_strs:
+                for batch_shape in batch_shapes:
+                    for size in sizes:
+                        try:
+                            results.append(profile_memory(op, f, size, dtype_str, batch_shape, num_warmup, dev_str))
+                        except Exception as e:
+                            results.append({'op': op, 'backend': backend, 'size': size, 'dtype': dtype_str,
+                                            'batch_shape': list(batch_shape),
+                                            'error': '{}: {}'.format(type(e).__name__, e)})
+    return results
+
+
+def rank_by_allocation(results):
+    """
+    Rank memory profiling results by bytes allocated at peak per output byte, from the most wasteful.
+
+    :param results: Result dicts, as returned by profile_memory.
+    :type results: sequence of dicts
+    :return: List of the results with a bytes_per_output_byte entry, sorted by decreasing bytes_per_output_byte.
+    """
+    return sorted([result for result in results if 'bytes_per_output_byte' in result],
+                  key=lambda result: -result['bytes_per_output_byte'])
+
+
+def format_memory_report(results, num_rows=None):
+    """
+    Format memory profiling results as a plain text table, ranked by bytes allocated per output byte.
+
+    :param results: Result dicts, as returned by profile_memory.
+    :type results: sequence of dicts
+    :param num_rows: Number of rows to include. Default is all rows.
+    :type num_rows: int, optional
+    :return: Report string.
+    """
+    header = '{:<12} {:<11} {:>9} {:<8} {:<6} {:>14} {:>14} {:>14} {:>10}'.format(
+        'op', 'backend', 'size', 'dtype', 'batch', 'output bytes', 'peak bytes', 'rss delta', 'ratio')
+    lines = [header, '-' * len(header)]
+    for result in rank_by_allocation(results)[0:num_rows]:
+        lines.append('{:<12} {:<11} {:>9} {:<8} {:<6} {:>14} {:>14} {:>14} {:>10.2f}'.format(
+            result['op'], result['backend'], result['size'], result['dtype'],
+            'x'.join([str(dim) for dim in result['batch_shape']]) or 'none', result['output_bytes'],
+            result['peak_bytes'], result['rss_peak_delta'], result['bytes_per_output_byte']))
+    return '\n'.join(lines)
@@ -0,0 +1,149 @@
+"""
+Collection of benchmark ops, each pairing an ivy function with a builder for its inputs at a given size.
+"""
+
+# global
+import collections
+import numpy as _np
+
+# local
+import ivy.core.general as _ivy_gen
+import ivy.core.linalg as _ivy_linalg
+import ivy.core.math as _ivy_math
+import ivy.core.reductions as _ivy_red
+import ivy.neural_net.activations as _ivy_act
+import ivy.neural_net.layers as _ivy_layers
+
+BenchOp = collections.namedtuple('BenchOp', ['name', 'fn', 'make_inputs'])
+
+OPS = collections.OrderedDict()
+
+
+def register_op(name, fn, make_inputs):
+    """
+    Register an op for benchmarking.
+
+    :param name: Name of the op.
+    :type name: str
+    :param fn: Function called as fn(*inputs, f=f), which should call ivy functions through their modules, so that they
+               are picked up by the instrumentation hooks.
+    :type fn: callable
+    :param make_inputs: Function called as make_inputs(size, dtype_str, batch_shape, rng), returning a list of numpy
+                        input arrays. Size is the number of elements in each batch entry of the main input.
+    :type make_inputs: callable
+    :return: The registered op.
+    """
+    OPS[name] = BenchOp(name, fn, make_inputs)
+    return OPS[name]
+
+
+# Inputs #
+# -------#
+
+def _uniform(rng, shape, dtype_str):
+    return rng.uniform(0., 1., shape).astype(dtype_str)
+
+
+def _side(size, num_channels=1):
+    return max(int(round((size / num_channels) ** 0.5)), 1)
+
+
+def _vectors(num_inputs):
+    def _make_inputs(size, dtype_str, batch_shape, rng):
+        return [_uniform(rng, tuple(batch_shape) + (size,), dtype_str) for _ in range(num_inputs)]
+    return _make_inputs
+
+
+def _matrices(num_inputs):
+    def _make_inputs(size, dtype_str, batch_shape, rng):
+        side = _side(size)
+        return [_uniform(rng, tuple(batch_shape) + (side, side), dtype_str) for _ in range(num_inputs)]
+    return _make_inputs
+
+
+def _invertible_matrix(size, dtype_str, batch_shape, rng):
+    side = _side(size)
+    return [(_uniform(rng, tuple(batch_shape) + (side, side), dtype_str) +
+             side * _np.eye(side, dtype=dtype_str)).astype(dtype_str)]
+
+
+def _linear_inputs(size, dtype_str, batch_shape, rng):
+    side = _side(size)
+    # linear layers expect at least one batch dimension
+    return [_uniform(rng, (tuple(batch_shape) or (1,)) + (side,), dtype_str), _uniform(rng, (side, side), dtype_str),
+            _uniform(rng, (side,), dtype_str)]
+
+
+def _conv2d_inputs(size, dtype_str, batch_shape, rng):
+    num_channels = 8
+    side = _side(size, num_channels)
+    batch_size = int(_np.prod(batch_shape)) if batch_shape else 1
+    return [_uniform(rng, (batch_size, side, side, num_channels), dtype_str),
+            _uniform(rng, (3, 3, num_channels, num_channels), dtype_str)]
+
+
+def _mlp_inputs(size, dtype_str, batch_shape, rng):
+    side = _side(size)
+    return [_uniform(rng, (tuple(batch_shape) or (1,)) + (side,), dtype_str)] +\
+        [_uniform(rng, shape, dtype_str) for shape in [(side, side), (side,)] * 2]
+
+
+def _conv_block_inputs(size, dtype_str, batch_shape, rng):
+    num_channels = 8
+    return _conv2d_inputs(size, dtype_str, batch_shape, rng) +\
+        [_uniform(rng, (3, 3, num_channels, num_channels), dtype_str)]
+
+
+def _one_hot_inputs(size, dtype_str, batch_shape, rng):
+    side = _side(size)
+    return [rng.randint(0, side, tuple(batch_shape) + (side,)).astype('int64')]
+
+
+def _gather_nd_inputs(size, dtype_str, batch_shape, rng):
+    params = _uniform(rng, tuple(batch_shape) + (size,), dtype_str)
+    indices = _np.stack([rng.randint(0, dim, (size,)) for dim in params.shape], -1).astype('int64')
+    return [params, indices]
+
+
+def _transpose_axes(x):
+    num_dims = len(x.shape)
+    return list(range(num_dims - 2)) + [num_dims - 1, num_dims - 2]
+
+
+# Models #
+# -------#
+
+def _mlp(x, weight0, bias0, weight1, bias1, f):
+    hidden = _ivy_act.relu(_ivy_layers.linear(x, weight0, bias0, f=f), f=f)
+    return _ivy_act.softmax(_ivy_layers.linear(hidden, weight1, bias1, f=f), f=f)
+
+
+def _conv_block(x, filters0, filters1, f):
+    hidden = _ivy_act.relu(_ivy_layers.conv2d(x, filters0, 1, 'SAME', f=f), f=f)
+    hidden = _ivy_act.relu(_ivy_layers.conv2d(hidden, filters1, 1, 'SAME', f=f), f=f)
+    return _ivy_red.reduce_mean(hidden, [1, 2], f=f)
+
+
+# Ops #
+# ----#
+
+register_op('sin', lambda x, f: _ivy_math.sin(x, f=f), _vectors(1))
+register_op('exp', lambda x, f: _ivy_math.exp(x, f=f), _vectors(1))
+register_op('tanh', lambda x, f: _ivy_math.tanh(x, f=f), _vectors(1))
+register_op('relu', lambda x, f: _ivy_act.relu(x, f=f), _vectors(1))
+register_op('softmax', lambda x, f: _ivy_act.softmax(x, f=f), _vectors(1))
+register_op('minimum', lambda x, y, f: _ivy_gen.minimum(x, y, f=f), _vectors(2))
+register_op('cast', lambda x, f: _ivy_gen.cast(x, 'int32', f=f), _vectors(1))
+register_op('cumsum', lambda x, f: _ivy_gen.cumsum(x, -1, f=f), _vectors(1))
+register_op('reduce_sum', lambda x, f: _ivy_red.reduce_sum(x, -1, f=f), _vectors(1))
+register_op('reduce_mean', lambda x, f: _ivy_red.reduce_mean(x, -1, f=f), _vectors(1))
+register_op('concatenate', lambda x, y, f: _ivy_gen.concatenate([x, y], -1, f=f), _vectors(2))
+register_op('transpose', lambda x, f: _ivy_gen.transpose(x, _transpose_axes(x), f=f), _matrices(1))
+register_op('matmul', lambda x, y, f: _ivy_gen.matmul(x, y, f=f), _matrices(2))
+register_op('inv', lambda x, f: _ivy_linalg.inv(x, f=f), _invertible_matrix)
+register_op('one_hot', lambda x, f: _ivy_gen.one_hot(x, x.shape[-1], f=f), _one_hot_inputs)
+register_op('gather_nd', lambda x, indices, f: _ivy_gen.gather_nd(x, indices, f=f), _gather_nd_inputs)
+register_op('linear', lambda x, weight, bias, f: _ivy_layers.linear(x, weight, bias, f=f), _linear_inputs)
+register_op('conv2d', lambda x, filters, f: _ivy_layers.conv2d(x, filters, 1, 'SAME', f=f), _conv2d_inputs)
+register_op('mlp', _mlp, _mlp_inputs)
+register_op('conv_block', _conv_block, _conv_block_inputs)
@@ -0,0 +1,334 @@
+"""
+Dispatch overhead of every ivy core function on tiny inputs, being the time spent in ivy and backend code rather than in
+the native framework ops, with stored per-case budgets for catching regressions.
+"""
+
+# global
+import json
+import time
+import types
+import collections
+import numpy as _np
+
+# local
+import ivy.core.general as _ivy_gen
+import ivy.core.gradients as _ivy_grad
+import ivy.core.linalg as _ivy_linalg
+import ivy.core.logic as _ivy_logic
+import ivy.core.math as _ivy_math
+import ivy.core.random as _ivy_rand
+import ivy.core.reductions as _ivy_red
+from ivy.core.container import Container
+from ivy.bench.runner import load_backend, _time_calls, _backend_op_calls, _native_times
+
+CORE_MODULES = [_ivy_gen, _ivy_grad, _ivy_linalg, _ivy_logic, _ivy_math, _ivy_rand, _ivy_red]
+
+# compiling is a one-off cost rather than a per call overhead
+EXCLUDED = ['compile_fn']
+
+
+# Inputs #
+# -------#
+
+def _tiny_inputs(f, dev_str):
+    x = f.array(_np.array([[0.1, 0.2], [0.3, 0.4]]), 'float32', dev_str)
+    return {'x': x,
+            'x_row': f.array(_np.array([[0.1, 0.2]]), 'float32', dev_str),
+            'x_ge_1': f.array(_np.array([[1.1, 1.2], [1.3, 1.4]]), 'float32', dev_str),
+            'x_invertible': f.array(_np.array([[2., 1.], [1., 2.]]), 'float32', dev_str),
+            'vector': f.array(_np.array([0.1, 0.2, 0.3]), 'float32', dev_str),
+            # non-float inputs keep the dtype of the numpy array
+            'bools': f.array(_np.array([[True, False], [False, True]]), dev_str=dev_str),
+            'indices': f.array(_np.array([0, 2], 'int32'), dev_str=dev_str),
+            'nd_indices': f.array(_np.array([[0, 1], [1, 0]], 'int32'), dev_str=dev_str),
+            'ws': Container({'w': f.variable(x)}),
+            'grads': Container({'w': x})}
+
+
+def _execute_with_gradients_args(inputs):
+    ws = Container({'w': inputs['ws']['w']})
+    return [lambda xs: _ivy_red.reduce_sum(xs['w']), ws]
+
+
+# Cases #
+# ------#
+
+# function name to a function from the tiny inputs to the positional arguments
+CASES = collections.OrderedDict([
+
+    # general
+    ('array', lambda i: [[[0.1, 0.2]], 'float32']),
+    ('to_numpy', lambda i: [i['x']]),
+    ('to_list', lambda i: [i['x']]),
+    ('shape', lambda i: [i['x']]),
+    ('get_num_dims', lambda i: [i['x']]),
+    ('minimum', lambda i: [i['x'], i['x']]),
+    ('maximum', lambda i: [i['x'], i['x']]),
+    ('clip', lambda i: [i['x'], 0.15, 0.35]),
+    ('round', lambda i: [i['x']]),
+    ('floormod', lambda i: [i['x'], i['x_ge_1']]),
+    ('floor', lambda i: [i['x']]),
+    ('ceil', lambda i: [i['x']]),
+    ('abs', lambda i: [i['x']]),
+    ('argmax', lambda i: [i['x']]),
+    ('argmin', lambda i: [i['x']]),
+    ('cast', lambda i: [i['x'], 'int32']),
+    ('arange', lambda i: [4]),
+    ('linspace', lambda i: [0., 1., 4]),
+    ('concatenate', lambda i: [[i['x'], i['x']], 0]),
+    ('flip', lambda i: [i['x']]),
+    ('stack', lambda i: [[i['x'], i['x']]]),
+    ('unstack', lambda i: [i['x'], 0]),
+    ('split', lambda i: [i['x'], 2]),
+    ('tile', lambda i: [i['x'], [2, 1]]),
+    ('constant_pad', lambda i: [i['x'], [[1, 1], [1, 1]]]),
+    ('zero_pad', lambda i: [i['x'], [[1, 1], [1, 1]]]),
+    ('swapaxes', lambda i: [i['x'], 0, 1]),
+    ('transpose', lambda i: [i['x']]),
+    ('expand_dims', lambda i: [i['x'], 0]),
+    ('where', lambda i: [i['bools'], i['x'], i['x']]),
+    ('indices_where', lambda i: [i['bools']]),
+    ('reshape', lambda i: [i['x'], (4,)]),
+    ('squeeze', lambda i: [i['x_row']]),
+    ('zeros', lambda i: [(2, 2)]),
+    ('zeros_like', lambda i: [i['x']]),
+    ('ones', lambda i: [(2, 2)]),
+    ('ones_like', lambda i: [i['x']]),
+    ('one_hot', lambda i: [i['indices'], 3]),
+    ('cross', lambda i: [i['vector'], i['vector']]),
+    ('matmul', lambda i: [i['x'], i['x']]),
+    ('cumsum', lambda i: [i['x']]),
+    ('identity', lambda i: [2]),
+    ('scatter_flat', lambda i: [i['indices'], i['vector'][0:2], 3]),
+    ('scatter_nd', lambda i: [i['nd_indices'][:, 0:1], i['vector'][0:2], [3]]),
+    ('gather_flat', lambda i: [i['vector'], i['indices']]),
+    ('gather_nd', lambda i: [i['x'], i['nd_indices']]),
+    ('dev', lambda i: [i['x']]),
+    ('dev_to_str', lambda i: [_ivy_gen.dev(i['x'])]),
+    ('dev_str', lambda i: [i['x']]),
+    ('gpu_is_available', lambda i: []),
+    ('tpu_is_available', lambda i: []),
+    ('dtype', lambda i: [i['x']]),
+    ('dtype_to_str', lambda i: [_ivy_gen.dtype(i['x'])]),
+    ('dtype_str', lambda i: [i['x']]),
+
+    # gradients
+    ('variable', lambda i: [i['x']]),
+    ('execute_with_gradients', _execute_with_gradients_args),
+    ('gradient_descent_update', lambda i: [i['ws'], i['grads'], 0.1]),
+    ('adam_update', lambda i: [i['ws'], i['grads'], 0.1, i['grads'], i['grads'],
+                               _ivy_gen.array([1], 'int32', _ivy_gen.dev_str(i['x']))]),
+    ('stop_gradient', lambda i: [i['x']]),
+
+    # linalg
+    ('svd', lambda i: [i['x']]),
+    ('norm', lambda i: [i['x']]),
+    ('inv', lambda i: [i['x_invertible']]),
+    ('pinv', lambda i: [i['x']]),
+    ('vector_to_skew_symmetric_matrix', lambda i: [i['vector']]),
+
+    # logic
+    ('logical_and', lambda i: [i['bools'], i['bools']]),
+    ('logical_or', lambda i: [i['bools'], i['bools']]),
+    ('logical_not', lambda i: [i['bools']]),
+
+    # math
+    ('sin', lambda i: [i['x']]),
+    ('cos', lambda i: [i['x']]),
+    ('tan', lambda i: [i['x']]),
+    ('asin', lambda i: [i['x']]),
+    ('acos', lambda i: [i['x']]),
+    ('atan', lambda i: [i['x']]),
+    ('atan2', lambda i: [i['x'], i['x']]),
+    ('sinh', lambda i: [i['x']]),
+    ('cosh', lambda i: [i['x']]),
+    ('tanh', lambda i: [i['x']]),
+    ('asinh', lambda i: [i['x']]),
+    ('acosh', lambda i: [i['x_ge_1']]),
+    ('atanh', lambda i: [i['x']]),
+    ('log', lambda i: [i['x']]),
+    ('exp', lambda i: [i['x']]),
+
+    # random
+    ('random_uniform', lambda i: [0., 1., (2,)]),
+    ('randint', lambda i: [0, 3, (2,)]),
+    ('seed', lambda i: [0]),
+    ('shuffle', lambda i: [i['x']]),
+    ('prng_key', lambda i: [0]),
+    ('split_key', lambda i: [_ivy_rand.prng_key(0)]),
+    ('fold_in', lambda i: [_ivy_rand.prng_key(0), 1]),
+
+    # reductions
+    ('reduce_sum', lambda i: [i['x']]),
+    ('reduce_prod', lambda i: [i['x']]),
+    ('reduce_mean', lambda i: [i['x']]),
+    ('reduce_min', lambda i: [i['x']]),
+    ('reduce_max', lambda i: [i['x']])])
+
+# further cases with python scalars and lists as inputs, whose conversion by the backend is part of the overhead, as
+# case name to the function name and a function from the tiny inputs to the positional arguments
+INPUT_CASES = collections.OrderedDict([
+    ('array_scalar', ('array', lambda i: [0.1, 'float32'])),
+    ('minimum_scalar', ('minimum', lambda i: [i['x'], 0.2])),
+    ('maximum_scalar', ('maximum', lambda i: [i['x'], 0.2])),
+    ('floormod_scalar', ('floormod', lambda i: [i['x'], 1.5])),
+    ('reshape_list', ('reshape', lambda i: [i['x'], [4]])),
+    ('tile_tuple', ('tile', lambda i: [i['x'], (2, 1)])),
+    ('zeros_list', ('zeros', lambda i: [[2, 2]]))])
+
+
+def cases():
+    """
+    List every case whose dispatch overhead is measured, being one case for each core function, named after it, and
+    the further cases with python scalars and lists as inputs.
+
+    :return: OrderedDict from case name to the function name and a function from the tiny inputs to the arguments.
+    """
+    all_cases = collections.OrderedDict([(name, (name, args_fn)) for name, args_fn in CASES.items()])
+    all_cases.update(INPUT_CASES)
+    return all_cases
+
+
+def core_functions():
+    """
+    List the public functions of the ivy core modules whose dispatch overhead is measured.
+
+    :return: OrderedDict from function name to function.
+    """
+    functions = collections.OrderedDict()
+    for module in CORE_MODULES:
+        for name, value in module.__dict__.items():
+            if name[0] != '_' and name not in EXCLUDED and isinstance(value, types.FunctionType) and\
+                    value.__module__ == module.__name__:
+                functions[name] = value
+    return functions
+
+
+# Measurement #
+# ------------#
+
+def _noop(*args, **kwargs):
+    return args
+
+
+def calibration_time(num_iterations=10000, num_repeats=5):
+    """
+    Measure the time of a pure python function call on this machine, which is the unit budgets are stored in, so that
+    budgets carry over between faster and slower machines.
+
+    :param num_iterations: Number of calls timed together. Default is 10000.
+    :type num_iterations: int, optional
+    :param num_repeats: Number of repeats, of which the fastest is used. Default is 5.
+    :type num_repeats: int, optional
+    :return: Time of one call, in seconds.
+    """
+    times = list()
+    for _ in range(num_repeats):
+        start = time.perf_counter()
+        for _ in range(num_iterations):
+            _noop(1, 2, f=None)
+        times.append((time.perf_counter() - start) / num_iterations)
+    return min(times)
+
+
+def measure_overhead(name, f, dev_str=None, num_warmup=10, num_iterations=100, num_repeats=3):
+    """
+    Measure the dispatch overhead of an ivy core function on tiny inputs, while the backend is set as the global
+    framework. This is the median time of the ivy call less the median time of the native framework op calls it
+    makes, replayed directly, with neither measured under instrumentation hooks. Native calls on python values alone,
+    such as converting a scalar argument to a tensor, are counted as overhead.
+
+    :param name: Name of the case, from cases().
+    :type name: str
+    :param f: Backend to measure.
+    :type f: ml_framework
+    :param dev_str: Device on which to create the inputs. Default is the backend default.
+    :type dev_str: str, optional
+    :param num_warmup: Number of calls before measuring. Default is 10.
+    :type num_warmup: int, optional
+    :param num_iterations: Number of calls in each repeat. Default is 100.
+    :type num_iterations: int, optional
+    :param num_repeats: Number of repeats, of which the smallest medians are used, as timing noise only adds time.
+                        Default is 3.
+    :type num_repeats: int, optional
+    :return: Overhead of one call, in seconds, clamped at zero.
+    """
+    fn_name, args_fn = cases()[name]
+    fn = core_functions()[fn_name]
+    with f.use:
+        args = args_fn(_tiny_inputs(f, dev_str))
+        for _ in range(num_warmup):
+            fn(*args)
+        op_calls = _backend_op_calls(fn, args)
+        ivy_median = min([float(_np.median(_time_calls(fn, args, num_iterations))) for _ in range(num_repeats)])
+        native_median = min([float(_np.median(_native_times(op_calls, num_iterations))) for _ in range(num_repeats)])
+    return max(ivy_median - native_median, 0.)
+
+
+def measure_budgets(backends, headroom=3., min_budget=10., dev_str=None, num_iterations=100, case_names=None):
+    """
+    Measure budgets for the dispatch overhead of every case, as the measured overhead times a headroom factor, in units
+    of the calibration time. Cases which fail for a backend are left without a budget.
+
+    :param backends: Names of the backends to measure.
+    :type backends: sequence of strs
+    :param headroom: Factor between the measured overhead and the budget. Default is 3.
+    :type headroom: float, optional
+    :param min_budget: Smallest budget, so that the thinnest wrappers are not failed by timing noise. Default is 10.
+    :type min_budget: float, optional
+    :param dev_str: Device on which to create the inputs. Default is the backend default.
+    :type dev_str: str, optional
+    :param num_iterations: Number of calls in each measurement. Default is 100.
+    :type num_iterations: int, optional
+    :param case_names: Names of the cases to measure. Default is every case.
+    :type case_names: sequence of strs, optional
+    :return: Dict from backend name to an OrderedDict from case name to budget.
+    """
+    unit = calibration_time()
+    budgets = dict()
+    for backend in backends:
+        f = load_backend(backend)
+        if f is None:
+            continue
+        budgets[backend] = collections.OrderedDict()
+        for name in cases().keys() if case_names is None else case_names:
+            try:
+                overhead = measure_overhead(name, f, dev_str, num_iterations=num_iterations)
+            except Exception:
+                continue
+            budgets[backend][name] = round(max(overhead / unit * headroom, min_budget), 1)
+    return budgets
+
+
+def load_budgets(filepath):
+    """
+    Load stored dispatch overhead budgets.
+
+    :param filepath: Json file of budgets, as written by save_budgets.
+    :type filepath: str
+    :return: Dict from backend name to a dict from case name to budget, in units of the calibration time.
+    """
+    with open(filepath, 'r') as file:
+        return json.loads(file.read())
+
+
+def save_budgets(budgets, filepath):
+    """
+    Save dispatch overhead budgets, merging them case by case into any budgets already stored.
+
+    :param budgets: Dict from backend name to a dict from case name to budget, as returned by measure_budgets.
+    :type budgets: dict
+    :param filepath: Json file to write the budgets to.
+    :type filepath: str
+    """
+    try:
+        stored = load_budgets(filepath)
+    except (IOError, ValueError):
+        stored = dict()
+    for backend, backend_budgets in budgets.items():
+        stored_budgets = stored.get(backend, dict())
+        stored_budgets.update(backend_budgets)
+        stored[backend] = collections.OrderedDict([(name, stored_budgets[name]) for name in cases().keys()
+                                                   if name in stored_budgets])
+    with open(filepath, 'w') as file:
+        file.write(json.dumps(collections.OrderedDict(sorted(stored.items())), indent=4))
@@ -0,0 +1,315 @@
+"""
+Collection of functions for timing benchmark ops across backends, sizes, dtypes and batch shapes.
+"""
+
+# global
+import os
+import sys
+import time
+import logging
+import importlib
+import numpy as _np
+
+# local
+from ivy.bench.ops import OPS
+from ivy.bench.stats import summarise
+from ivy.instrumentation import hooks, native_function, array_args
+from ivy.threads import num_threads as _num_threads
+
+BACKENDS = ['numpy', 'jax', 'tensorflow', 'torch', 'mxnd']
+MODES = ['eager', 'compiled']
+NATIVE_MODULES = {'numpy': 'numpy', 'jax': 'jax', 'tensorflow': 'tensorflow', 'torch': 'torch', 'mxnd': 'mxnet'}
+
+
+def load_backend(backend):
+    """
+    Import an ivy backend by name, returning None if its framework is not installed.
+
+    :param backend: Name of the backend, one of numpy, jax, tensorflow, torch or mxnd.
+    :type backend: str
+    :return: The ivy backend module, or None.
+    """
+    try:
+        return importlib.import_module('ivy.' + backend)
+    except ImportError:
+        logging.warning('Backend {} could not be imported, and will be skipped.'.format(backend))
+        return None
+
+
+def backend_version(f):
+    """
+    Get the version of the native framework behind an ivy backend.
+
+    :param f: Ivy backend.
+    :type f: ml_framework
+    :return: Version string of the native framework.
+    """
+    return importlib.import_module(NATIVE_MODULES[f.__name__.split('.')[-1]]).__version__
+
+
+def _block(ret):
+    # wait for asynchronous backends to finish computing the result
+    for item in ret if isinstance(ret, (list, tuple)) else [ret]:
+        if hasattr(item, 'block_until_ready'):
+            item.block_until_ready()
+        elif hasattr(item, 'wait_to_read'):
+            item.wait_to_read()
+        elif getattr(item, 'is_cuda', False):
+            sys.modules['torch'].cuda.synchronize(item.device)
+
+
+def _time_calls(fn, inputs, num_iterations):
+    times = list()
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        _block(fn(*inputs))
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _backend_op_calls(fn, inputs):
+    # native calls on arrays are the ops of each backend call, and native calls on python values alone, such as
+    # converting scalars to tensors, are counted as ivy overhead, unless creating arrays is all the backend call does
+    op_calls = list()
+    backend_calls = list()
+    native_depth = [0]
+
+    def _pre_call(layer, name, args, kwargs):
+        if layer == 'backend':
+            backend_calls.append(list())
+        elif layer == 'native':
+            native_depth[0] += 1
+
+    def _post_call(layer, name, args, kwargs, ret, start, end):
+        if layer == 'native':
+            native_depth[0] -= 1
+            if native_depth[0] == 0 and backend_calls:
+                backend_calls[-1].append((native_function(name), args, kwargs))
+        elif layer == 'backend':
+            native_calls = backend_calls.pop(-1)
+            op_calls.extend([call for call in native_calls if list(array_args(list(call[1]) + list(call[2].values())))]
+                            or native_calls)
+
+    with hooks(_pre_call, _post_call):
+        _block(fn(*inputs))
+    return op_calls
+
+
+def _native_times(op_calls, num_iterations):
+    times = list()
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        _block([native_fn(*args, **kwargs) for native_fn, args, kwargs in op_calls])
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def make_inputs(op, f, size, dtype_str='float32', batch_shape=(), dev_str=None, seed=0):
+    """
+    Create the inputs of a benchmark op for a backend.
+
+    :param op: Op to create inputs for, or its name.
+    :type op: BenchOp or str
+    :param f: Backend to create the inputs with.
+    :type f: ml_framework
+    :param size: Number of elements in each batch entry of the main input.
+    :type size: int
+    :param dtype_str: Floating point dtype of the inputs. Default is float32.
+    :type dtype_str: str, optional
+    :param batch_shape: Leading batch dimensions of the inputs. Default is no batch dimensions.
+    :type batch_shape: sequence of ints, optional
+    :param dev_str: Device on which to create the inputs. Default is the backend default.
+    :type dev_str: str, optional
+    :param seed: Seed for the random inputs. Default is 0.
+    :type seed: int, optional
+    :return: List of backend arrays.
+    """
+    op = OPS[op] if isinstance(op, str) else op
+    rng = _np.random.RandomState(seed)
+    return [f.array(x, str(x.dtype), dev_str) for x in op.make_inputs(size, dtype_str, batch_shape, rng)]
+
+
+def benchmark(op, f, size, dtype_str='float32', batch_shape=(), mode='eager', num_warmup=10, num_iterations=100,
+              dev_str=None, num_threads=None):
+    """
+    Time a benchmark op for one backend and configuration.
+
+    :param op: Op to benchmark, or its name.
+    :type op: BenchOp or str
+    :param f: Backend to benchmark.
+    :type f: ml_framework
+    :param size: Number of elements in each batch entry of the main input.
+    :type size: int
+    :param dtype_str: Floating point dtype of the inputs. Default is float32.
+    :type dtype_str: str, optional
+    :param batch_shape: Leading batch dimensions of the inputs. Default is no batch dimensions.
+    :type batch_shape: sequence of ints, optional
+    :param mode: Either eager, or compiled to time the op after compiling it with the backend compile_fn.
+    :type mode: str, optional
+    :param num_warmup: Number of untimed calls before timing. Default is 10.
+    :type num_warmup: int, optional
+    :param num_iterations: Number of timed calls. Default is 100.
+    :type num_iterations: int, optional
+    :param dev_str: Device on which to run. Default is the backend default.
+    :type dev_str: str, optional
+    :param num_threads: Number of intra-op threads to run with, set with ivy.num_threads. Default is to leave the
+                        thread pools unchanged.
+    :type num_threads: int, optional
+    :return: Dict describing the configuration, with the call times in seconds and their summary statistics. Eager
+             results also include the median time of the native framework op calls alone, replayed without ivy, and
+             the median ivy overhead, being the difference of the medians clamped at zero, and its fraction of the
+             median call time. Both are measured without instrumentation hooks installed. Backend code computing with
+             array operators, rather than native function calls, counts towards the overhead.
+    """
+    op = OPS[op] if isinstance(op, str) else op
+    if mode not in MODES:
+        raise Exception('Invalid mode {}, must be one of {}.'.format(mode, MODES))
+    inputs = make_inputs(op, f, size, dtype_str, batch_shape, dev_str)
+    fn = lambda *args: op.fn(*args, f=f)
+    with _num_threads(num_threads):
+        if mode == 'compiled':
+            fn = f.compile_fn(fn, False, tuple(inputs))
+        _time_calls(fn, inputs, num_warmup)
+        times = _time_calls(fn, inputs, num_iterations)
+        native_times = _native_times(_backend_op_calls(fn, inputs), num_iterations) if mode == 'eager' else None
+    result = {'op': op.name,
+              'backend': f.__name__.split('.')[-1],
+              'backend_version': backend_version(f),
+              'size': size,
+              'dtype': dtype_str,
+              'batch_shape': list(batch_shape),
+              'mode': mode,
+              'num_threads': num_threads,
+              'num_iterations': num_iterations,
+              'times': times}
+    result.update(summarise(times))
+    if mode == 'eager':
+        result['native_median'] = float(_np.median(native_times))
+        # timing noise can make the native calls alone appear slower than the ivy call
+        overhead = max(result['median'] - result['native_median'], 0.)
+        result['overhead_median'] = overhead
+        result['overhead_fraction'] = overhead / result['median'] if result['median'] > 0 else 0.
+    return result
+
+
+def sweep(ops=None, backends=None, sizes=None, dtype_strs=None, batch_shapes=None, modes=None, num_warmup=10,
+          num_iterations=100, dev_str=None, thread_counts=None):
+    """
+    Benchmark every combination of ops, backends, sizes, dtypes, batch shapes, modes and thread counts. Combinations
+    which raise an exception, such as dtypes unsupported by a backend, are returned with an error entry rather than
+    timings.
+
+    :param ops: Names of the ops to benchmark. Default is all registered ops.
+    :type ops: sequence of strs, optional
+    :param backends: Names of the backends to benchmark. Default is all backends which can be imported.
+    :type backends: sequence of strs, optional
+    :param sizes: Input sizes. Default is powers of 10 from 1 to 1e6.
+    :type sizes: sequence of ints, optional
+    :param dtype_strs: Floating point dtypes. Default is float32.
+    :type dtype_strs: sequence of strs, optional
+    :param batch_shapes: Batch shapes. Default is no batch dimensions.
+    :type batch_shapes: sequence of sequences of ints, optional
+    :param modes: Modes, from eager and compiled. Default is eager.
+    :type modes: sequence of strs, optional
+    :param num_warmup: Number of untimed calls before timing each combination. Default is 10.
+    :type num_warmup: int, optional
+    :param num_iterations: Number of timed calls for each combination. Default is 100.
+    :type num_iterations: int, optional
+    :param dev_str: Device on which to run. Default is the backend default.
+    :type dev_str: str, optional
+    :param thread_counts: Numbers of intra-op threads. Default is to leave the thread pools unchanged.
+    :type thread_counts: sequence of ints, optional
+    :return: List of result dicts, as returned by benchmark.
+    """
+    ops = list(OPS.keys()) if ops is None else ops
+    backends = BACKENDS if backends is None else backends
+    sizes = [10 ** i for i in range(7)] if sizes is None else sizes
+    dtype_strs = ['float32'] if dtype_strs is None else dtype_strs
+    batch_shapes = [()] if batch_shapes is None else batch_shapes
+    modes = ['eager'] if modes is None else modes
+    thread_counts = [None] if thread_counts is None else thread_counts
+    results = list()
+    for backend in backends:
+        f = load_backend(backend)
+        if f is None:
+            continue
+        for op in ops:
+            for mode in modes:
+                for dtype_str in dtype_strs:
+                    for batch_shape in batch_shapes:
+                        for num_threads in thread_counts:
+                            for size in sizes:
+                                try:
+                                    results.append(benchmark(op, f, size, dtype_str, batch_shape, mode, num_warmup,
+                                                             num_iterations, dev_str, num_threads))
+                                except Exception as e:
+                                    results.append({'op': op, 'backend': backend, 'size': size, 'dtype': dtype_str,
+                                                    'batch_shape': list(batch_shape), 'mode': mode,
+                                                    'num_threads': num_threads,
+                                                    'error': '{}: {}'.format(type(e).__name__, e)})
+    return results
+
+
+def overhead_crossovers(results, threshold=0.05):
+    """
+    Find, for each op, backend, dtype, batch shape, thread count and eager mode, the smallest benchmarked size above
+    which the ivy overhead stays below a fraction of the call time, being the size where dispatch overhead stops
+    mattering.
+
+    :param results: Result dicts, as returned by sweep.
+    :type results: sequence of dicts
+    :param threshold: Overhead fraction below which the overhead is considered negligible. Default is 0.05.
+    :type threshold: float, optional
+    :return: List of dicts with op, backend, dtype, batch_shape, num_threads and crossover_size, which is None if the
+             overhead fraction never drops below the threshold.
+    """
+    groups = dict()
+    for result in results:
+        if 'overhead_fraction' not in result:
+            continue
+        key = (result['op'], result['backend'], result['dtype'], tuple(result['batch_shape']),
+               result.get('num_threads'))
+        groups.setdefault(key, list()).append((result['size'], result['overhead_fraction']))
+    crossovers = list()
+    for (op, backend, dtype_str, batch_shape, num_threads), fractions in groups.items():
+        crossover_size = None
+        for size, fraction in sorted(fractions, reverse=True):
+            if fraction >= threshold:
+                break
+            crossover_size = size
+        crossovers.append({'op': op, 'backend': backend, 'dtype': dtype_str, 'batch_shape': list(batch_shape),
+                           'num_threads': num_threads, 'crossover_size': crossover_size})
+    return crossovers
+
+
+def thread_layouts(results, num_cores=None):
+    """
+    Find, for each op, backend, size, dtype, batch shape and mode benchmarked at several thread counts, the number of
+    intra-op threads per process giving the highest throughput when the cores are shared between processes running
+    the op concurrently, being the thread count with the smallest median call time multiplied by the thread count.
+
+    :param results: Result dicts, as returned by sweep with several thread counts.
+    :type results: sequence of dicts
+    :param num_cores: Number of cores to lay out processes on. Default is the number of cores of this machine.
+    :type num_cores: int, optional
+    :return: List of dicts with op, backend, size, dtype, batch_shape, mode, num_threads and num_processes, being the
+             best layout, and throughput, being the expected calls per second across all processes.
+    """
+    num_cores = os.cpu_count() if num_cores is None else num_cores
+    groups = dict()
+    for result in results:
+        if result.get('num_threads') is None or 'median' not in result or result['num_threads'] > num_cores:
+            continue
+        key = (result['op'], result['backend'], result['size'], result['dtype'], tuple(result['batch_shape']),
+               result['mode'])
+        groups.setdefault(key, list()).append((result['num_threads'] * result['median'], result['num_threads'],
+                                               result['median']))
+    layouts = list()
+    for (op, backend, size, dtype_str, batch_shape, mode), candidates in groups.items():
+        _, num_threads, median = min(candidates)
+        num_processes = num_cores // num_threads
+        layouts.append({'op': op, 'backend': backend, 'size': size, 'dtype': dtype_str,
+                        'batch_shape': list(batch_shape), 'mode': mode, 'num_threads': num_threads,
+                        'num_processes': num_processes,
+                        'throughput': num_processes / median if median > 0 else float('inf')})
+    return layouts
@@ -0,0 +1,72 @@
+"""
+Collection of summary statistics for benchmark timings.
+"""
+
+# global
+import math
+import numpy as _np
+
+PERCENTILES = [5, 25, 75, 95, 99]
+
+
+def summarise(times, percentiles=None, confidence=0.95, num_resamples=1000, seed=0):
+    """
+    Summarise a list of timings, with a bootstrapped confidence interval for the median.
+
+    :param times: Timings to summarise, in seconds.
+    :type times: sequence of floats
+    :param percentiles: Percentiles to include, between 0 and 100. Default is [5, 25, 75, 95, 99].
+    :type percentiles: sequence of floats, optional
+    :param confidence: Confidence level of the interval for the median. Default is 0.95.
+    :type confidence: float, optional
+    :param num_resamples: Number of bootstrap resamples used for the confidence interval. Default is 1000.
+    :type num_resamples: int, optional
+    :param seed: Seed for the bootstrap resampling, so that summaries are reproducible. Default is 0.
+    :type seed: int, optional
+    :return: Dict of the median, mean, std, min, max, percentiles as p<n>, and median_ci_low and median_ci_high.
+    """
+    percentiles = PERCENTILES if percentiles is None else percentiles
+    times = _np.asarray(times, dtype='float64')
+    summary = {'median': float(_np.median(times)),
+               'mean': float(_np.mean(times)),
+               'std': float(_np.std(times)),
+               'min': float(_np.min(times)),
+               'max': float(_np.max(times))}
+    for percentile, value in zip(percentiles, _np.percentile(times, percentiles)):
+        summary['p{}'.format(percentile)] = float(value)
+    resampled = _np.random.RandomState(seed).choice(times, (num_resamples, len(times)))
+    tail = (1 - confidence) / 2 * 100
+    ci_low, ci_high = _np.percentile(_np.median(resampled, -1), [tail, 100 - tail])
+    summary['median_ci_low'] = float(ci_low)
+    summary['median_ci_high'] = float(ci_high)
+    return summary
+
+
+def mann_whitney_u(times_a, times_b):
+    """
+    Two-sided Mann-Whitney U test of whether two sets of timings come from the same distribution, using the normal
+    approximation with a tie correction, which is accurate for the sample sizes used in benchmarks.
+
+    :param times_a: First set of timings.
+    :type times_a: sequence of floats
+    :param times_b: Second set of timings.
+    :type times_b: sequence of floats
+    :return: Tuple of the U statistic of the first set, and the two-sided p-value.
+    """
+    times_a = _np.asarray(times_a, dtype='float64')
+    times_b = _np.asarray(times_b, dtype='float64')
+    num_a, num_b = len(times_a), len(times_b)
+    joined = _np.concatenate([times_a, times_b])
+    # average ranks, starting from 1, with tied values sharing their mean rank
+    values, inverse, counts = _np.unique(joined, return_inverse=True, return_counts=True)
+    rank_ends = _np.cumsum(counts)
+    ranks = (rank_ends - (counts - 1) / 2)[inverse]
+    u_a = float(_np.sum(ranks[:num_a]) - num_a * (num_a + 1) / 2)
+    num = num_a + num_b
+    tie_term = float(_np.sum(counts ** 3 - counts)) / (num * (num - 1))
+    sigma = (num_a * num_b / 12 * ((num + 1) - tie_term)) ** 0.5
+    if sigma == 0:
+        return u_a, 1.
+    z = (u_a - num_a * num_b / 2) / sigma
+    p_value = math.erfc(abs(z) / 2 ** 0.5)
+    return u_a, min(p_value, 1.)
@@ -0,0 +1,211 @@
+"""
+SQLite store of benchmark results, keyed by git revision, backend, backend version, op and size, with comparison of
+revisions for statistically significant regressions.
+"""
+
+# global
+import os
+import json
+import time
+import sqlite3
+import subprocess
+
+# local
+from ivy.bench.stats import mann_whitney_u
+
+KEY_FIELDS = ['backend', 'op', 'size', 'dtype', 'batch_shape', 'mode', 'num_threads']
+
+_COLUMNS = [('git_rev', 'TEXT'), ('timestamp', 'REAL'), ('backend', 'TEXT'), ('backend_version', 'TEXT'),
+            ('op', 'TEXT'), ('size', 'INTEGER'), ('dtype', 'TEXT'), ('batch_shape', 'TEXT'), ('mode', 'TEXT'),
+            ('median', 'REAL'), ('median_ci_low', 'REAL'), ('median_ci_high', 'REAL'), ('overhead_median', 'REAL'),
+            ('times', 'TEXT'), ('num_threads', 'INTEGER')]
+
+
+def current_git_rev(directory=None):
+    """
+    Get the git revision of a repository, which defaults to the ivy source tree.
+
+    :param directory: Top level directory of a git repository. Default is the directory containing the ivy package.
+    :type directory: str, optional
+    :return: Full hash of the checked out commit, with a -dirty suffix for uncommitted changes, or unknown.
+    """
+    if directory is None:
+        directory = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+    try:
+        # an installed ivy package may be inside some other repository, such as a project using a local virtualenv
+        toplevel = subprocess.check_output(['git', 'rev-parse', '--show-toplevel'], cwd=directory,
+                                           stderr=subprocess.DEVNULL).decode().strip()
+        if os.path.realpath(toplevel) != os.path.realpath(directory):
+            return 'unknown'
+        return subprocess.check_output(['git', 'describe', '--always', '--dirty', '--abbrev=40'], cwd=directory,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+class ResultStore:
+
+    def __init__(self, path):
+        """
+        SQLite store of benchmark results, which can be used as a context manager to close the connection on exit.
+
+        :param path: Path of the SQLite database, which is created if it does not exist.
+        :type path: str
+        """
+        self._connection = sqlite3.connect(path)
+        columns = ', '.join(['{} {}'.format(name, sql_type) for name, sql_type in _COLUMNS])
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS results (id INTEGER PRIMARY KEY AUTOINCREMENT, {})'.format(columns))
+        self._connection.execute('CREATE INDEX IF NOT EXISTS results_key ON results (git_rev, backend, op, size)')
+        # stores created before a column was added are migrated, with null values for existing results
+        existing = [row[1] for row in self._connection.execute('PRAGMA table_info(results)').fetchall()]
+        for name, sql_type in _COLUMNS:
+            if name not in existing:
+                self._connection.execute('ALTER TABLE results ADD COLUMN {} {}'.format(name, sql_type))
+        self._connection.commit()
+
+    def add(self, results, git_rev=None, timestamp=None):
+        """
+        Add benchmark results to the store, skipping results which failed with an error.
+
+        :param results: Result dicts, as returned by sweep.
+        :type results: sequence of dicts
+        :param git_rev: Git revision the results were measured at. Default is the revision of the ivy source tree.
+        :type git_rev: str, optional
+        :param timestamp: Time the results were measured at, in seconds since the epoch. Default is now.
+        :type timestamp: float, optional
+        :return: Number of results added.
+        """
+        git_rev = current_git_rev() if git_rev is None else git_rev
+        timestamp = time.time() if timestamp is None else timestamp
+        rows = [(git_rev, timestamp, result['backend'], result['backend_version'], result['op'], result['size'],
+                 result['dtype'], json.dumps(result['batch_shape']), result['mode'], result['median'],
+                 result['median_ci_low'], result['median_ci_high'], result.get('overhead_median'),
+                 json.dumps(result['times']), result.get('num_threads')) for result in results if 'error' not in result]
+        self._connection.executemany('INSERT INTO results ({}) VALUES ({})'.format(
+            ', '.join([name for name, _ in _COLUMNS]), ', '.join(['?'] * len(_COLUMNS))), rows)
+        self._connection.commit()
+        return len(rows)
+
+    def query(self, git_rev=None, **kwargs):
+        """
+        Query stored results, keeping only the latest result for each key within a revision.
+
+        :param git_rev: Git revision to query. Default is all revisions.
+        :type git_rev: str, optional
+        :param kwargs: Values to filter on, for any of backend, backend_version, op, size, dtype, batch_shape, mode and
+                       num_threads.
+        :return: List of result dicts, including git_rev and timestamp.
+        """
+        filters = dict(kwargs, git_rev=git_rev) if git_rev is not None else kwargs
+        if 'batch_shape' in filters:
+            filters['batch_shape'] = json.dumps(list(filters['batch_shape']))
+        # null safe comparison, so that results without a thread count can be queried with None
+        where = ' AND '.join(['{} IS ?'.format(name) for name in filters.keys()])
+        cursor = self._connection.execute(
+            'SELECT {} FROM results {} ORDER BY id'.format(', '.join([name for name, _ in _COLUMNS]),
+                                                           'WHERE ' + where if where else ''),
+            list(filters.values()))
+        latest = dict()
+        for row in cursor.fetchall():
+            result = dict(zip([name for name, _ in _COLUMNS], row))
+            result['batch_shape'] = json.loads(result['batch_shape'])
+            result['times'] = json.loads(result['times'])
+            latest[(result['git_rev'],) + _key(result)] = result
+        return list(latest.values())
+
+    def revisions(self):
+        """
+        List the stored git revisions, from the oldest to the most recently measured.
+
+        :return: List of git revision strings.
+        """
+        cursor = self._connection.execute('SELECT git_rev FROM results GROUP BY git_rev ORDER BY MAX(id)')
+        return [row[0] for row in cursor.fetchall()]
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _key(result):
+    return tuple([tuple(result[name]) if name == 'batch_shape' else result.get(name) for name in KEY_FIELDS])
+
+
+def compare(baseline, current, threshold=0.05, alpha=0.01):
+    """
+    Compare benchmark results against a baseline. A result is a regression if its median is slower than the baseline
+    median by more than the threshold, and a Mann-Whitney U test on the call times is significant at level alpha.
+    Improvements are detected in the same way. Results are matched on backend, op, size, dtype, batch shape, mode and
+    thread count, so that backend upgrades can be compared.
+
+    :param baseline: Baseline result dicts, including the call times.
+    :type baseline: sequence of dicts
+    :param current: Current result dicts, including the call times.
+    :type current: sequence of dicts
+    :param threshold: Relative change in the median which is considered meaningful. Default is 0.05.
+    :type threshold: float, optional
+    :param alpha: Significance level of the test. Default is 0.01.
+    :type alpha: float, optional
+    :return: List of comparison dicts for matched results, with the key fields, both backend versions and medians, the
+             ratio of current to baseline median, the p-value, and a status of regression, improvement or unchanged.
+             Sorted by decreasing ratio.
+    """
+    baseline_dict = dict([(_key(result), result) for result in baseline])
+    comparisons = list()
+    for result in current:
+        key = _key(result)
+        if key not in baseline_dict:
+            continue
+        base = baseline_dict[key]
+        ratio = result['median'] / base['median'] if base['median'] > 0 else float('inf')
+        _, p_value = mann_whitney_u(base['times'], result['times'])
+        if p_value < alpha and ratio > 1 + threshold:
+            status = 'regression'
+        elif p_value < alpha and ratio < 1 - threshold:
+            status = 'improvement'
+        else:
+            status = 'unchanged'
+        comparison = dict(zip(KEY_FIELDS, key))
+        comparison['batch_shape'] = list(comparison['batch_shape'])
+        comparison.update({'baseline_version': base['backend_version'], 'current_version': result['backend_version'],
+                           'baseline_median': base['median'], 'current_median': result['median'], 'ratio': ratio,
+                           'p_value': p_value, 'status': status})
+        comparisons.append(comparison)
+    return sorted(comparisons, key=lambda comparison: -comparison['ratio'])
+
+
+def format_report(comparisons, baseline_rev='baseline', current_rev='current'):
+    """
+    Format comparisons as a plain text report, listing regressions, then improvements, then a count of unchanged
+    results.
+
+    :param comparisons: Comparison dicts, as returned by compare.
+    :type comparisons: sequence of dicts
+    :param baseline_rev: Name of the baseline revision.
+    :type baseline_rev: str, optional
+    :param current_rev: Name of the current revision.
+    :type current_rev: str, optional
+    :return: Report string.
+    """
+    lines = ['Comparing {} against baseline {}'.format(current_rev, baseline_rev)]
+    for status in ['regression', 'improvement']:
+        matching = [comparison for comparison in comparisons if comparison['status'] == status]
+        lines.append('')
+        lines.append('{}s: {}'.format(status.capitalize(), len(matching)))
+        for c in matching:
+            versions = c['baseline_version'] if c['baseline_version'] == c['current_version'] else '{} -> {}'.format(
+                c['baseline_version'], c['current_version'])
+            lines.append('  {} {} ({}) size {} {} batch {} {}{}: {:.3g}s -> {:.3g}s, x{:.2f}, p={:.2g}'.format(
+                c['op'], c['backend'], versions, c['size'], c['dtype'],
+                'x'.join([str(dim) for dim in c['batch_shape']]) or 'none', c['mode'],
+                '' if c['num_threads'] is None else ' {} threads'.format(c['num_threads']),
+                c['baseline_median'], c['current_median'], c['ratio'], c['p_value']))
+    lines.append('')
+    lines.append('Unchanged: {}'.format(len([c for c in comparisons if c['status'] == 'unchanged'])))
+    return '\n'.join(lines)
@@ -3,8 +3,17 @@ Base Container Object
 """
 
 # global
+import os as _os
+import sys as _sys
+import json as _json
+import hashlib as _hashlib
 import random as _random
+import threading as _threading
+import weakref as _weakref
 import h5py as _h5py
+import numpy as _np
+from concurrent.futures import Future as _Future
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 from functools import reduce as _reduce
 from operator import mul as _mul
 try:
@@ -16,6 +25,146 @@ except ImportError:
 import ivy as _ivy
 from ivy.framework_handler import get_framework as _get_framework
 
+_MAP_EXECUTOR = None
+# marks the threads running mapped entries, on which nested parallel maps are run serially
+_MAP_LOCAL = _threading.local()
+# frameworks whose arrays support item assignment, so that outputs can be preallocated and written into place
+_ITEM_ASSIGNMENT_FRAMEWORKS = ['ivy.numpy', 'ivy.torch', 'ivy.mxnd']
+# frameworks without explicit PRNG keys, whose random entries are drawn serially from the global random state
+_KEYLESS_FRAMEWORKS = ['ivy.mxnd']
+
+
+def _map_executor():
+    global _MAP_EXECUTOR
+    if _MAP_EXECUTOR is None:
+        _MAP_EXECUTOR = _ThreadPoolExecutor(thread_name_prefix='ivy_container_map')
+    return _MAP_EXECUTOR
+
+
+def _shared_memory_modules():
+    # shared memory is only available from python 3.8, so it is imported when first used
+    try:
+        from multiprocessing import resource_tracker, shared_memory
+    except ImportError:
+        raise Exception('Container shared memory transport requires python 3.8 or later.')
+    return shared_memory, resource_tracker
+
+
+def _nest_key_chains(key_chains_and_values):
+    return_dict = dict()
+    for key_chain, value in key_chains_and_values:
+        keys = key_chain.split('/')
+        dict_in = return_dict
+        for key in keys[:-1]:
+            dict_in = dict_in.setdefault(key, dict())
+        dict_in[keys[-1]] = value
+    return return_dict
+
+
+def _aligned(offset, alignment=64):
+    return -(-offset // alignment) * alignment
+
+
+def _hash_array(value_as_np):
+    hash_obj = _hashlib.blake2b(digest_size=16)
+    hash_obj.update('{}{}'.format(value_as_np.dtype.str, value_as_np.shape).encode())
+    hash_obj.update(_np.ascontiguousarray(value_as_np).reshape(-1).view(_np.uint8).data)
+    return hash_obj.hexdigest()
+
+
+def _load_checkpoint_index(directory):
+    index_path = _os.path.join(directory, 'index.json')
+    if not _os.path.exists(index_path):
+        return {'layers': list(), 'leaves': dict()}
+    with open(index_path, 'r') as index_file:
+        return _json.load(index_file)
+
+
+def _save_checkpoint_index(directory, index):
+    # the index is replaced atomically, so a crash while checkpointing leaves the previous checkpoint intact
+    index_path = _os.path.join(directory, 'index.json')
+    with open(index_path + '.tmp', 'w') as index_file:
+        _json.dump(index, index_file)
+    _os.replace(index_path + '.tmp', index_path)
+
+
+def _num_elements(value):
+    try:
+        return _reduce(_mul, value.shape, 1)
+    except (AttributeError, TypeError):
+        return 0
+
+
+def _map_entry(func, value, key_chain):
+    _MAP_LOCAL.in_map = True
+    try:
+        return func(value, key_chain)
+    finally:
+        _MAP_LOCAL.in_map = False
+
+
+class _LazyH5Dataset:
+
+    def __init__(self, dataset, slice_obj=slice(None)):
+        """
+        Proxy for an h5py dataset, which is only read when materialised or sliced.
+        """
+        self._dataset = dataset
+        self._slice_obj = slice_obj
+        if slice_obj == slice(None):
+            self._shape = dataset.shape
+        else:
+            self._shape = _np.empty(dataset.shape, dtype=[]).__getitem__(slice_obj).shape
+
+    def materialise(self):
+        return _ivy.array(list(self._dataset[self._slice_obj]))
+
+    def __getitem__(self, slice_obj):
+        if self._slice_obj == slice(None):
+            return _ivy.array(list(self._dataset[slice_obj]))
+        return self.materialise()[slice_obj]
+
+    def __repr__(self):
+        return '<lazy h5 dataset "{}": shape {}, type "{}">'.format(self._dataset.name, self._shape, self.dtype.str)
+
+    @property
+    def shape(self):
+        return self._shape
+
+    @property
+    def dtype(self):
+        return self._dataset.dtype
+
+
+class _LazyFlatArray:
+
+    def __init__(self, value_as_np):
+        """
+        Proxy for a numpy view into a memory-mapped flat file, which is converted to the active framework on access.
+        """
+        self._value = value_as_np
+
+    def materialise(self):
+        f = _get_framework(self._value)
+        if f.__name__ == 'ivy.numpy':
+            # numpy arrays keep the view, so nothing is read from the file until the values are used
+            return self._value
+        return f.array(self._value)
+
+    def __getitem__(self, slice_obj):
+        return self.materialise()[slice_obj]
+
+    def __repr__(self):
+        return '<lazy flat file array: shape {}, type "{}">'.format(self.shape, self.dtype.str)
+
+    @property
+    def shape(self):
+        return self._value.shape
+
+    @property
+    def dtype(self):
+        return self._value.dtype
+
 
 # noinspection PyMissingConstructor
 class Container(dict):
@@ -39,10 +188,67 @@ class Container(dict):
     # Class Methods #
     # --------------#
 
+    @staticmethod
+    def _concat_in_place_compatible(arrays, dim, f):
+        if f.__name__ == 'ivy.torch' and any([array.requires_grad for array in arrays]):
+            # the concatenation must be recorded as a single differentiable op, rather than as writes into a buffer
+            return False
+        if f.__name__ == 'ivy.mxnd' and _sys.modules['mxnet'].autograd.is_recording():
+            # in-place writes to arrays are illegal while mxnet autograd is recording
+            return False
+        shape = [int(d) for d in arrays[0].shape]
+        axis = dim % len(shape)
+        for array in arrays[1:]:
+            other_shape = [int(d) for d in array.shape]
+            if len(other_shape) != len(shape) or \
+                    other_shape[0:axis] + other_shape[axis + 1:] != shape[0:axis] + shape[axis + 1:]:
+                # mismatched shapes would be broadcast into place, rather than raising as in concatenate
+                return False
+        return len(set([f.dtype_str(item) for item in arrays])) == 1
+
+    @staticmethod
+    def _concat_into_place(arrays, dim, f):
+        shape = [int(d) for d in arrays[0].shape]
+        axis = dim % len(shape)
+        sizes = [int(array.shape[axis]) for array in arrays]
+        shape[axis] = sum(sizes)
+        ret = f.zeros(shape, f.dtype_str(arrays[0]), f.dev_str(arrays[0]))
+        start = 0
+        for array, size in zip(arrays, sizes):
+            ret[(slice(None),) * axis + (slice(start, start + size),)] = array
+            start += size
+        return ret
+
+    @staticmethod
+    def _concat_arrays(arrays, dim, f):
+        # noinspection PyBroadException
+        try:
+            if len(arrays[0].shape) == 0:
+                arrays = [f.reshape(item, [1] * (max(dim, 0) + 1)) for item in arrays]
+            if f.__name__ in _ITEM_ASSIGNMENT_FRAMEWORKS and Container._concat_in_place_compatible(arrays, dim, f):
+                return Container._concat_into_place(arrays, dim, f)
+            return f.concatenate(arrays, dim)
+        except Exception as e:
+            raise Exception(str(e) + '\nContainer concat operation only valid for containers of arrays')
+
+    @staticmethod
+    def _concat_dicts(containers, dim, f):
+        return_dict = dict()
+        for key, value in containers[0].items():
+            values = [container[key] for container in containers]
+            if isinstance(value, dict):
+                return_dict[key] = Container._concat_dicts(values, dim, f)
+            else:
+                return_dict[key] = Container._concat_arrays(values, dim, f)
+        return return_dict
+
     @staticmethod
     def concat(containers, dim, f=None):
         """
         Concatenate containers together along the specified dimension.
+        The framework is resolved once, and each output array is then preallocated from the summed sizes of the inputs,
+        which are copied into place. Frameworks with immutable arrays, such as tensorflow and jax, and inputs with
+        differing data types or shapes, fall back to a single backend concatenation per output array.
 
         :param containers: containers to _concatenate
         :type containers: sequence of Container objects
@@ -55,24 +261,48 @@ class Container(dict):
 
         container0 = containers[0]
 
+        if isinstance(container0, dict):
+            leaves = Container(container0).to_iterator()
+            try:
+                f = _get_framework(next(leaves)[1], f=f)
+            except StopIteration:
+                return Container()
+            return Container(Container._concat_dicts(containers, dim, f))
+        else:
+            return Container._concat_arrays(containers, dim, _get_framework(container0, f=f))
+
+    @staticmethod
+    def stack(containers, dim=0, f=None):
+        """
+        Stack containers together along a new dimension, such as when collating a list of per-sample containers into a
+        batch. Each sub-array is stacked with a single call.
+
+        :param containers: containers to stack, which must all have the same structure
+        :type containers: sequence of Container objects
+        :param dim: dimension along which to stack
+        :type dim: int, optional
+        :param f: Machine learning framework. Inferred from inputs if None.
+        :type f: ml_framework, optional
+        :return: Stacked containers
+        """
+
+        container0 = containers[0]
+
         if isinstance(container0, dict):
             return_dict = dict()
             for key in container0.keys():
-                return_dict[key] = Container.concat([container[key] for container in containers], dim)
+                return_dict[key] = Container.stack([container[key] for container in containers], dim, f)
             return Container(return_dict)
         else:
             f = _get_framework(container0, f=f)
             # noinspection PyBroadException
             try:
-                if len(containers[0].shape) == 0:
-                    return _ivy.concatenate([_ivy.reshape(item, [1] * (dim + 1)) for item in containers], dim, f=f)
-                else:
-                    return _ivy.concatenate(containers, dim, f=f)
+                return f.stack(containers, dim)
             except Exception as e:
-                raise Exception(str(e) + '\nContainer concat operation only valid for containers of arrays')
+                raise Exception(str(e) + '\nContainer stack operation only valid for containers of arrays')
 
     @staticmethod
-    def from_disk(h5_obj_or_filepath, slice_obj=slice(None)):
+    def from_disk(h5_obj_or_filepath, slice_obj=slice(None), lazy=False):
         """
         Load container object from disk, as an h5py file, at the specified filepath.
 
@@ -80,6 +310,9 @@ class Container(dict):
         :type h5_obj_or_filepath: str or h5 obj
         :param slice_obj: slice object to slice all h5 elements.
         :type slice_obj: slice or sequence of slices
+        :param lazy: Whether to only read each dataset when it is first accessed, sliced or mapped. The structure,
+                     shapes and dtypes are available without reading, and the h5 file is kept open. Default is False.
+        :type lazy: bool, optional
         :return: Container loaded from disk
         """
         container_dict = dict()
@@ -90,13 +323,163 @@ class Container(dict):
 
         for key, value in sorted(h5_obj.items()):
             if isinstance(value, _h5py.Group):
-                container_dict[key] = Container.from_disk(value, slice_obj)
+                container_dict[key] = Container.from_disk(value, slice_obj, lazy)
             elif isinstance(value, _h5py.Dataset):
-                container_dict[key] = _ivy.array(list(value[slice_obj]))
+                lazy_value = _LazyH5Dataset(value, slice_obj)
+                container_dict[key] = lazy_value if lazy else lazy_value.materialise()
             else:
                 raise Exception('Item found inside h5_obj which was neither a Group nor a Dataset.')
         return Container(container_dict)
 
+    @staticmethod
+    def from_shared_memory(handle):
+        """
+        Load container object from a shared memory block, created by to_shared_memory in this or another process.
+        The arrays are numpy views into the block, so the array payload is not copied. The block name is unlinked on
+        loading, and the block is freed once the last of the returned arrays is released.
+
+        :param handle: Manifest of the shared memory block, returned by to_shared_memory.
+        :type handle: dict
+        :return: Container with numpy array views into the shared memory block.
+        """
+        shared_memory, _ = _shared_memory_modules()
+        shm = shared_memory.SharedMemory(handle['name'])
+        # the name is no longer needed once mapped, and unlinking now frees the block even if this process crashes
+        shm.unlink()
+        base = _np.ndarray((handle['size'],), _np.uint8, buffer=shm.buf)
+        # every leaf is a view of base, which keeps the mapping open until the last leaf is released
+        _weakref.finalize(base, shm.close)
+        return Container._from_bytes_with_offsets(base, handle)
+
+    @staticmethod
+    def unlink_shared_memory(handle):
+        """
+        Free a shared memory block created by to_shared_memory, which will not be loaded with from_shared_memory.
+
+        :param handle: Manifest of the shared memory block, returned by to_shared_memory.
+        :type handle: dict
+        """
+        shared_memory, _ = _shared_memory_modules()
+        shm = shared_memory.SharedMemory(handle['name'])
+        shm.close()
+        shm.unlink()
+
+    @staticmethod
+    def unpack(buffers, layout):
+        """
+        Unpack container object from flat per-dtype buffers, created by pack.
+        For frameworks which support views, such as numpy and torch, the arrays are views into the buffers.
+
+        :param buffers: Flat buffer for each data type, returned by pack.
+        :type buffers: dict of str to array
+        :param layout: Layout of the container arrays in the buffers, returned by pack.
+        :type layout: dict
+        :return: Container with arrays reshaped from the buffers.
+        """
+        f = _get_framework(next(iter(buffers.values())))
+        key_chains_and_values = list()
+        for key_chain, dtype_str, offset, shape in layout['leaves']:
+            num_elements = _reduce(_mul, shape, 1)
+            key_chains_and_values.append(
+                (key_chain, f.reshape(buffers[dtype_str][offset:offset + num_elements], shape)))
+        return Container(_nest_key_chains(key_chains_and_values))
+
+    @staticmethod
+    def from_flat_file(filepath, mode='r'):
+        """
+        Load container object from a flat binary file and its json manifest, saved with to_flat_file.
+        The file is memory-mapped, and each array is converted to the active framework when first accessed, sliced or
+        mapped. With numpy, or with no framework set, the arrays are numpy views into the mapping, so no data is read
+        until it is used, and several processes loading the same file share one copy through the page cache.
+
+        :param filepath: Filepath where the container binary file is saved. The manifest is at filepath + '.json'.
+        :type filepath: str
+        :param mode: Memory-map mode, 'r' for read-only or 'c' for copy-on-write. Default is 'r'.
+        :type mode: str, optional
+        :return: Container with arrays converted from the memory-mapped file on access.
+        """
+        with open(filepath + '.json', 'r') as manifest_file:
+            manifest = _json.load(manifest_file)
+        if manifest['size'] == 0:
+            base = _np.zeros((0,), _np.uint8)
+        else:
+            base = _np.memmap(filepath, _np.uint8, mode, shape=(manifest['size'],))
+        return Container._from_bytes_with_offsets(base, manifest, lazy=True)
+
+    @staticmethod
+    def from_incremental_checkpoint(directory):
+        """
+        Load container object from an incremental checkpoint directory, saved with to_incremental_checkpoint.
+        Each array is loaded from the most recent layer in which it changed, as for from_flat_file.
+
+        :param directory: Directory of the incremental checkpoint.
+        :type directory: str
+        :return: Container composed from the checkpoint layers.
+        """
+        index = _load_checkpoint_index(directory)
+        layers = dict()
+        key_chains_and_values = list()
+        for key_chain, leaf in sorted(index['leaves'].items()):
+            layer_name = leaf['layer']
+            if layer_name not in layers:
+                layers[layer_name] = Container.from_flat_file(_os.path.join(directory, layer_name + '.bin'))
+            key_chains_and_values.append((key_chain, layers[layer_name].at_key_chain(key_chain)))
+        return Container(_nest_key_chains(key_chains_and_values))
+
+    @staticmethod
+    def compact_incremental_checkpoint(directory):
+        """
+        Merge all layers of an incremental checkpoint directory into a single layer, and remove the old layers.
+
+        :param directory: Directory of the incremental checkpoint.
+        :type directory: str
+        """
+        index = _load_checkpoint_index(directory)
+        if len(index['layers']) < 2:
+            return
+        container = Container.from_incremental_checkpoint(directory)
+        old_layers = index['layers']
+        layer_name = 'layer_{:06d}'.format(int(old_layers[-1].split('_')[-1]) + 1)
+        container.to_flat_file(_os.path.join(directory, layer_name + '.bin'))
+        del container
+        for leaf in index['leaves'].values():
+            leaf['layer'] = layer_name
+        index['layers'] = [layer_name]
+        _save_checkpoint_index(directory, index)
+        for old_layer_name in old_layers:
+            for extension in ['.bin', '.bin.json']:
+                _os.remove(_os.path.join(directory, old_layer_name + extension))
+
+    @staticmethod
+    def from_sharded_disk(directory, mmap=False, executor=None):
+        """
+        Load container object from a sharded directory of flat files, saved with to_sharded_disk.
+        The shards are read concurrently on a thread pool, and the arrays are converted to the active framework, for
+        memory-mapped and in-memory shards alike.
+
+        :param directory: Directory of the sharded container.
+        :type directory: str
+        :param mmap: Whether to memory-map the shards rather than reading them into memory. Default is False.
+        :type mmap: bool, optional
+        :param executor: Executor on which to read the shards. A thread pool shared by all containers if None.
+        :type executor: concurrent.futures.Executor, optional
+        :return: Container with arrays loaded from the shards.
+        """
+        with open(_os.path.join(directory, 'index.json'), 'r') as index_file:
+            index = _json.load(index_file)
+        executor = _map_executor() if executor is None else executor
+
+        def _load_shard(shard_name):
+            filepath = _os.path.join(directory, shard_name + '.bin')
+            if mmap:
+                return Container.from_flat_file(filepath)
+            with open(filepath + '.json', 'r') as manifest_file:
+                manifest = _json.load(manifest_file)
+            return Container._from_bytes_with_offsets(_np.fromfile(filepath, _np.uint8), manifest, lazy=True)
+        shards = dict(zip(index['shards'], executor.map(_load_shard, index['shards'])))
+        return Container(_nest_key_chains([(key_chain, shards[shard_name].at_key_chain(key_chain))
+                                           for key_chain, shard_name in sorted(index['leaves'].items())]))
+
     @staticmethod
     def h5_file_size(h5_obj_or_filepath):
         """
@@ -156,6 +539,16 @@ class Container(dict):
     # Private Methods #
     # ----------------#
 
+    def _materialised(self, key, value):
+        if isinstance(value, (_LazyH5Dataset, _LazyFlatArray)):
+            value = value.materialise()
+            dict.__setitem__(self, key, value)
+        return value
+
+    def _sorted_items(self):
+        for key, value in sorted(self.items()):
+            yield key, self._materialised(key, value)
+
     def _get_size(self):
         vals = list(self.values())
         if not vals:
@@ -165,29 +558,92 @@ class Container(dict):
             return val._get_size()
         else:
             try:
-                return val.shape[0]
-            except (AttributeError, IndexError, TypeError):
+                # check the rank first, as indexing the shape of a scalar raises slowly for some frameworks
+                return val.shape[0] if len(val.shape) > 0 else 0
+            except (AttributeError, IndexError, TypeError, ValueError):
                 return 0
 
+    def _to_numpy_with_offsets(self):
+        leaves = list()
+        size = 0
+        for key_chain, value in self.to_iterator_with_key_chains():
+            value_as_np = _np.asarray(_ivy.to_numpy(value), order='C')
+            offset = _aligned(size)
+            leaves.append((key_chain, value_as_np, offset))
+            size = offset + value_as_np.nbytes
+        return leaves, size
+
+    @staticmethod
+    def _offsets_manifest(leaves, size):
+        return {'size': size,
+                'leaves': [(key_chain, value_as_np.dtype.str, list(value_as_np.shape), offset)
+                           for key_chain, value_as_np, offset in leaves]}
+
+    @staticmethod
+    def _from_bytes_with_offsets(base, manifest, lazy=False):
+        key_chains_and_values = list()
+        for key_chain, dtype_str, shape, offset in manifest['leaves']:
+            dtype = _np.dtype(dtype_str)
+            num_bytes = _reduce(_mul, shape, 1) * dtype.itemsize
+            value = base[offset:offset + num_bytes].view(dtype).reshape(shape)
+            key_chains_and_values.append((key_chain, _LazyFlatArray(value) if lazy else value))
+        return Container(_nest_key_chains(key_chains_and_values))
+
     # Public Methods #
     # ---------------#
 
-    def shuffle(self, seed_value=None):
+    def batch_permutation(self, seed_value=None, key=None):
+        """
+        Draw a single random permutation of the batch axis, which can be shared between several containers.
+
+        The permutation is drawn from a PRNG key, so the global random state of the framework is neither read nor
+        modified. Frameworks without explicit PRNG keys, such as mxnet, instead seed and draw from the global random
+        state.
+
+        :param seed_value: random seed from which to create the PRNG key. Ignored if key is provided. Drawn from the
+                           full range of 63 bit seeds if None.
+        :type seed_value: int
+        :param key: PRNG key to draw the permutation from, created with ivy.prng_key or ivy.split_key.
+        :type key: array, optional
+        :return: Array of batch indices, in shuffled order.
+        """
+        leaf = self.to_flat_list()[0]
+        f = _get_framework(leaf)
+        indices = f.arange(self._size, dtype_str='int64', dev_str=f.dev_str(leaf))
+        if key is None and f.__name__ in _KEYLESS_FRAMEWORKS:
+            if seed_value is not None:
+                f.seed(seed_value)
+            return f.shuffle(indices)
+        if key is None:
+            key = f.prng_key(_random.getrandbits(63) if seed_value is None else seed_value)
+        return f.shuffle(indices, key)
+
+    def shuffle(self, seed_value=None, key=None, permutation=None, in_place=False):
         """
         Shuffle entries in all sub-arrays, such that they are still aligned along axis 0.
+        A single permutation of the batch axis is drawn, and then applied to every sub-array with one gather.
 
         :param seed_value: random seed to use for array shuffling
         :type seed_value: int
+        :param key: PRNG key to draw the permutation from, created with ivy.prng_key or ivy.split_key.
+        :type key: array, optional
+        :param permutation: Permutation of the batch axis to apply, for example from batch_permutation.
+                            Passing the same permutation shuffles several containers identically.
+        :type permutation: array, optional
+        :param in_place: Whether to replace the entries of this container, rather than returning a new container.
+        :type in_place: bool, optional
+        :return: Container object, with all sub-arrays shuffled along axis 0.
         """
-        return_dict = dict()
-        if seed_value is None:
-            seed_value = _random.randint(0, 1000)
-        for key, value in sorted(self.items()):
+        if permutation is None:
+            permutation = self.batch_permutation(seed_value, key)
+        return_dict = self if in_place else dict()
+        for key_, value in self._sorted_items():
             if isinstance(value, Container):
-                return_dict[key] = value.shuffle(seed_value)
+                return_dict[key_] = value.shuffle(permutation=permutation, in_place=in_place)
             else:
-                _ivy.seed(seed_value)
-                return_dict[key] = _ivy.shuffle(value)
+                return_dict[key_] = _ivy.gather_flat(value, permutation)
+        if in_place:
+            return self
         return Container(return_dict)
 
     def slice(self, slice_obj):
@@ -220,24 +676,192 @@ class Container(dict):
         :return: Container object at with all sub-array dimensions expanded along the axis.
         """
         return_dict = dict()
-        for key, value in sorted(self.items()):
+        for key, value in self._sorted_items():
             if isinstance(value, Container):
                 return_dict[key] = value.expand_dims(axis)
             else:
                 return_dict[key] = _ivy.expand_dims(value, axis)
         return Container(return_dict)
 
-    def unstack(self, dim, dim_size):
+    def _unstack_to_dicts(self, dim, dim_size):
+        value_lists = dict()
+        for key, value in self._sorted_items():
+            if isinstance(value, Container):
+                value_lists[key] = value._unstack_to_dicts(dim, dim_size)
+            else:
+                # leaves which are not arrays, such as strings, are repeated in each unstacked container
+                value_list = _ivy.unstack(value, dim) if hasattr(value, 'shape') else [value] * dim_size
+                if len(value_list) != dim_size:
+                    raise Exception('Container leaf {} has size {} along dimension {}, but expected size {}'.format(
+                        key, len(value_list), dim, dim_size))
+                value_lists[key] = value_list
+        return [dict([(key, value_list[i]) for key, value_list in value_lists.items()]) for i in range(dim_size)]
+
+    def unstack(self, dim, dim_size=None):
         """
         Unstack containers along specified dimension.
+        Each sub-array is unstacked once, and the unstacked arrays are distributed between the returned containers.
 
         :param dim: Dimensions along which to unstack.
         :type dim: int
-        :param dim_size: Size of the dimension to unstack.
-        :type dim_size: int
-        :return: List of containers, unstacked along the specified dimension.
+        :param dim_size: Size of the dimension to unstack. Inferred from the first sub-array if None.
+        :type dim_size: int, optional
+        :return: List of containers, unstacked along the specified dimension, without the unstacked dimension.
+        """
+        if dim_size is None:
+            dim_size = self.to_flat_list()[0].shape[dim]
+        return [Container(dict_in) for dict_in in self._unstack_to_dicts(dim, dim_size)]
+
+    def pack(self, layout=None, buffers=None):
+        """
+        Pack all arrays of the container object into one flat contiguous buffer per data type.
+
+        :param layout: Layout from a previous pack of a container with the same structure, to skip recomputing it.
+        :type layout: dict, optional
+        :param buffers: Buffers from a previous pack with the same layout, which are written into rather than
+                        reallocated, for frameworks which support item assignment.
+        :type buffers: dict of str to array, optional
+        :return: Flat buffer for each data type, and the layout of the container arrays in the buffers, as the
+                 key-chain, dtype, offset and shape of each array.
+        """
+        values = [value for _, value in self.to_iterator_with_key_chains()]
+        f = _get_framework(values[0])
+        if layout is None:
+            leaves = list()
+            sizes = dict()
+            for key_chain, value in self.to_iterator_with_key_chains():
+                dtype_str = f.dtype_str(value)
+                shape = [int(d) for d in value.shape]
+                offset = sizes.get(dtype_str, 0)
+                leaves.append((key_chain, dtype_str, offset, shape))
+                sizes[dtype_str] = offset + _reduce(_mul, shape, 1)
+            layout = {'leaves': leaves, 'sizes': sizes}
+        if buffers is not None:
+            try:
+                for (_, dtype_str, offset, shape), value in zip(layout['leaves'], values):
+                    buffers[dtype_str][offset:offset + _reduce(_mul, shape, 1)] = f.reshape(value, [-1])
+                return buffers, layout
+            except TypeError:
+                # the framework does not support item assignment
+                pass
+        flat_values = dict([(dtype_str, list()) for dtype_str in layout['sizes'].keys()])
+        for (_, dtype_str, _, _), value in zip(layout['leaves'], values):
+            flat_values[dtype_str].append(f.reshape(value, [-1]))
+        return dict([(dtype_str, f.concatenate(values_, 0)) for dtype_str, values_ in flat_values.items()]), layout
+
+    def to_flat_file(self, filepath):
+        """
+        Save container object to disk, as a single flat binary file of raw arrays at aligned offsets, together with a
+        json manifest of the key-chain, dtype, shape and offset of each array at filepath + '.json'.
+
+        :param filepath: Filepath for where to save the container binary file.
+        :type filepath: str
+        """
+        leaves, size = self._to_numpy_with_offsets()
+        with open(filepath, 'wb') as binary_file:
+            for _, value_as_np, offset in leaves:
+                binary_file.seek(offset)
+                binary_file.write(value_as_np.reshape(-1).view(_np.uint8).data)
+            binary_file.truncate(size)
+        with open(filepath + '.json', 'w') as manifest_file:
+            _json.dump(self._offsets_manifest(leaves, size), manifest_file)
+
+    def to_incremental_checkpoint(self, directory):
+        """
+        Save container object to an incremental checkpoint directory. A content hash is kept for each array, and only
+        the arrays which changed since the previous checkpoint are written, as a new flat file layer. Arrays which are
+        no longer in the container are dropped from the checkpoint.
+
+        :param directory: Directory of the incremental checkpoint, which is created if it does not exist.
+        :type directory: str
+        :return: Key-chains of the arrays written to the new layer.
         """
-        return [self.slice(tuple([slice(None, None, None)] * dim + [slice(i, i + 1, 1)])) for i in range(dim_size)]
+        _os.makedirs(directory, exist_ok=True)
+        index = _load_checkpoint_index(directory)
+        if index['layers']:
+            layer_name = 'layer_{:06d}'.format(int(index['layers'][-1].split('_')[-1]) + 1)
+        else:
+            layer_name = 'layer_000000'
+        leaves = dict()
+        changed_key_chains_and_values = list()
+        for key_chain, value in self.to_iterator_with_key_chains():
+            value_as_np = _ivy.to_numpy(value)
+            value_hash = _hash_array(value_as_np)
+            previous_leaf = index['leaves'].get(key_chain)
+            if previous_leaf is not None and previous_leaf['hash'] == value_hash:
+                leaves[key_chain] = previous_leaf
+            else:
+                leaves[key_chain] = {'hash': value_hash, 'layer': layer_name}
+                changed_key_chains_and_values.append((key_chain, value_as_np))
+        if changed_key_chains_and_values:
+            Container(_nest_key_chains(changed_key_chains_and_values)).to_flat_file(
+                _os.path.join(directory, layer_name + '.bin'))
+            index['layers'].append(layer_name)
+        index['leaves'] = leaves
+        _save_checkpoint_index(directory, index)
+        return [key_chain for key_chain, _ in changed_key_chains_and_values]
+
+    def to_sharded_disk(self, directory, num_shards=4, executor=None):
+        """
+        Save container object to a directory of flat file shards, written concurrently on a thread pool.
+        The arrays are split between the shards to balance the number of bytes per shard, and an index file maps each
+        key-chain to its shard.
+
+        :param directory: Directory for where to save the shards, which is created if it does not exist.
+        :type directory: str
+        :param num_shards: Number of shards to split the arrays between. Default is 4.
+        :type num_shards: int, optional
+        :param executor: Executor on which to write the shards. A thread pool shared by all containers if None.
+        :type executor: concurrent.futures.Executor, optional
+        """
+        _os.makedirs(directory, exist_ok=True)
+        executor = _map_executor() if executor is None else executor
+        key_chains_and_values = [(key_chain, _ivy.to_numpy(value))
+                                 for key_chain, value in self.to_iterator_with_key_chains()]
+        shard_names = ['shard_{:05d}'.format(i) for i in range(num_shards)]
+        shard_contents = [list() for _ in range(num_shards)]
+        shard_sizes = [0] * num_shards
+        leaves = dict()
+        # largest arrays first, each to the currently smallest shard
+        for key_chain, value_as_np in sorted(key_chains_and_values, key=lambda kc_n_v: -kc_n_v[1].nbytes):
+            shard_idx = shard_sizes.index(min(shard_sizes))
+            shard_contents[shard_idx].append((key_chain, value_as_np))
+            shard_sizes[shard_idx] += value_as_np.nbytes
+            leaves[key_chain] = shard_names[shard_idx]
+        shard_names_n_contents = [(shard_name, contents) for shard_name, contents in zip(shard_names, shard_contents)
+                                  if contents]
+
+        def _save_shard(shard_name_n_contents):
+            shard_name, contents = shard_name_n_contents
+            Container(_nest_key_chains(contents)).to_flat_file(_os.path.join(directory, shard_name + '.bin'))
+        list(executor.map(_save_shard, shard_names_n_contents))
+        with open(_os.path.join(directory, 'index.json'), 'w') as index_file:
+            _json.dump({'shards': [shard_name for shard_name, _ in shard_names_n_contents], 'leaves': leaves},
+                       index_file)
+
+    def to_shared_memory(self):
+        """
+        Save container object to a single shared memory block, so that it can be sent to another process without
+        pickling the array payload. All arrays are converted to numpy and copied into the block once.
+        The block is owned by the consumer, which frees it by loading it with from_shared_memory, or with
+        unlink_shared_memory if it will not be loaded. Shared memory transport requires python 3.8 or later.
+
+        :return: Small picklable manifest of the block name and size, and of the key-chain, dtype, shape and offset of
+                 each array in the block.
+        """
+        shared_memory, resource_tracker = _shared_memory_modules()
+        leaves, size = self._to_numpy_with_offsets()
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        if _os.name == 'posix':
+            # ownership passes to the consumer, so this process must not unlink the block when it exits
+            # noinspection PyProtectedMember
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        base = _np.ndarray((size,), _np.uint8, buffer=shm.buf)
+        for key_chain, value_as_np, offset in leaves:
+            base[offset:offset + value_as_np.nbytes] = value_as_np.reshape(-1).view(_np.uint8)
+        del base
+        shm.close()
+        return dict([('name', shm.name)] + list(self._offsets_manifest(leaves, size).items()))
 
     def to_disk(self, h5_obj_or_filepath, starting_index=0, mode='a', max_batch_size=None):
         """
@@ -257,7 +881,7 @@ class Container(dict):
             h5_obj = _h5py.File(h5_obj_or_filepath, mode)
         else:
             h5_obj = h5_obj_or_filepath
-        for key, value in sorted(self.items()):
+        for key, value in self._sorted_items():
             if isinstance(value, Container):
                 if key not in h5_obj.keys():
                     h5_group = h5_obj.create_group(key)
@@ -285,7 +909,7 @@ class Container(dict):
         :return: Container as nested list.
         """
         return_list = list()
-        for key, value in sorted(self.items()):
+        for key, value in self._sorted_items():
             if isinstance(value, Container):
                 return_list.append(value.to_list())
             elif value is not None and key is not '_f':
@@ -312,13 +936,29 @@ class Container(dict):
 
         :return: Iterator for the container elements.
         """
-        for key, value in sorted(self.items()):
+        for key, value in self._sorted_items():
             if isinstance(value, Container):
                 # noinspection PyCompatibility
                 yield from value.to_iterator()
             else:
                 yield key, value
 
+    def to_iterator_with_key_chains(self, key_chain=''):
+        """
+        Return iterator for traversing through the nested elements of container object, with their full key-chains.
+
+        :param key_chain: Chain of keys for this dict entry
+        :type key_chain: str
+        :return: Iterator for the container key-chains and elements.
+        """
+        for key, value in self._sorted_items():
+            this_key_chain = key if key_chain == '' else (key_chain + '/' + key)
+            if isinstance(value, Container):
+                # noinspection PyCompatibility
+                yield from value.to_iterator_with_key_chains(this_key_chain)
+            else:
+                yield this_key_chain, value
+
     def to_flat_list(self):
         """
         Return flat list representation of container object.
@@ -327,15 +967,36 @@ class Container(dict):
         """
         return list([item for key, item in self.to_iterator()])
 
-    def to_random(self):
+    def to_random(self, parallel=False, executor=None, key=None):
         """
-        Return new container, with all entries having same shape and type, but random values
+        Return new container, with all entries having same shape and type, but random values.
+        When drawing in parallel or from an explicit key, each entry is drawn from its own key, derived up front from
+        the root key and the index of the entry with fold_in, so that no random state is shared between threads.
+
+        :param parallel: Whether to draw the values for large entries concurrently, on a thread pool.
+        :type parallel: bool, optional
+        :param executor: Executor on which to schedule the entries. A thread pool shared by all containers if None.
+        :type executor: concurrent.futures.Executor, optional
+        :param key: PRNG key from which the key of each entry is derived. If None, a random root key is created when
+                    drawing in parallel, and the global random state is used otherwise.
+        :type key: array, optional
         """
-        def _as_random(value, _=''):
+        leaves = [(key_chain, value) for key_chain, value in self.to_iterator_with_key_chains()
+                  if hasattr(value, 'shape')]
+        entry_keys = dict()
+        if leaves and (parallel or key is not None):
+            f = _get_framework(leaves[0][1])
+            if key is None and f.__name__ in _KEYLESS_FRAMEWORKS:
+                parallel = False
+            else:
+                key = f.prng_key(_random.getrandbits(63)) if key is None else key
+                entry_keys = dict([(key_chain, f.fold_in(key, i)) for i, (key_chain, _) in enumerate(leaves)])
+
+        def _as_random(value, key_chain=''):
             if hasattr(value, 'shape'):
-                return _ivy.random_uniform(0., 1., value.shape)
+                return _ivy.random_uniform(0., 1., value.shape, key=entry_keys.get(key_chain))
             return value
-        return self.map(_as_random)
+        return self.map(_as_random, parallel=parallel, executor=executor)
 
     def at_key_chain(self, key_chain):
         """
@@ -402,7 +1063,28 @@ class Container(dict):
         """
         return Container(self.to_dict())
 
-    def map(self, func, key_chain=''):
+    def _map_submit(self, func, key_chain, executor, min_parallel_size):
+        return_dict = dict()
+        for key, value in self._sorted_items():
+            this_key_chain = key if key_chain == '' else (key_chain + '/' + key)
+            if isinstance(value, Container):
+                return_dict[key] = value._map_submit(func, this_key_chain, executor, min_parallel_size)
+            elif _num_elements(value) >= min_parallel_size:
+                return_dict[key] = executor.submit(_map_entry, func, value, this_key_chain)
+            else:
+                return_dict[key] = func(value, this_key_chain)
+        return return_dict
+
+    @staticmethod
+    def _map_resolve(dict_in):
+        for key, value in dict_in.items():
+            if isinstance(value, dict):
+                Container._map_resolve(value)
+            elif isinstance(value, _Future):
+                dict_in[key] = value.result()
+        return dict_in
+
+    def map(self, func, key_chain='', parallel=False, executor=None, min_parallel_size=65536):
         """
         Apply function to all array values of container
 
@@ -410,9 +1092,22 @@ class Container(dict):
         :type func: python function
         :param key_chain: Chain of keys for this dict entry
         :type key_chain: str
+        :param parallel: Whether to apply the function to large entries concurrently, on a thread pool.
+                         Worthwhile for frameworks which release the GIL, such as numpy, torch cpu and tensorflow.
+        :type parallel: bool, optional
+        :param executor: Executor on which to schedule the entries. A thread pool shared by all containers if None.
+        :type executor: concurrent.futures.Executor, optional
+        :param min_parallel_size: Minimum number of elements for an entry to be scheduled on the executor.
+                                  Smaller entries are mapped inline.
+        :type min_parallel_size: int, optional
+        :return: New container, with the same ordering of entries regardless of the order of completion.
         """
+        # a nested parallel map waiting on the executor from one of its own threads could deadlock
+        if parallel and not getattr(_MAP_LOCAL, 'in_map', False):
+            executor = _map_executor() if executor is None else executor
+            return Container(self._map_resolve(self._map_submit(func, key_chain, executor, min_parallel_size)))
         return_dict = dict()
-        for key, value in sorted(self.items()):
+        for key, value in self._sorted_items():
             this_key_chain = key if key_chain == '' else (key_chain + '/' + key)
             if isinstance(value, Container):
                 return_dict[key] = value.map(func, this_key_chain)
@@ -428,20 +1123,28 @@ class Container(dict):
         """
         return self.map(lambda x, _: _ivy.dtype(x))
 
-    def with_entries_as_lists(self):
+    def with_entries_as_lists(self, parallel=False, executor=None):
         """
         Return container object, with each array entry in the container cast to a list
+
+        :param parallel: Whether to cast large entries concurrently, on a thread pool.
+        :type parallel: bool, optional
+        :param executor: Executor on which to schedule the entries. A thread pool shared by all containers if None.
+        :type executor: concurrent.futures.Executor, optional
         """
         def to_list(x, _=''):
             try:
                 return _ivy.to_list(x)
             except (AttributeError, ValueError):
                 return x
-        return self.map(to_list)
+        return self.map(to_list, parallel=parallel, executor=executor)
 
     # Built-ins #
     # ----------#
 
+    def __getitem__(self, key):
+        return self._materialised(key, dict.__getitem__(self, key))
+
     def __getattr__(self, item):
         try:
             return self[item]
@@ -455,3 +1158,130 @@ class Container(dict):
     @property
     def size(self):
         return self._size
+
+
+class ContainerBuffer:
+
+    def __init__(self, initial_capacity=None, growth_factor=2.):
+        """
+        Initialize buffer for repeatedly appending container batches along axis 0, such as when collecting rollouts.
+        Storage is preallocated, and grown geometrically when full, so the total cost of appending is amortised linear
+        in the number of entries appended, rather than quadratic as for repeated concatenation.
+
+        :param initial_capacity: Batch capacity to preallocate on the first append. Size of the first batch if None.
+        :type initial_capacity: int, optional
+        :param growth_factor: Factor by which to grow the capacity when the buffer is full.
+        :type growth_factor: float, optional
+        """
+        if growth_factor <= 1:
+            raise Exception('growth_factor must be greater than 1, but found {}'.format(growth_factor))
+        self._initial_capacity = initial_capacity
+        self._growth_factor = growth_factor
+        self._storage = None
+        self._chunks = None
+        self._data = None
+        self._size = 0
+        self._capacity = 0
+
+    # Private Methods #
+    # ----------------#
+
+    @staticmethod
+    def _allocate(batch, capacity):
+        def _zeros(value, _=''):
+            f = _get_framework(value)
+            return f.zeros([capacity] + list(value.shape[1:]), f.dtype_str(value), f.dev_str(value))
+        return batch.map(_zeros)
+
+    @staticmethod
+    def _write(storage, batch, start_index):
+        end_index = start_index + batch.size
+        for key, value in batch.items():
+            if isinstance(value, Container):
+                ContainerBuffer._write(storage[key], value, start_index)
+                continue
+            if len(value.shape) != len(storage[key].shape) or int(value.shape[0]) != end_index - start_index or\
+                    [int(d) for d in value.shape[1:]] != [int(d) for d in storage[key].shape[1:]]:
+                # mismatched shapes would otherwise be broadcast into the storage
+                raise Exception('Batch entry {} of shape {} does not match the buffer entries of shape {}'.format(
+                    key, list(value.shape), [None] + list(storage[key].shape[1:])))
+            storage[key][start_index:end_index] = value
+
+    def _grow(self, min_capacity, batch):
+        capacity = max(min_capacity, int(self._capacity * self._growth_factor))
+        new_storage = self._allocate(batch, capacity)
+        if self._size > 0:
+            self._write(new_storage, self._storage.slice(slice(0, self._size)), 0)
+        self._storage = new_storage
+        self._capacity = capacity
+
+    # Public Methods #
+    # ---------------#
+
+    def append(self, batch):
+        """
+        Append a container batch to the buffer, along axis 0.
+        Frameworks with immutable arrays are collected as chunks, which are concatenated once when the data is read.
+
+        :param batch: Container batch to append, with the same structure as previously appended batches.
+        :type batch: Container
+        """
+        batch_size = batch.size
+        self._data = None
+        if self._storage is None and self._chunks is None:
+            if _get_framework(batch.to_flat_list()[0]).__name__ in _ITEM_ASSIGNMENT_FRAMEWORKS:
+                self._grow(max(self._initial_capacity or 0, batch_size), batch)
+                self._write(self._storage, batch, 0)
+            else:
+                self._chunks = [batch]
+            self._size = batch_size
+            return
+        if self._chunks is not None:
+            self._chunks.append(batch)
+        else:
+            if self._size + batch_size > self._capacity:
+                self._grow(self._size + batch_size, batch)
+            self._write(self._storage, batch, self._size)
+        self._size += batch_size
+
+    def clear(self):
+        """
+        Empty the buffer, keeping any preallocated storage for reuse.
+        """
+        self._data = None
+        if self._chunks is not None:
+            self._chunks = None
+            self._storage = None
+            self._capacity = 0
+        self._size = 0
+
+    # Getters #
+    # --------#
+
+    @property
+    def data(self):
+        """
+        Container of all appended batches. For frameworks with mutable arrays these are views into the storage, which
+        are only valid until the next append. The container is cached until the next append, so for frameworks with
+        immutable arrays the chunks are only concatenated on the first read after appending.
+        """
+        if self._data is not None:
+            return self._data
+        if self._chunks is not None:
+            if len(self._chunks) > 1:
+                # the concatenated chunks replace the individual chunks, which can then be freed
+                self._chunks = [Container.concat(self._chunks, 0)]
+            self._data = self._chunks[0]
+        elif self._storage is None:
+            return Container()
+        else:
+            self._data = self._storage.slice(slice(0, self._size))
+        return self._data
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def capacity(self):
+        return self._capacity
@@ -765,17 +765,18 @@ def scatter_nd(indices, updates, shape, reduction='sum', dev_str=None, f=None):
 # noinspection PyShadowingNames
 def gather_flat(params, indices, dev_str=None, f=None):
     """
-    Gather slices from flat params into a flat array with size specified by indices size.
+    Gather slices from params along axis 0, at the indices. For flat params this gathers single values, and for
+    params with more dimensions it gathers whole rows.
 
     :param params: The array from which to gather values.
     :type params: array
-    :param indices: Index array.
+    :param indices: Flat index array, of indices along axis 0.
     :type indices: array
     :param dev_str: device on which to create the array 'cuda:0', 'cuda:1', 'cpu' etc. Same as x if None.
     :type dev_str: str, optional
     :param f: Machine learning framework. Inferred from inputs if None.
     :type f: ml_framework, optional
-    :return: New array of given shape, with the values gathered at the indices.
+    :return: New array of shape indices.shape + params.shape[1:], with the slices gathered at the indices.
     """
     return _get_framework(params, f=f).gather_flat(params, indices, dev_str)
 
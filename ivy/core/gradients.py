@@ -35,7 +35,7 @@ def execute_with_gradients(func, xs, f=None):
     return _get_framework(None, f=f).execute_with_gradients(func, xs)
 
 
-def gradient_descent_update(ws, dcdws, lr, f=None):
+def gradient_descent_update(ws, dcdws, lr, parallel=False, executor=None, f=None):
     """
     Update weights ws of some function, given the derivatives of some cost c with respect to ws, [dc/dw for w in ws].
 
@@ -45,14 +45,19 @@ def gradient_descent_update(ws, dcdws, lr, f=None):
     :type dcdws: sequence of arrays
     :param lr: Learning rate, the rate at which the weights should be updated relative to the gradient.
     :type lr: float
+    :param parallel: Whether to update large weights concurrently, on a thread pool. Default is False.
+    :type parallel: bool, optional
+    :param executor: Executor on which to schedule the weights. A thread pool shared by all containers if None.
+    :type executor: concurrent.futures.Executor, optional
     :param f: Machine learning framework. Inferred from inputs if None.
     :type f: ml_framework, optional
     :return: The new function weights ws_new, following the gradient descent updates.
     """
-    return _get_framework(None, f=f).gradient_descent_update(ws, dcdws, lr)
+    return _get_framework(None, f=f).gradient_descent_update(ws, dcdws, lr, parallel, executor)
 
 
-def adam_update(ws, dcdws, lr, mw, vw, step, beta1=0.9, beta2=0.999, epsilon=1e-7, f=None):
+def adam_update(ws, dcdws, lr, mw, vw, step, beta1=0.9, beta2=0.999, epsilon=1e-7, parallel=False, executor=None,
+                f=None):
     """
     Update weights ws of some function, given the derivatives of some cost c with respect to ws, using ADAM update.
     `[reference] <https://en.wikipedia.org/wiki/Stochastic_gradient_descent#Adam>`_
@@ -75,11 +80,16 @@ def adam_update(ws, dcdws, lr, mw, vw, step, beta1=0.9, beta2=0.999, epsilon=1e-
     :type beta2: float
     :param epsilon: divisor during adam update, preventing division by zero
     :type epsilon: float
+    :param parallel: Whether to update large weights and moments concurrently, on a thread pool. Default is False.
+    :type parallel: bool, optional
+    :param executor: Executor on which to schedule the weights. A thread pool shared by all containers if None.
+    :type executor: concurrent.futures.Executor, optional
     :param f: Machine learning framework. Inferred from inputs if None.
     :type f: ml_framework, optional
     :return: The new function weights ws_new, and also new mw and vw, following the gradient descent updates.
     """
-    return _get_framework(None, f=f).adam_update(ws, dcdws, lr, mw, vw, step, beta1, beta2, epsilon)
+    return _get_framework(None, f=f).adam_update(ws, dcdws, lr, mw, vw, step, beta1, beta2, epsilon, parallel,
+                                                 executor)
 
 
 def stop_gradient(x, f=None):
@@ -6,7 +6,7 @@ Collection of random Ivy functions
 from ivy.framework_handler import get_framework as _get_framework
 
 
-def random_uniform(low=0.0, high=0.0, shape=None, dev='cpu', f=None):
+def random_uniform(low=0.0, high=0.0, shape=None, dev='cpu', key=None, f=None):
     """
     Draws samples from a uniform distribution.
     Samples are uniformly distributed over the half-open interval [low, high) (includes low, but excludes high).
@@ -22,14 +22,18 @@ def random_uniform(low=0.0, high=0.0, shape=None, dev='cpu', f=None):
                     If size is None (default), a single value is returned.
     :param dev: device on which to create the array 'cuda:0', 'cuda:1', 'cpu' etc.
     :type dev: str
+    :param key: PRNG key to draw the samples from, created with prng_key or split_key.
+                The global random state is used if None. With torch, keyed samples are drawn on the host with numpy,
+                and then copied to the device.
+    :type key: array, optional
     :param f: Machine learning framework. Inferred from inputs if None.
     :type f: ml_framework, optional
     :return: Drawn samples from the parameterized uniform distribution.
     """
-    return _get_framework(f=f).random_uniform(low, high, shape, dev)
+    return _get_framework(key, f=f).random_uniform(low, high, shape, dev, key)
 
 
-def randint(low, high, shape, dev='cpu', f=None):
+def randint(low, high, shape, dev='cpu', key=None, f=None):
     """
     Returns a tensor filled with random integers generated uniformly between low (inclusive) and high (exclusive).
 
@@ -41,11 +45,15 @@ def randint(low, high, shape, dev='cpu', f=None):
     :type shape: tuple
     :param dev: device on which to create the array 'cuda:0', 'cuda:1', 'cpu' etc.
     :type dev: str
+    :param key: PRNG key to draw the integers from, created with prng_key or split_key.
+                The global random state is used if None. With torch, keyed integers are drawn on the host with numpy,
+                and then copied to the device.
+    :type key: array, optional
     :param f: Machine learning framework. Inferred from inputs if None.
     :type f: ml_framework, optional
     :return:
     """
-    return _get_framework(f=f).randint(low, high, shape, dev)
+    return _get_framework(key, f=f).randint(low, high, shape, dev, key)
 
 
 def seed(seed_value=0, f=None):
@@ -60,14 +68,65 @@ def seed(seed_value=0, f=None):
     return _get_framework(f=f).seed(seed_value)
 
 
-def shuffle(x, f=None):
+def shuffle(x, key=None, f=None):
     """
     Shuffles the given array along axis 0.
 
     :param x: An array object, in the specific Machine learning framework.
     :type x: array
+    :param key: PRNG key to draw the permutation from, created with prng_key or split_key.
+                The global random state is used if None. With torch, keyed permutation are drawn on the host with numpy,
+                and then copied to the device.
+    :type key: array, optional
     :param f: Machine learning framework. Inferred from inputs if None.
     :type f: ml_framework, optional
     :return: An array object, shuffled along the first dimension.
     """
-    return _get_framework(x, f=f).shuffle(x)
+    return _get_framework(x, f=f).shuffle(x, key)
+
+
+def prng_key(seed_value=0, f=None):
+    """
+    Creates an explicit PRNG key for pure random number generation.
+    Functions given a key do not read or modify any global random state, and always return the same values for the
+    same key, which makes them safe to use in compiled functions. New keys are derived with split_key.
+
+    :param seed_value: Seed for the key. Negative seeds are taken modulo 2 ** 64.
+    :type seed_value: int
+    :param f: Machine learning framework. Inferred from inputs if None.
+    :type f: ml_framework, optional
+    :return: A new PRNG key.
+    """
+    return _get_framework(f=f).prng_key(seed_value)
+
+
+def split_key(key, num=2, f=None):
+    """
+    Splits a PRNG key into new independent keys. The input key should not be used again after splitting.
+
+    :param key: PRNG key to split.
+    :type key: array
+    :param num: Number of new keys to create. Default is 2.
+    :type num: int
+    :param f: Machine learning framework. Inferred from inputs if None.
+    :type f: ml_framework, optional
+    :return: Tuple of num new PRNG keys.
+    """
+    return _get_framework(key, f=f).split_key(key, num)
+
+
+def fold_in(key, data, f=None):
+    """
+    Deterministically derives a new PRNG key from a key and an integer, such as a worker, thread or leaf index.
+    A single root key can then spawn independent random streams for any number of parallel workers, without any shared
+    global random state, and each stream is the same regardless of how many other streams are spawned.
+
+    :param key: PRNG key to derive the new key from.
+    :type key: array
+    :param data: Non-negative integer to fold into the key.
+    :type data: int
+    :param f: Machine learning framework. Inferred from inputs if None.
+    :type f: ml_framework, optional
+    :return: A new PRNG key.
+    """
+    return _get_framework(key, f=f).fold_in(key, data)
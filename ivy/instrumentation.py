@@ -0,0 +1,370 @@
+"""
+Runtime instrumentation, with pre-call and post-call hooks around ivy functions, backend functions and native framework
+calls. Functions are only wrapped while at least one hook is registered, so instrumentation has no cost when unused.
+"""
+
+# global
+import sys
+import time
+import types
+import threading
+import collections
+
+_BACKENDS = ['jax', 'mxnd', 'numpy', 'tensorflow', 'torch']
+_NATIVE_MODULES = ['jax', 'jaxlib', 'mxnet', 'numpy', 'tensorflow', 'torch']
+
+_pre_hooks = list()
+_post_hooks = list()
+_patched = list()
+# name passed to the hooks to the original function, for each native function which has been wrapped
+_native_functions = dict()
+
+
+# Wrapping #
+# ---------#
+
+def _is_function(value):
+    return callable(value) and not isinstance(value, (type, types.ModuleType)) and\
+           getattr(value, '__module__', None) != 'typing'
+
+
+def _wrap(fn, name, layer):
+    if layer == 'native':
+        _native_functions[name] = fn
+
+    def _instrumented(*args, **kwargs):
+        for hook in _pre_hooks:
+            hook(layer, name, args, kwargs)
+        start = time.perf_counter()
+        ret = fn(*args, **kwargs)
+        end = time.perf_counter()
+        for hook in _post_hooks:
+            hook(layer, name, args, kwargs, ret, start, end)
+        return ret
+
+    _instrumented.__name__ = getattr(fn, '__name__', name)
+    _instrumented.__doc__ = getattr(fn, '__doc__', None)
+    _instrumented.__wrapped__ = fn
+    if not isinstance(fn, (types.FunctionType, types.BuiltinFunctionType)):
+        # callable objects, such as numpy ufuncs with their at and reduce methods, keep their attributes
+        return _InstrumentedCallable(fn, _instrumented)
+    return _instrumented
+
+
+class _InstrumentedCallable:
+
+    __slots__ = ['__wrapped__', '_instrumented']
+
+    def __init__(self, fn, instrumented):
+        """
+        Instrumented callable object, which forwards attribute access to the original object.
+        """
+        self.__wrapped__ = fn
+        self._instrumented = instrumented
+
+    def __call__(self, *args, **kwargs):
+        return self._instrumented(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.__wrapped__, name)
+
+    def __repr__(self):
+        return '<instrumented {}>'.format(repr(self.__wrapped__))
+
+
+class _NativeModule:
+
+    __slots__ = ['_module', '_attrs']
+
+    def __init__(self, module):
+        """
+        Proxy for a native framework module imported by a backend, which wraps the functions called through it.
+        """
+        self._module = module
+        self._attrs = dict()
+
+    def __getattr__(self, name):
+        try:
+            return self._attrs[name]
+        except KeyError:
+            pass
+        attr = getattr(self._module, name)
+        if isinstance(attr, types.ModuleType):
+            wrapped = _NativeModule(attr)
+        elif _is_function(attr):
+            wrapped = _wrap(attr, self._module.__name__ + '.' + name, 'native')
+        else:
+            wrapped = attr
+        self._attrs[name] = wrapped
+        return wrapped
+
+    def __repr__(self):
+        return '<instrumented {}>'.format(repr(self._module))
+
+
+def _ivy_modules():
+    return [(name, module) for name, module in list(sys.modules.items())
+            if module is not None and (name == 'ivy' or name.startswith('ivy.')) and name != __name__]
+
+
+def _is_backend_module(name):
+    # backend submodules, such as ivy.numpy.core.general or ivy.torch.nn.layers
+    split_name = name.split('.')
+    return len(split_name) == 4 and split_name[1] in _BACKENDS and split_name[2] in ['core', 'nn']
+
+
+def _install():
+    ivy_modules = _ivy_modules()
+    wrappers = dict()
+    for name, module in ivy_modules:
+        if name.startswith('ivy.core.') or name.startswith('ivy.neural_net.'):
+            layer, prefix = 'ivy', 'ivy.'
+        elif _is_backend_module(name):
+            layer, prefix = 'backend', 'ivy.' + name.split('.')[1] + '.'
+        else:
+            continue
+        for key, value in list(module.__dict__.items()):
+            if key[0] == '_' or not _is_function(value) or id(value) in wrappers:
+                continue
+            # numpy ufuncs have no __module__ of their own
+            module_name = getattr(value, '__module__', None) or type(value).__module__
+            if layer == 'ivy' and module_name != name:
+                continue
+            if layer == 'backend' and module_name.split('.')[0] in _NATIVE_MODULES:
+                # backend function which is a native function, such as sin = _np.sin
+                native_name = module_name + '.' + getattr(value, '__name__', key)
+                wrappers[id(value)] = _wrap(_wrap(value, native_name, 'native'), prefix + key, layer)
+            else:
+                wrappers[id(value)] = _wrap(value, prefix + key, layer)
+    for name, module in ivy_modules:
+        is_backend_module = _is_backend_module(name)
+        for key, value in list(module.__dict__.items()):
+            if id(value) in wrappers:
+                setattr(module, key, wrappers[id(value)])
+            elif is_backend_module and isinstance(value, types.ModuleType) and\
+                    value.__name__.split('.')[0] in _NATIVE_MODULES:
+                setattr(module, key, _NativeModule(value))
+            else:
+                continue
+            _patched.append((module, key, value))
+
+
+def _uninstall():
+    while _patched:
+        module, key, value = _patched.pop(-1)
+        setattr(module, key, value)
+
+
+# Hooks #
+# ------#
+
+def add_hook(pre=None, post=None):
+    """
+    Register hooks to be called around every ivy function, backend function, and native framework call made by a
+    backend. The first registered hook wraps the functions, and removing the last hook restores the originals.
+
+    :param pre: Function called before each call, with arguments (layer, name, args, kwargs).
+                Layer is one of 'ivy', 'backend' or 'native'.
+    :type pre: callable, optional
+    :param post: Function called after each call, with arguments (layer, name, args, kwargs, ret, start, end), where
+                 start and end are time.perf_counter values around the call, excluding the hooks themselves.
+    :type post: callable, optional
+    :return: Handle for removing the hooks with remove_hook.
+    """
+    if not _pre_hooks and not _post_hooks:
+        _install()
+    if pre is not None:
+        _pre_hooks.append(pre)
+    if post is not None:
+        _post_hooks.append(post)
+    return pre, post
+
+
+def remove_hook(handle):
+    """
+    Remove hooks registered with add_hook.
+
+    :param handle: Handle returned by add_hook.
+    :type handle: tuple
+    """
+    pre, post = handle
+    if pre is not None:
+        _pre_hooks.remove(pre)
+    if post is not None:
+        _post_hooks.remove(post)
+    if not _pre_hooks and not _post_hooks:
+        _uninstall()
+
+
+class hooks:
+
+    def __init__(self, pre=None, post=None):
+        """
+        Context manager for registering hooks with add_hook, and removing them on exit.
+        """
+        self._pre = pre
+        self._post = post
+        self._handle = None
+
+    def __enter__(self):
+        self._handle = add_hook(self._pre, self._post)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        remove_hook(self._handle)
+
+
+# Call Arguments #
+# ---------------#
+
+def native_function(name):
+    """
+    Get the original native framework function, for the name passed to the hooks around a wrapped native call.
+
+    :param name: Name of the native function, as passed to the hooks.
+    :type name: str
+    :return: The unwrapped native function.
+    """
+    return _native_functions[name]
+
+
+def dtype_name(dtype):
+    """
+    Get the name of a data type of any framework, such as 'float32'.
+
+    :param dtype: Data type of a numpy, jax, tensorflow, torch or mxnet array.
+    :type dtype: data type
+    :return: Name of the data type.
+    """
+    for attr in ['name', '__name__']:
+        name = getattr(dtype, attr, None)
+        if isinstance(name, str):
+            return name
+    # torch dtypes, such as torch.float32
+    return str(dtype).split('.')[-1]
+
+
+def array_args(values):
+    """
+    Find the arrays among the arguments of a call, including arrays nested in lists and tuples.
+
+    :param values: Argument values of the call.
+    :type values: sequence
+    :return: Generator of the arrays, in order.
+    """
+    for value in values:
+        if isinstance(value, (list, tuple)):
+            for item in array_args(value):
+                yield item
+        elif hasattr(value, 'dtype') and not callable(getattr(value, 'shape', callable)):
+            # backend modules also have shape and dtype functions
+            yield value
+
+
+def describe_inputs(args, kwargs):
+    """
+    Describe the array inputs of a call.
+
+    :param args: Positional arguments of the call.
+    :type args: sequence
+    :param kwargs: Keyword arguments of the call.
+    :type kwargs: dict
+    :return: Dict with the shapes and data type names of the arrays among the arguments, in order.
+    """
+    arrays = list(array_args(list(args) + list(kwargs.values())))
+    return {'shapes': [[None if dim is None else int(dim) for dim in array.shape] for array in arrays],
+            'dtypes': [dtype_name(array.dtype) for array in arrays]}
+
+
+# Timing #
+# -------#
+
+CallTimes = collections.namedtuple('CallTimes', ['name', 'ivy_time', 'backend_time', 'native_time'])
+
+
+def _noop(*_):
+    pass
+
+
+class CallTimer(hooks):
+
+    def __init__(self, num_calibration_calls=1000):
+        """
+        Context manager which records the time of each top-level call, split into the time spent in the ivy function,
+        in the backend function, and in native framework calls. The dispatch overhead of a call is then
+        ivy_time - backend_time, and the conversion overhead is backend_time - native_time.
+        The cost of the wrappers and hooks around each nested call is calibrated on entry, with all registered hooks
+        installed, and subtracted from the time of the calls enclosing it. This is an estimate, which for calls of a
+        few microseconds can still be well above the overhead without hooks installed. Calls are tracked separately
+        per thread.
+
+        :param num_calibration_calls: Number of instrumented no-op calls timed to calibrate the hook cost.
+        :type num_calibration_calls: int, optional
+        """
+        super(CallTimer, self).__init__(self._pre_call, self._post_call)
+        self._num_calibration_calls = num_calibration_calls
+        self._local = threading.local()
+        self.calls = list()
+        # time added by the wrapper and hooks around each nested call, in seconds
+        self.hook_cost = 0.
+
+    def _state(self):
+        try:
+            return self._local.state
+        except AttributeError:
+            self._local.state = {'depths': {'ivy': 0, 'backend': 0, 'native': 0},
+                                 'starts': {'ivy': 0, 'backend': 0, 'native': 0}, 'count': 0, 'current': None}
+            return self._local.state
+
+    def _pre_call(self, layer, name, args, kwargs):
+        state = self._state()
+        if state['current'] is None:
+            state['current'] = {'name': name, 'layer': layer, 'ivy': 0., 'backend': 0., 'native': 0.}
+        if state['depths'][layer] == 0:
+            # calls started after this one are nested within it
+            state['starts'][layer] = state['count'] + 1
+        state['depths'][layer] += 1
+        state['count'] += 1
+
+    def _post_call(self, layer, name, args, kwargs, ret, start, end):
+        state = self._state()
+        depths = state['depths']
+        depths[layer] -= 1
+        current = state['current']
+        if depths[layer] == 0:
+            num_nested = state['count'] - state['starts'][layer]
+            current[layer] += max(end - start - num_nested * self.hook_cost, 0.)
+        if not any(depths.values()):
+            # outer layers include the inner layers, which each correction is estimated separately for
+            current['backend'] = max(current['backend'], current['native'])
+            if current['layer'] == 'backend':
+                # the backend was called directly, so there is no dispatch overhead
+                current['ivy'] = current['backend']
+            else:
+                current['ivy'] = max(current['ivy'], current['backend'])
+            self.calls.append(CallTimes(current['name'], current['ivy'], current['backend'], current['native']))
+            state['current'] = None
+            state['count'] = 0
+
+    def _calibrate(self):
+        instrumented = _wrap(_noop, '_noop', 'native')
+        costs = list()
+        for _ in range(5):
+            # the no-op calls are nested in an open call, so they run the full hooks without being recorded
+            self._pre_call('ivy', '_calibration', (), {})
+            start = time.perf_counter()
+            for _ in range(self._num_calibration_calls):
+                instrumented(None)
+            instrumented_time = time.perf_counter() - start
+            start = time.perf_counter()
+            for _ in range(self._num_calibration_calls):
+                _noop(None)
+            bare_time = time.perf_counter() - start
+            costs.append((instrumented_time - bare_time) / self._num_calibration_calls)
+            del self._local.state
+        self.hook_cost = max(sorted(costs)[len(costs) // 2], 0.)
+
+    def __enter__(self):
+        super(CallTimer, self).__enter__()
+        self._calibrate()
+        return self
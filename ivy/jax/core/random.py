@@ -11,16 +11,18 @@ from ivy.jax.core.general import _to_dev
 RNG = _jax.random.PRNGKey(0)
 
 
-def random_uniform(low=0.0, high=0.0, shape=None, dev='cpu'):
-    global RNG
-    RNG, rng_input = _jax.random.split(RNG)
-    return _to_dev(_jax.random.uniform(rng_input, shape, minval=low, maxval=high), dev)
+def random_uniform(low=0.0, high=0.0, shape=None, dev='cpu', key=None):
+    if key is None:
+        global RNG
+        RNG, key = _jax.random.split(RNG)
+    return _to_dev(_jax.random.uniform(key, shape, minval=low, maxval=high), dev)
 
 
-def randint(low, high, shape, dev='cpu'):
-    global RNG
-    RNG, rng_input = _jax.random.split(RNG)
-    return _to_dev(_jax.random.randint(rng_input, shape, low, high), dev)
+def randint(low, high, shape, dev='cpu', key=None):
+    if key is None:
+        global RNG
+        RNG, key = _jax.random.split(RNG)
+    return _to_dev(_jax.random.randint(key, shape, low, high), dev)
 
 
 def seed(seed_value=0):
@@ -29,7 +31,13 @@ def seed(seed_value=0):
     return
 
 
-def shuffle(x):
-    global RNG
-    RNG, rng_input = _jax.random.split(RNG)
-    return _jax.random.shuffle(rng_input, x)
+def shuffle(x, key=None):
+    if key is None:
+        global RNG
+        RNG, key = _jax.random.split(RNG)
+    return _jax.random.shuffle(key, x)
+
+
+prng_key = lambda seed_value=0: _jax.random.PRNGKey(seed_value)
+split_key = lambda key, num=2: tuple(_jax.random.split(key, num))
+fold_in = lambda key, data: _jax.random.fold_in(key, data)
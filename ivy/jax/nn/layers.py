@@ -7,34 +7,76 @@ import jax.numpy as _jnp
 import jax.lax as _jlax
 
 
-def conv1d(*_):
-    raise Exception('Convolutions not yet implemented for jax library')
-
-
-def conv1d_transpose(*_):
-    raise Exception('Convolutions not yet implemented for jax library')
+def _to_list(item, num_dims):
+    return [item]*num_dims if isinstance(item, int) else list(item)
+
+
+def _conv_transpose(x, filters, strides, padding, output_shape, data_format, dilations, filter_format):
+    num_dims = len(filter_format) - 2
+    strides = _to_list(strides, num_dims)
+    dilations = _to_list(dilations, num_dims)
+    dimension_numbers = (data_format, filter_format, data_format)
+    if output_shape is None:
+        return _jlax.conv_transpose(x, filters, strides, padding, dilations, dimension_numbers, True)
+    # the full transposed convolution is cropped to the output shape, with the padding of the forward convolution
+    # from output_shape to the input shape removed from the start, as in tensorflow
+    res = _jlax.conv_transpose(x, filters, strides, 'VALID', dilations, dimension_numbers, True)
+    spatial_axes = [data_format.index(dim) for dim in data_format if dim not in 'NC']
+    filter_axes = [filter_format.index(dim) for dim in data_format if dim not in 'NC']
+    slices = [slice(None)] * len(x.shape)
+    pad_widths = [(0, 0)] * len(x.shape)
+    for axis, filter_axis, stride, dilation in zip(spatial_axes, filter_axes, strides, dilations):
+        kernel_size = (filters.shape[filter_axis] - 1) * dilation + 1
+        out_size = output_shape[axis]
+        pad_before = max((x.shape[axis] - 1) * stride + kernel_size - out_size, 0) // 2 if padding == 'SAME' else 0
+        slices[axis] = slice(pad_before, pad_before + out_size)
+        pad_widths[axis] = (0, max(pad_before + out_size - res.shape[axis], 0))
+    return _jnp.pad(res, pad_widths)[tuple(slices)]
+
+
+def conv1d(x, filters, strides, padding, data_format='NWC', dilations=1, filter_shape=None, num_filters=None):
+    strides = _to_list(strides, 1)
+    dilations = _to_list(dilations, 1)
+    return _jlax.conv_general_dilated(x, filters, strides, padding, None, dilations, (data_format, 'WIO', data_format))
+
+
+def conv1d_transpose(x, filters, strides, padding, output_shape=None, data_format='NWC', dilations=1,
+                     filter_shape=None, num_filters=None):
+    return _conv_transpose(x, filters, strides, padding, output_shape, data_format, dilations, 'WIO')
 
 
 def conv2d(x, filters, strides, padding, data_format='NHWC', dilations=1, filter_shape=None, num_filters=None):
-    strides = [strides]*2 if isinstance(strides, int) else strides
-    dilations = [dilations]*2 if isinstance(dilations, int) else dilations
+    strides = _to_list(strides, 2)
+    dilations = _to_list(dilations, 2)
     return _jlax.conv_general_dilated(x, filters, strides, padding, None, dilations, (data_format, 'HWIO', data_format))
 
 
-def depthwise_conv2d(*_):
-    raise Exception('Convolutions not yet implemented for jax library')
+def depthwise_conv2d(x, filters, strides, padding, data_format='NHWC', dilations=1, filter_shape=None,
+                     num_filters=None, num_channels=None):
+    strides = _to_list(strides, 2)
+    dilations = _to_list(dilations, 2)
+    if num_channels is None:
+        num_channels = x.shape[1] if data_format == 'NCHW' else x.shape[-1]
+    filters = _jnp.expand_dims(filters, -2)
+    return _jlax.conv_general_dilated(x, filters, strides, padding, None, dilations, (data_format, 'HWIO', data_format),
+                                      feature_group_count=num_channels)
 
 
-def conv2d_transpose(*_):
-    raise Exception('Convolutions not yet implemented for jax library')
+def conv2d_transpose(x, filters, strides, padding, output_shape=None, data_format='NHWC', dilations=1,
+                     filter_shape=None, num_filters=None):
+    return _conv_transpose(x, filters, strides, padding, output_shape, data_format, dilations, 'HWIO')
 
 
-def conv3d(*_):
-    raise Exception('Convolutions not yet implemented for jax library')
+def conv3d(x, filters, strides, padding, data_format='NDHWC', dilations=1, filter_shape=None, num_filters=None):
+    strides = _to_list(strides, 3)
+    dilations = _to_list(dilations, 3)
+    return _jlax.conv_general_dilated(x, filters, strides, padding, None, dilations,
+                                      (data_format, 'DHWIO', data_format))
 
 
-def conv3d_transpose(*_):
-    raise Exception('Convolutions not yet implemented for jax library')
+def conv3d_transpose(x, filters, strides, padding, output_shape=None, data_format='NDHWC', dilations=1,
+                     filter_shape=None, num_filters=None):
+    return _conv_transpose(x, filters, strides, padding, output_shape, data_format, dilations, 'DHWIO')
 
 
 linear = lambda x, weight, bias, num_hidden=None: _jnp.matmul(x, _jnp.transpose(weight)) + bias
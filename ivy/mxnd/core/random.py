@@ -9,15 +9,38 @@ import mxnet as _mx
 from ivy.mxnd.core.general import _mxnet_init_context
 
 
-def random_uniform(low=0., high=1., shape=None, dev='cpu'):
+def _raise_if_key(key):
+    if key is not None:
+        raise Exception('Explicit PRNG keys not yet implemented for mxnet library')
+
+
+def random_uniform(low=0., high=1., shape=None, dev='cpu', key=None):
+    _raise_if_key(key)
     ctx = _mxnet_init_context(dev)
     return _mx.nd.random.uniform(low, high, shape, ctx=ctx)
 
 
-def randint(low, high, shape, dev='cpu'):
+def randint(low, high, shape, dev='cpu', key=None):
+    _raise_if_key(key)
     ctx = _mxnet_init_context(dev)
     return _mx.nd.random.randint(low, high, shape, ctx=ctx)
 
 
 seed = lambda seed_value=0: _mx.random.seed(seed_value)
-shuffle = lambda x: _mx.nd.random.shuffle(x)
+
+
+def shuffle(x, key=None):
+    _raise_if_key(key)
+    return _mx.nd.random.shuffle(x)
+
+
+def prng_key(*_):
+    raise Exception('Explicit PRNG keys not yet implemented for mxnet library')
+
+
+def split_key(*_):
+    raise Exception('Explicit PRNG keys not yet implemented for mxnet library')
+
+
+def fold_in(*_):
+    raise Exception('Explicit PRNG keys not yet implemented for mxnet library')
@@ -114,9 +114,7 @@ stack = _np.stack
 def unstack(x, axis):
     if x.shape == ():
         return [x]
-    x_split = _np.split(x, x.shape[axis], axis)
-    res = [_np.squeeze(item, axis) for item in x_split]
-    return res
+    return list(_np.moveaxis(x, axis, 0))
 
 
 def split(x, num_sections=None, axis=0):
@@ -5,11 +5,41 @@ Collection of Numpy random functions, wrapped to fit Ivy syntax and signature.
 # global
 import numpy as _np
 
-random_uniform = lambda low=0., high=1., shape=None, dev=None: _np.random.uniform(low, high, shape)
-randint = lambda low, high, shape, dev=None: _np.random.randint(low, high, shape)
+
+def _generator(key):
+    return _np.random.Generator(_np.random.Philox(key=key))
+
+
+def random_uniform(low=0., high=1., shape=None, dev=None, key=None):
+    if key is not None:
+        return _generator(key).uniform(low, high, shape)
+    return _np.random.uniform(low, high, shape)
+
+
+def randint(low, high, shape, dev=None, key=None):
+    if key is not None:
+        return _generator(key).integers(low, high, shape)
+    return _np.random.randint(low, high, shape)
+
+
 seed = lambda seed_value=0: _np.random.seed(seed_value)
 
 
-def shuffle(x):
-    _np.random.shuffle(x)
-    return x
+def shuffle(x, key=None):
+    if key is not None:
+        return _generator(key).permutation(x)
+    return _np.random.permutation(x)
+
+
+prng_key = lambda seed_value=0: _np.array([seed_value & (2 ** 64 - 1), 0], dtype=_np.uint64)
+
+
+def split_key(key, num=2):
+    # new keys are drawn from the top of the counter space, which sampling with the key never reaches
+    bit_generator = _np.random.Philox(key=key, counter=[0, 0, 0, 2 ** 63])
+    return tuple(bit_generator.random_raw(2 * num).reshape(num, 2))
+
+
+def fold_in(key, data):
+    seed_sequence = _np.random.SeedSequence([int(k) for k in key], spawn_key=(int(data),))
+    return seed_sequence.generate_state(2, _np.uint64)
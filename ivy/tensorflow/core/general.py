@@ -4,8 +4,6 @@ Collection of TensorFlow general functions, wrapped to fit Ivy syntax and signat
 
 # global
 from numbers import Number
-from operator import mul as _mul
-from functools import reduce as _reduce
 from tensorflow.python.types.core import Tensor
 
 _round = round
@@ -237,9 +235,6 @@ def identity(n, dtype_str='float32', batch_shape=None, dev_str=None):
         return _tf.eye(n, n, batch_shape=batch_shape, dtype=dtype)
 
 
-TF_SCATTER_VAR = {}
-
-
 # noinspection PyShadowingNames
 def scatter_flat(indices, updates, size, reduction='sum', dev_str=None):
     if dev_str is None:
@@ -248,24 +243,16 @@ def scatter_flat(indices, updates, size, reduction='sum', dev_str=None):
     if reduction == 'sum':
         return _tf.scatter_nd(_tf.expand_dims(indices, -1), updates, [size])
     elif reduction == 'min':
-        func = _tf.compat.v1.scatter_min
+        func = _tf.tensor_scatter_nd_min
         initial_val = _tf.cast(_tf.constant(2 ** 31 - 1), dtype)
     elif reduction == 'max':
-        func = _tf.compat.v1.scatter_max
+        func = _tf.tensor_scatter_nd_max
         initial_val = _tf.cast(_tf.constant(-(2 ** 31 - 1)), dtype)
     else:
         raise Exception('reduction is {}, but it must be one of "sum", "min" or "max"'.format(reduction))
-    global TF_SCATTER_VAR
-    if size not in TF_SCATTER_VAR:
-        TF_SCATTER_VAR[size] = {dtype: _tf.Variable(_tf.ones(size, dtype=dtype) * initial_val, trainable=False)}
-    elif dtype not in TF_SCATTER_VAR[size]:
-        TF_SCATTER_VAR[size][dtype] = _tf.Variable(_tf.ones(size, dtype=dtype) * initial_val, trainable=False)
-    else:
-        TF_SCATTER_VAR[size][dtype].assign(_tf.ones(size, dtype=dtype) * initial_val)
-    res = _tf.convert_to_tensor(func(TF_SCATTER_VAR[size][dtype], indices, updates))
-    res = _tf.where(res == initial_val, _tf.zeros(size, dtype=updates.dtype), res)
     with _tf.device('/' + dev_str.upper()):
-        return res
+        res = func(_tf.fill([size], initial_val), _tf.expand_dims(indices, -1), updates)
+        return _tf.where(res == initial_val, _tf.zeros(size, dtype=updates.dtype), res)
 
 
 # noinspection PyShadowingNames
@@ -277,38 +264,16 @@ def scatter_nd(indices, updates, shape, reduction='sum', dev_str=None):
     if reduction == 'sum':
         return _tf.scatter_nd(indices, updates, shape)
     elif reduction == 'min':
-        func = _tf.compat.v1.scatter_min
+        func = _tf.tensor_scatter_nd_min
         initial_val = _tf.cast(_tf.constant(2 ** 31 - 1), dtype)
     elif reduction == 'max':
-        func = _tf.compat.v1.scatter_max
+        func = _tf.tensor_scatter_nd_max
         initial_val = _tf.cast(_tf.constant(-(2 ** 31 - 1)), dtype)
     else:
         raise Exception('reduction is {}, but it must be one of "sum", "min" or "max"'.format(reduction))
-    indices_shape = indices.shape
-    num_index_dims = indices_shape[-1]
-    result_dim_sizes_list = [_reduce(_mul, shape[i + 1:], 1) for i in range(len(shape) - 1)] + [1]
-    result_dim_sizes = _tf.constant(result_dim_sizes_list)
-    implicit_indices_factor = result_dim_sizes[num_index_dims - 1]
-    flat_result_size = _reduce(_mul, shape, 1)
-    global TF_SCATTER_VAR
-    if flat_result_size not in TF_SCATTER_VAR:
-        TF_SCATTER_VAR[flat_result_size] = {dtype: _tf.Variable(_tf.ones(flat_result_size, dtype=dtype) * initial_val, trainable=False)}
-    elif dtype not in TF_SCATTER_VAR[flat_result_size]:
-        TF_SCATTER_VAR[flat_result_size][dtype] = _tf.Variable(_tf.ones(flat_result_size, dtype=dtype) * initial_val, trainable=False)
-    else:
-        TF_SCATTER_VAR[flat_result_size][dtype].assign(_tf.ones(flat_result_size, dtype=dtype) * initial_val)
-    flat_updates = _tf.reshape(updates, (-1,))
-    new_shape = [1] * (len(indices_shape) - 1) + [num_index_dims]
-    indices_scales = _tf.reshape(result_dim_sizes[0:num_index_dims], new_shape)
-    indices_for_flat_tiled = _tf.tile(_tf.reshape(_tf.reduce_sum(indices * indices_scales, -1, keepdims=True), (-1, 1)), [1, implicit_indices_factor])
-    implicit_indices = _tf.tile(_tf.expand_dims(_tf.range(implicit_indices_factor), 0), _tf.stack((_tf.shape(indices_for_flat_tiled)[0], _tf.constant(1))))
-    indices_for_flat = indices_for_flat_tiled + implicit_indices
-    flat_indices_for_flat = _tf.reshape(indices_for_flat, (-1,))
-    flat_scatter = _tf.convert_to_tensor(func(TF_SCATTER_VAR[flat_result_size][dtype], flat_indices_for_flat, flat_updates))
-    flat_scatter = _tf.where(flat_scatter == initial_val, _tf.zeros(flat_result_size, dtype=updates.dtype), flat_scatter)
     with _tf.device('/' + dev_str.upper()):
-        res = _tf.reshape(flat_scatter, list(shape))
-        return res
+        res = func(_tf.fill(shape, initial_val), indices, updates)
+        return _tf.where(res == initial_val, _tf.zeros(shape, dtype=updates.dtype), res)
 
 
 def gather_flat(params, indices, dev_str=None):
@@ -24,20 +24,25 @@ def execute_with_gradients(func, xs):
     return (y, grads, *rest)
 
 
-def gradient_descent_update(ws, dcdws, lr):
-    ws.map(lambda w, key_chain: w.assign(w - (dcdws if key_chain == '' else dcdws.at_key_chain(key_chain)) * lr))
+def gradient_descent_update(ws, dcdws, lr, parallel=False, executor=None):
+    ws.map(lambda w, key_chain: w.assign(w - (dcdws if key_chain == '' else dcdws.at_key_chain(key_chain)) * lr),
+                parallel=parallel, executor=executor)
     return ws
 
 
-def adam_update(ws, dcdws, lr, mw, vw, step, beta1=0.9, beta2=0.999, epsilon=1e-7):
+def adam_update(ws, dcdws, lr, mw, vw, step, beta1=0.9, beta2=0.999, epsilon=1e-7, parallel=False,
+                executor=None):
     step = _tf.cast(step, _tf.float32)
-    mw = dcdws.map(lambda dcdw, kc: beta1 * mw.at_key_chain(kc) + (1 - beta1) * dcdw)
-    dcdws_sqrd = dcdws.map(lambda dcdw, _: dcdw ** 2)
-    vw = dcdws_sqrd.map(lambda dcdw_sqrd, kc: beta2 * vw.at_key_chain(kc) + (1 - beta2) * dcdw_sqrd)
+    mw = dcdws.map(lambda dcdw, kc: beta1 * mw.at_key_chain(kc) + (1 - beta1) * dcdw, parallel=parallel,
+                   executor=executor)
+    dcdws_sqrd = dcdws.map(lambda dcdw, _: dcdw ** 2, parallel=parallel, executor=executor)
+    vw = dcdws_sqrd.map(lambda dcdw_sqrd, kc: beta2 * vw.at_key_chain(kc) + (1 - beta2) * dcdw_sqrd,
+                        parallel=parallel, executor=executor)
     beta1_pow = beta1 ** step
     beta2_pow = beta2 ** step
     alpha = lr * (1 - beta2_pow)**0.5 / (1 - beta1_pow + epsilon)
-    ws.map(lambda w, kc: w.assign(w - alpha * mw.at_key_chain(kc) / (vw.at_key_chain(kc) ** 0.5 + epsilon)))
+    ws.map(lambda w, kc: w.assign(w - alpha * mw.at_key_chain(kc) / (vw.at_key_chain(kc) ** 0.5 + epsilon)),
+           parallel=parallel, executor=executor)
     return ws, mw, vw
 
 
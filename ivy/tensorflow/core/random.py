@@ -5,7 +5,28 @@ Collection of TensorFlow random functions, wrapped to fit Ivy syntax and signatu
 # global
 import tensorflow as _tf
 
-random_uniform = lambda low=0., high=1., shape=None, dev=None: _tf.random.uniform(shape, low, high)
-randint = lambda low, high, shape, dev=None: _tf.random.uniform(shape=shape, minval=low, maxval=high, dtype=_tf.int32)
+
+def random_uniform(low=0., high=1., shape=None, dev=None, key=None):
+    if key is not None:
+        return _tf.random.stateless_uniform(shape, key, low, high)
+    return _tf.random.uniform(shape, low, high)
+
+
+def randint(low, high, shape, dev=None, key=None):
+    if key is not None:
+        return _tf.random.stateless_uniform(shape, key, low, high, _tf.int32)
+    return _tf.random.uniform(shape=shape, minval=low, maxval=high, dtype=_tf.int32)
+
+
 seed = lambda seed_value=0: _tf.random.set_seed(seed_value)
-shuffle = lambda x: _tf.random.shuffle(x)
+
+
+def shuffle(x, key=None):
+    if key is not None:
+        return _tf.gather(x, _tf.argsort(_tf.random.stateless_uniform(_tf.shape(x)[0:1], key)))
+    return _tf.random.shuffle(x)
+
+
+prng_key = lambda seed_value=0: _tf.constant([seed_value, 0], _tf.int64)
+split_key = lambda key, num=2: tuple(_tf.unstack(_tf.random.experimental.stateless_split(key, num)))
+fold_in = lambda key, data: _tf.cast(_tf.random.experimental.stateless_fold_in(key, data), _tf.int64)
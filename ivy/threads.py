@@ -0,0 +1,176 @@
+"""
+Uniform control of intra-op and inter-op thread pools across the native frameworks, so that processes sharing a machine
+do not each spawn thread pools the width of the machine.
+"""
+
+# global
+import os
+import sys
+import logging
+try:
+    import threadpoolctl as _threadpoolctl
+except ImportError:
+    _threadpoolctl = None
+
+# environment variables read by blas and openmp runtimes when they are loaded, which are also inherited by subprocesses
+BLAS_ENV_VARS = ['OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'BLIS_NUM_THREADS',
+                 'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS']
+
+_blas_limiter = None
+
+
+# Frameworks #
+# -----------#
+
+def _set_env(intra):
+    for env_var in BLAS_ENV_VARS:
+        os.environ[env_var] = str(intra)
+    # read when the xla cpu backend is first initialised, which only has a switch between one thread and all cores
+    flags = [flag for flag in os.environ.get('XLA_FLAGS', '').split()
+             if not flag.startswith('--xla_cpu_multi_thread_eigen')]
+    if intra == 1:
+        flags.append('--xla_cpu_multi_thread_eigen=false')
+    if flags:
+        os.environ['XLA_FLAGS'] = ' '.join(flags)
+    else:
+        os.environ.pop('XLA_FLAGS', None)
+    return True
+
+
+def _set_blas(intra):
+    global _blas_limiter
+    if _threadpoolctl is None:
+        return False
+    if _blas_limiter is not None:
+        _blas_limiter.restore_original_limits()
+    _blas_limiter = _threadpoolctl.threadpool_limits(limits=intra)
+    return True
+
+
+def _set_torch(intra, inter):
+    torch = sys.modules.get('torch')
+    if torch is None:
+        return False
+    if intra is not None:
+        torch.set_num_threads(intra)
+    if inter is not None and inter != torch.get_num_interop_threads():
+        try:
+            torch.set_num_interop_threads(inter)
+        except RuntimeError:
+            logging.warning('torch inter-op threads can only be set once, before any parallel work, and remain {}.'
+                            .format(torch.get_num_interop_threads()))
+            return False
+    return True
+
+
+def _set_tensorflow(intra, inter):
+    tf = sys.modules.get('tensorflow')
+    if tf is None:
+        return False
+    threading_config = tf.config.threading
+    try:
+        if intra is not None and intra != threading_config.get_intra_op_parallelism_threads():
+            threading_config.set_intra_op_parallelism_threads(intra)
+        if inter is not None and inter != threading_config.get_inter_op_parallelism_threads():
+            threading_config.set_inter_op_parallelism_threads(inter)
+    except RuntimeError:
+        logging.warning('tensorflow threads can only be set before the runtime is initialised, and remain {} intra-op '
+                        'and {} inter-op.'.format(threading_config.get_intra_op_parallelism_threads(),
+                                                  threading_config.get_inter_op_parallelism_threads()))
+        return False
+    return True
+
+
+# Thread Control #
+# ---------------#
+
+def set_num_threads(intra=None, inter=None):
+    """
+    Set the number of threads used within each op, and for running independent ops concurrently, for every native
+    framework which supports it. This sets the blas and openmp pools through threadpoolctl when it is installed, torch
+    through set_num_threads and set_num_interop_threads, and tensorflow through its threading config. The blas, openmp
+    and XLA_FLAGS environment variables are also set, which configure libraries loaded later and subprocesses, with
+    the xla cpu backend of jax only supporting a single intra-op thread or all cores. Tensorflow threads, and torch
+    inter-op threads, can only be set before the runtime starts, so call this early, such as at the start of each
+    worker process.
+
+    :param intra: Number of threads within each op. Default is to leave them unchanged.
+    :type intra: int, optional
+    :param inter: Number of threads for running independent ops concurrently. Default is to leave them unchanged.
+    :type inter: int, optional
+    :return: Dict from each of env, blas, torch and tensorflow to whether the setting was applied, with torch and
+             tensorflow only applied if already imported.
+    """
+    applied = {'env': False, 'blas': False}
+    if intra is not None:
+        if intra < 1:
+            raise Exception('intra must be a positive number of threads, but found {}.'.format(intra))
+        applied['env'] = _set_env(intra)
+        applied['blas'] = _set_blas(intra)
+    if inter is not None and inter < 1:
+        raise Exception('inter must be a positive number of threads, but found {}.'.format(inter))
+    applied['torch'] = _set_torch(intra, inter)
+    applied['tensorflow'] = _set_tensorflow(intra, inter)
+    return applied
+
+
+def get_num_threads():
+    """
+    Get the current thread pool sizes of each imported native framework.
+
+    :return: Dict from each of blas, torch and tensorflow to a dict of intra and inter thread counts, with blas only
+             included if threadpoolctl is installed, and None for sizes chosen by the framework at startup.
+    """
+    counts = dict()
+    if _threadpoolctl is not None:
+        pools = _threadpoolctl.threadpool_info()
+        counts['blas'] = {'intra': max([pool['num_threads'] for pool in pools]) if pools else None, 'inter': None}
+    torch = sys.modules.get('torch')
+    if torch is not None:
+        counts['torch'] = {'intra': torch.get_num_threads(), 'inter': torch.get_num_interop_threads()}
+    tf = sys.modules.get('tensorflow')
+    if tf is not None:
+        # zero means tensorflow picks the number of threads
+        counts['tensorflow'] = {'intra': tf.config.threading.get_intra_op_parallelism_threads() or None,
+                                'inter': tf.config.threading.get_inter_op_parallelism_threads() or None}
+    return counts
+
+
+class num_threads:
+
+    def __init__(self, intra=None, inter=None):
+        """
+        Context manager for setting thread counts with set_num_threads, and restoring the blas pools, torch intra-op
+        threads and environment variables on exit. Settings which can only be made once, being tensorflow threads and
+        torch inter-op threads, are left in place.
+        """
+        self._intra = intra
+        self._inter = inter
+        self._env = None
+        self._torch_intra = None
+        self._blas_limiter = None
+        self.applied = None
+
+    def __enter__(self):
+        global _blas_limiter
+        self._env = dict([(env_var, os.environ.get(env_var)) for env_var in BLAS_ENV_VARS + ['XLA_FLAGS']])
+        torch = sys.modules.get('torch')
+        self._torch_intra = torch.get_num_threads() if torch is not None else None
+        # a new limiter is nested inside any set by set_num_threads, which is restored on exit
+        self._blas_limiter, _blas_limiter = _blas_limiter, None
+        self.applied = set_num_threads(self._intra, self._inter)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _blas_limiter
+        if _blas_limiter is not None:
+            _blas_limiter.restore_original_limits()
+        _blas_limiter = self._blas_limiter
+        torch = sys.modules.get('torch')
+        if torch is not None and self._torch_intra is not None:
+            torch.set_num_threads(self._torch_intra)
+        for env_var, value in self._env.items():
+            if value is None:
+                os.environ.pop(env_var, None)
+            else:
+                os.environ[env_var] = value
@@ -454,7 +454,7 @@ def scatter_nd(indices, updates, shape, reduction='sum', dev_str=None):
 def gather_flat(params, indices, dev_str: Optional[str] = None):
     if dev_str is None:
         dev_str = _callable_dev_str(params)
-    return torch.gather(params, 0, indices.type(torch.int64)).to(_dev_str_to_dev(dev_str))
+    return torch.index_select(params, 0, indices.type(torch.int64)).to(_dev_str_to_dev(dev_str))
 
 
 # noinspection PyShadowingNames
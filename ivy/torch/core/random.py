@@ -4,15 +4,51 @@ Collection of PyTorch random functions, wrapped to fit Ivy syntax and signature.
 
 # global
 import torch
+import numpy as _np
 from typing import Optional, List
 
 
-def random_uniform(low: float = 0.0, high: float = 1.0, shape: Optional[List[int]] = None, dev: str = 'cpu'):
+def _check_not_tracing():
+    if torch.jit.is_tracing():
+        # keyed samples are drawn on the host, and tracing would record them as constants, reused for every key
+        raise Exception('Sampling with an explicit key is not supported when tracing with torch.jit.trace, '
+                        'compile with dynamic=True to script the function instead.')
+
+
+# noinspection PyUnresolvedReferences
+def _generator(key):
+    return _np.random.Generator(_np.random.Philox(key=key.cpu().numpy().astype(_np.uint64)))
+
+
+@torch.jit.ignore
+def _random_uniform_from_key(low: float, high: float, shape: Optional[List[int]], dev: str, key: torch.Tensor):
+    samples = _generator(key).uniform(low, high, shape).astype(_np.float32)
+    return torch.from_numpy(_np.asarray(samples)).to(dev.replace('gpu', 'cuda'))
+
+
+@torch.jit.ignore
+def _randint_from_key(low: int, high: int, shape: List[int], dev: torch.device, key: torch.Tensor):
+    return torch.from_numpy(_generator(key).integers(low, high, shape)).to(dev)
+
+
+@torch.jit.ignore
+def _randperm_from_key(batch_size: int, key: torch.Tensor):
+    return torch.from_numpy(_generator(key).permutation(batch_size)).to(key.device)
+
+
+def random_uniform(low: float = 0.0, high: float = 1.0, shape: Optional[List[int]] = None, dev: str = 'cpu',
+                   key: Optional[torch.Tensor] = None):
+    if key is not None:
+        _check_not_tracing()
+        return _random_uniform_from_key(low, high, shape, dev, key)
     rand_range = high - low
     return torch.rand(shape).to(dev.replace('gpu', 'cuda')) * rand_range + low
 
 
-def randint(low: int, high: int, shape: List[int], dev: torch.device = 'cpu'):
+def randint(low: int, high: int, shape: List[int], dev: torch.device = 'cpu', key: Optional[torch.Tensor] = None):
+    if key is not None:
+        _check_not_tracing()
+        return _randint_from_key(low, high, shape, dev, key)
     return torch.randint(low, high, shape).to(dev)
 
 
@@ -22,6 +58,26 @@ def seed(seed_value: int = 0) -> None:
     return
 
 
-def shuffle(x):
+def shuffle(x, key: Optional[torch.Tensor] = None):
     batch_size = x.shape[0]
+    if key is not None:
+        _check_not_tracing()
+        return x[_randperm_from_key(batch_size, key).to(x.device)]
     return x[torch.randperm(batch_size)]
+
+
+def prng_key(seed_value: int = 0):
+    return torch.tensor([seed_value, 0], dtype=torch.int64)
+
+
+def split_key(key, num: int = 2):
+    # new keys are drawn from the top of the counter space, which sampling with the key never reaches
+    bit_generator = _np.random.Philox(key=key.cpu().numpy().astype(_np.uint64), counter=[0, 0, 0, 2 ** 63])
+    new_keys = torch.from_numpy(bit_generator.random_raw(2 * num).reshape(num, 2).view(_np.int64)).to(key.device)
+    return tuple(torch.unbind(new_keys))
+
+
+def fold_in(key, data: int):
+    seed_sequence = _np.random.SeedSequence([int(k) for k in key.cpu().numpy().astype(_np.uint64)],
+                                            spawn_key=(int(data),))
+    return torch.from_numpy(seed_sequence.generate_state(2, _np.uint64).view(_np.int64)).to(key.device)
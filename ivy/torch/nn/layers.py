@@ -8,12 +8,31 @@ import torch as _torch
 from typing import List, Optional
 
 
+def _crop_to_output_shape(res, x_shape: List[int], filter_shape: List[int], strides: int, dilations: int,
+                          padding: str, output_shape: List[int]):
+    """
+    Crop the full transposed convolution, in channels first layout, to the spatial output shape. The padding of the
+    forward convolution from output_shape to the input shape is removed from the start, as in tensorflow.
+    """
+    pad_list: List[int] = []
+    for i in range(len(filter_shape)):
+        axis = i + 2
+        out_size = output_shape[i]
+        pad_before = 0
+        if padding == 'SAME':
+            kernel_size = (filter_shape[i] - 1) * dilations + 1
+            pad_before = max((x_shape[axis] - 1) * strides + kernel_size - out_size, 0) // 2
+        res = res.narrow(axis, pad_before, min(out_size, res.shape[axis] - pad_before))
+        pad_list = [0, out_size - res.shape[axis]] + pad_list
+    return _torch.nn.functional.pad(res, pad_list)
+
+
 # noinspection PyUnresolvedReferences
 def conv1d(x, filters, strides: int, padding: str, data_format: str = 'NWC', dilations: int = 1,
            filter_shape: Optional[List[int]] = None, num_filters: Optional[int] = None):
     if filter_shape is None:
         filter_shape = list(filters.shape[0:1])
-    filters = filters.permute(1, 2, 0)
+    filters = filters.permute(2, 1, 0)
     if data_format == 'NWC':
         x = x.permute(0, 2, 1)
     if padding == 'VALID':
@@ -33,7 +52,7 @@ def conv1d_transpose(x, filters, strides: int, padding: str, output_shape: Optio
                      num_filters: Optional[int] = None):
     if filter_shape is None:
         filter_shape = list(filters.shape[0:1])
-    filters = filters.permute(1, 2, 0)
+    filters = filters.permute(2, 1, 0)
     if data_format == 'NWC':
         x = x.permute(0, 2, 1)
     if padding == 'VALID':
@@ -43,7 +62,13 @@ def conv1d_transpose(x, filters, strides: int, padding: str, output_shape: Optio
     else:
         raise Exception('Invalid padding arg {}\n'
                         'Must be one of: "VALID" or "SAME"'.format(padding))
-    res = _torch.nn.functional.conv_transpose1d(x, filters, None, strides, padding_list, dilation=dilations)
+    if output_shape is None:
+        res = _torch.nn.functional.conv_transpose1d(x, filters, None, strides, padding_list, dilation=dilations)
+    else:
+        res = _torch.nn.functional.conv_transpose1d(x, filters, None, strides, 0, dilation=dilations)
+        spatial_output_shape = output_shape[1:-1] if data_format == 'NWC' else output_shape[2:]
+        res = _crop_to_output_shape(res, list(x.shape), filter_shape, strides, dilations, padding,
+                                    spatial_output_shape)
     return res.permute(0, 2, 1)
 
 
@@ -73,8 +98,8 @@ def conv2d_transpose(x, filters, strides: int, padding: str, output_shape: Optio
                      data_format: str = 'NHWC', dilations: int = 1, filter_shape: Optional[List[int]] = None,
                      num_filters: Optional[int] = None):
     if filter_shape is None:
-        filter_shape = list(filters.shape[0:1])
-    filters = filters.permute(2, 3, 0, 1)
+        filter_shape = list(filters.shape[0:2])
+    filters = filters.permute(3, 2, 0, 1)
     if data_format == 'NHWC':
         x = x.permute(0, 3, 1, 2)
     if padding == 'VALID':
@@ -84,7 +109,13 @@ def conv2d_transpose(x, filters, strides: int, padding: str, output_shape: Optio
     else:
         raise Exception('Invalid padding arg {}\n'
                         'Must be one of: "VALID" or "SAME"'.format(padding))
-    res = _torch.nn.functional.conv_transpose2d(x, filters, None, strides, padding_list, dilation=dilations)
+    if output_shape is None:
+        res = _torch.nn.functional.conv_transpose2d(x, filters, None, strides, padding_list, dilation=dilations)
+    else:
+        res = _torch.nn.functional.conv_transpose2d(x, filters, None, strides, 0, dilation=dilations)
+        spatial_output_shape = output_shape[1:-1] if data_format == 'NHWC' else output_shape[2:]
+        res = _crop_to_output_shape(res, list(x.shape), filter_shape, strides, dilations, padding,
+                                    spatial_output_shape)
     return res.permute(0, 2, 3, 1)
 
 
@@ -116,7 +147,7 @@ def conv3d(x, filters, strides: int, padding: str, data_format: str = 'NDHWC', d
            filter_shape: Optional[List[int]] = None, num_filters: Optional[int] = None):
     if filter_shape is None:
         filter_shape = list(filters.shape[0:3])
-    filters = filters.permute(3, 4, 0, 1, 2)
+    filters = filters.permute(4, 3, 0, 1, 2)
     if data_format == 'NDHWC':
         x = x.permute(0, 4, 1, 2, 3)
     if padding == 'VALID':
@@ -135,8 +166,8 @@ def conv3d_transpose(x, filters, strides: int, padding: str, output_shape: Optio
                      data_format: str = 'NDHWC', dilations: int = 1, filter_shape: Optional[List[int]] = None,
                      num_filters: Optional[int] = None):
     if filter_shape is None:
-        filter_shape = list(filters.shape[0:1])
-    filters = filters.permute(3, 4, 0, 1, 2)
+        filter_shape = list(filters.shape[0:3])
+    filters = filters.permute(4, 3, 0, 1, 2)
     if data_format == 'NDHWC':
         x = x.permute(0, 4, 1, 2, 3)
     if padding == 'VALID':
@@ -146,7 +177,13 @@ def conv3d_transpose(x, filters, strides: int, padding: str, output_shape: Optio
     else:
         raise Exception('Invalid padding arg {}\n'
                         'Must be one of: "VALID" or "SAME"'.format(padding))
-    res = _torch.nn.functional.conv_transpose3d(x, filters, None, strides, padding_list, dilation=dilations)
+    if output_shape is None:
+        res = _torch.nn.functional.conv_transpose3d(x, filters, None, strides, padding_list, dilation=dilations)
+    else:
+        res = _torch.nn.functional.conv_transpose3d(x, filters, None, strides, 0, dilation=dilations)
+        spatial_output_shape = output_shape[1:-1] if data_format == 'NDHWC' else output_shape[2:]
+        res = _crop_to_output_shape(res, list(x.shape), filter_shape, strides, dilations, padding,
+                                    spatial_output_shape)
     return res.permute(0, 2, 3, 4, 1)
 
 
@@ -0,0 +1,149 @@
+"""
+Opt-in tracer of ivy op execution, recording each top-level ivy call as a Chrome trace event, viewable in Perfetto or
+chrome://tracing, with enclosing spans for container operations.
+"""
+
+# global
+import os
+import json
+import time
+import threading
+
+# local
+from ivy.instrumentation import hooks, describe_inputs
+
+CONTAINER_METHODS = ['map', 'concat', 'stack', 'to_disk', 'from_disk']
+
+_tracers = list()
+_patched = list()
+_local = threading.local()
+
+
+# Container Spans #
+# ----------------#
+
+def _wrap_container_method(fn, name):
+
+    def _traced(*args, **kwargs):
+        active = _local.__dict__.setdefault('container_methods', set())
+        # recursive calls on sub-containers are covered by the span of the outermost call
+        if name in active or not _tracers:
+            return fn(*args, **kwargs)
+        active.add(name)
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            end = time.perf_counter()
+            active.remove(name)
+            for tracer in list(_tracers):
+                tracer._add_event('Container.' + name, 'container', start, end, dict())
+
+    _traced.__name__ = fn.__name__
+    _traced.__doc__ = fn.__doc__
+    _traced.__wrapped__ = fn
+    return _traced
+
+
+def _install_container_spans():
+    from ivy.core.container import Container
+    for name in CONTAINER_METHODS:
+        value = Container.__dict__[name]
+        if isinstance(value, staticmethod):
+            wrapped = staticmethod(_wrap_container_method(value.__func__, name))
+        else:
+            wrapped = _wrap_container_method(value, name)
+        setattr(Container, name, wrapped)
+        _patched.append((Container, name, value))
+
+
+def _uninstall_container_spans():
+    while _patched:
+        cls, name, value = _patched.pop(-1)
+        setattr(cls, name, value)
+
+
+# Tracer #
+# -------#
+
+class Tracer(hooks):
+
+    def __init__(self, filepath=None):
+        """
+        Context manager which records each top-level ivy call, being an ivy or backend function not called from within
+        another, as a Chrome trace event with the function name, backend, input shapes and dtypes, start and end
+        timestamps, and thread id. Calls to the container methods in CONTAINER_METHODS are recorded as enclosing spans.
+        Events are kept in the events attribute, and can be written with save.
+
+        :param filepath: File to write the trace to on exit. Default is to not write the trace.
+        :type filepath: str, optional
+        """
+        super(Tracer, self).__init__(self._pre_call, self._post_call)
+        self.events = list()
+        self._filepath = filepath
+        self._local = threading.local()
+        self._thread_names = dict()
+        self._start = None
+
+    def _add_event(self, name, category, start, end, args):
+        thread = threading.current_thread()
+        self._thread_names[thread.ident] = thread.name
+        # trace event timestamps are in microseconds
+        self.events.append({'name': name, 'cat': category, 'ph': 'X', 'ts': (start - self._start) * 1e6,
+                            'dur': (end - start) * 1e6, 'pid': os.getpid(), 'tid': thread.ident, 'args': args})
+
+    def _pre_call(self, layer, name, args, kwargs):
+        if layer == 'native':
+            return
+        depth = getattr(self._local, 'depth', 0)
+        if depth == 0:
+            self._local.backend = name.split('.')[1] if layer == 'backend' else None
+        elif self._local.backend is None and layer == 'backend':
+            # ivy functions dispatch to the backend inferred from their inputs
+            self._local.backend = name.split('.')[1]
+        self._local.depth = depth + 1
+
+    def _post_call(self, layer, name, args, kwargs, ret, start, end):
+        if layer == 'native':
+            return
+        self._local.depth -= 1
+        if self._local.depth == 0:
+            event_args = {'backend': self._local.backend}
+            event_args.update(describe_inputs(args, kwargs))
+            self._add_event(name, layer, start, end, event_args)
+
+    def trace(self):
+        """
+        Get the recorded trace, in the Chrome trace event format.
+
+        :return: Dict with the trace events, including metadata events naming each thread.
+        """
+        thread_events = [{'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': tid, 'args': {'name': name}}
+                         for tid, name in self._thread_names.items()]
+        return {'traceEvents': thread_events + sorted(self.events, key=lambda event: event['ts']),
+                'displayTimeUnit': 'ms'}
+
+    def save(self, filepath):
+        """
+        Write the recorded trace as Chrome trace event json, which can be opened in Perfetto or chrome://tracing.
+
+        :param filepath: File to write the trace to.
+        :type filepath: str
+        """
+        with open(filepath, 'w') as file:
+            file.write(json.dumps(self.trace()))
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        if not _tracers:
+            _install_container_spans()
+        _tracers.append(self)
+        return super(Tracer, self).__enter__()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        super(Tracer, self).__exit__(exc_type, exc_val, exc_tb)
+        _tracers.remove(self)
+        if not _tracers:
+            _uninstall_container_spans()
+        if self._filepath is not None:
+            self.save(self._filepath)
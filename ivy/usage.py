@@ -0,0 +1,146 @@
+"""
+Runtime profiler of ivy op usage, aggregating call counts, cumulative time and input shape histograms for each ivy
+function and backend, grouped by the library making the calls.
+"""
+
+# global
+import sys
+import csv
+import json
+import threading
+import collections
+
+# local
+from ivy.instrumentation import hooks, describe_inputs
+
+
+def _shapes_key(shapes):
+    # input shapes written as 2x3,2x3, with scalar for 0-dimensional inputs
+    return ','.join(['x'.join([str(dim) for dim in shape]) or 'scalar' for shape in shapes])
+
+
+def _calling_module():
+    frame = sys._getframe(2)
+    while frame is not None:
+        module_name = frame.f_globals.get('__name__', '')
+        if module_name != 'ivy' and not module_name.startswith('ivy.'):
+            return module_name
+        frame = frame.f_back
+    return ''
+
+
+class UsageProfiler(hooks):
+
+    def __init__(self, libs=None):
+        """
+        Context manager which records each top-level ivy call, being an ivy or backend function not called from within
+        another, with its backend, duration and input shapes. Calls are grouped by the library of the calling code.
+
+        :param libs: Libraries to group calls by, such as ['ivy_mech', 'ivy_vision'], each matching its submodules.
+                     Calls from other code are only included in the all group. Default is to group calls by the top
+                     level package of the calling module.
+        :type libs: sequence of strs, optional
+        """
+        super(UsageProfiler, self).__init__(self._pre_call, self._post_call)
+        self._libs = libs
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # (library, function name, backend) to count, cumulative time and shape histogram
+        self._stats = dict()
+
+    def _library(self, module_name):
+        if self._libs is None:
+            return module_name.split('.')[0]
+        for lib in self._libs:
+            if module_name == lib or module_name.startswith(lib + '.'):
+                return lib
+        return None
+
+    def _pre_call(self, layer, name, args, kwargs):
+        if layer == 'native':
+            return
+        depth = getattr(self._local, 'depth', 0)
+        if depth == 0:
+            self._local.library = self._library(_calling_module())
+            self._local.backend = name.split('.')[1] if layer == 'backend' else None
+        elif self._local.backend is None and layer == 'backend':
+            # ivy functions dispatch to the backend inferred from their inputs
+            self._local.backend = name.split('.')[1]
+        self._local.depth = depth + 1
+
+    def _post_call(self, layer, name, args, kwargs, ret, start, end):
+        if layer == 'native':
+            return
+        self._local.depth -= 1
+        if self._local.depth != 0:
+            return
+        key = (self._local.library, name.split('.')[-1], self._local.backend)
+        shapes_key = _shapes_key(describe_inputs(args, kwargs)['shapes'])
+        with self._lock:
+            stats = self._stats.setdefault(key, {'count': 0, 'time': 0., 'shapes': dict()})
+            stats['count'] += 1
+            stats['time'] += end - start
+            stats['shapes'][shapes_key] = stats['shapes'].get(shapes_key, 0) + 1
+
+    def usage(self):
+        """
+        Get the call count of each ivy function, for each library and for all calls.
+
+        :return: OrderedDict from library name, and lastly all, to an OrderedDict from function name to call count,
+                 sorted by decreasing count.
+        """
+        usage = dict()
+        for (library, method_name, _), stats in list(self._stats.items()):
+            for group in ([library] if library is not None else []) + ['all']:
+                group_dict = usage.setdefault(group, dict())
+                group_dict[method_name] = group_dict.get(method_name, 0) + stats['count']
+        groups = sorted([group for group in usage.keys() if group != 'all']) + (['all'] if usage else [])
+        return collections.OrderedDict([(group, collections.OrderedDict(
+            sorted(usage[group].items(), key=lambda item: -item[1]))) for group in groups])
+
+    def details(self):
+        """
+        Get the call count, cumulative time and input shape histogram of each ivy function for each backend, across
+        all libraries.
+
+        :return: OrderedDict from function name to a dict from backend to count, time in seconds and shapes, sorted by
+                 decreasing total time.
+        """
+        details = dict()
+        for (_, method_name, backend), stats in list(self._stats.items()):
+            backend_stats = details.setdefault(method_name, dict()).setdefault(
+                backend, {'count': 0, 'time': 0., 'shapes': dict()})
+            backend_stats['count'] += stats['count']
+            backend_stats['time'] += stats['time']
+            for shapes_key, count in stats['shapes'].items():
+                backend_stats['shapes'][shapes_key] = backend_stats['shapes'].get(shapes_key, 0) + count
+        return collections.OrderedDict(sorted(
+            details.items(), key=lambda item: -sum([stats['time'] for stats in item[1].values()])))
+
+    def save(self, json_filepath='library_usage.json', csv_filepath='library_usage.csv', details_filepath=None):
+        """
+        Write the call counts in the library usage layout, being json of the usage dict, and csv with a section for
+        each library of function name and count rows, followed by two empty rows.
+
+        :param json_filepath: File to write the usage json to. Default is library_usage.json.
+        :type json_filepath: str, optional
+        :param csv_filepath: File to write the usage csv to. Default is library_usage.csv.
+        :type csv_filepath: str, optional
+        :param details_filepath: File to also write the per backend times and shape histograms to, as json.
+                                 Default is to not write them.
+        :type details_filepath: str, optional
+        """
+        usage = self.usage()
+        with open(json_filepath, 'w+') as file:
+            file.write(json.dumps(usage, indent=4))
+        with open(csv_filepath, 'w+') as file:
+            csv_writer = csv.writer(file)
+            for lib_string, lib_dict in usage.items():
+                csv_writer.writerow([lib_string])
+                for method_name, count in lib_dict.items():
+                    csv_writer.writerow([method_name, str(count)])
+                csv_writer.writerow([''])
+                csv_writer.writerow([''])
+        if details_filepath is not None:
+            with open(details_filepath, 'w+') as file:
+                file.write(json.dumps(self.details(), indent=4))
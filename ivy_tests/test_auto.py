@@ -0,0 +1,82 @@
+"""
+Collection of tests for automatic backend selection
+"""
+
+# global
+import json
+import importlib
+import numpy as np
+
+# local
+import ivy
+import ivy.core.math as ivy_math
+import ivy.core.reductions as ivy_red
+import ivy_tests.helpers as helpers
+
+
+def test_auto_backend(tmp_path, dev_str, f, call):
+    if call is helpers.tf_graph_call:
+        # calls are routed eagerly
+        return
+    backend = f.__name__.split('.')[-1]
+    x = ivy.array([[0., 1.], [2., 3.]], 'float32', dev_str)
+    # calls are only routed while no framework is set
+    ivy.unset_framework()
+    try:
+        original_sin = ivy.sin
+        filepath = str(tmp_path / 'costs.json')
+        with ivy.auto_backend(filepath, ['numpy', backend], num_iterations=2) as auto:
+            ret = ivy.sin(x)
+            ret = ivy.sin(x)
+            assert ivy_math.sin is ivy.sin
+            ivy.atan2(x, ivy.cast(x, 'float64', f=f))
+            # calls with an explicit framework are not routed
+            ivy.cos(x, f=f)
+        # outputs are returned in the backend and on the device of the inputs
+        assert type(ret) is type(x)
+        dev = ivy.dev_str(x, f=f)
+        assert ivy.dev_str(ret, f=f) == dev
+        assert np.allclose(call(lambda: ret), np.sin(call(lambda: x)))
+        # costs are keyed by the device, and the dtype and shape of every input
+        key = 'sin|{}|{}|float32|2x2'.format(backend, dev)
+        assert sorted(auto.costs.keys()) == sorted([key, 'atan2|{}|{}|float32,float64|2x2,2x2'.format(backend, dev)])
+        assert sorted(auto.costs[key].keys()) == sorted(set(['numpy', backend]))
+        assert sum(auto.counts.values()) == 3
+        assert ivy.sin is original_sin
+        # the cost table persists between contexts
+        with open(filepath, 'r') as file:
+            assert key in json.loads(file.read())
+        with ivy.auto_backend(filepath, [backend]) as auto:
+            assert key in auto.costs
+            ret = ivy.sin(x)
+        assert auto.counts == {backend: 1}
+        assert np.allclose(call(lambda: ret), np.sin(call(lambda: x)))
+    finally:
+        ivy.set_framework(f)
+
+
+
+def test_auto_backend_gradients(dev_str, f, call):
+    backend = f.__name__.split('.')[-1]
+    if backend not in ['torch', 'tensorflow'] or call is helpers.tf_graph_call:
+        # gradients are checked for the eager autograd frameworks
+        return
+    x = ivy.array([[0., 1.], [2., 3.]], 'float32', dev_str)
+    ivy.unset_framework()
+    try:
+        with ivy.auto_backend(backends=['numpy']) as auto:
+            # calls on inputs which require gradients stay on the backend of the inputs, rather than being detached
+            if backend == 'torch':
+                x.requires_grad_()
+                ivy_red.reduce_sum(ivy_math.sin(x)).backward()
+                grad = x.grad
+            else:
+                tf = importlib.import_module('tensorflow')
+                with tf.GradientTape() as tape:
+                    tape.watch(x)
+                    y = ivy_red.reduce_sum(ivy_math.sin(x))
+                grad = tape.gradient(y, x)
+        assert auto.costs == dict()
+        assert np.allclose(call(lambda: grad), np.cos(call(lambda: x)))
+    finally:
+        ivy.set_framework(f)
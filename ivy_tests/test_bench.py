@@ -0,0 +1,206 @@
+"""
+Collection of tests for cross-backend benchmarking
+"""
+
+# global
+import csv
+import json
+import pytest
+import numpy as np
+
+# local
+import ivy.bench
+import ivy_tests.helpers as helpers
+from ivy.bench.cli import main, compare_main, compile_main
+
+
+def test_summarise(dev_str, f, call):
+    times = np.arange(1, 101) / 1000
+    summary = ivy.bench.summarise(times, [5, 95])
+    assert np.allclose(summary['median'], np.median(times))
+    assert np.allclose(summary['p5'], np.percentile(times, 5))
+    assert np.allclose(summary['p95'], np.percentile(times, 95))
+    assert summary['min'] <= summary['median_ci_low'] <= summary['median'] <= summary['median_ci_high'] <=\
+        summary['max']
+    assert summary == ivy.bench.summarise(times, [5, 95])
+
+
+def test_mann_whitney_u(dev_str, f, call):
+    times = np.random.RandomState(0).uniform(1., 2., 50)
+    u, p_value = ivy.bench.mann_whitney_u(times, times)
+    assert u == 50 * 50 / 2 and p_value == 1.
+    _, p_value = ivy.bench.mann_whitney_u(times, times + 0.5)
+    assert p_value < 1e-6
+    # ties across the two samples share their mean rank
+    u, _ = ivy.bench.mann_whitney_u([1., 2., 2.], [2., 3.])
+    assert u == 1.
+
+
+@pytest.mark.parametrize(
+    "op", ['sin', 'matmul', 'concatenate'])
+@pytest.mark.parametrize(
+    "batch_shape", [(), (2,)])
+def test_benchmark(op, batch_shape, dev_str, f, call):
+    if call is helpers.tf_graph_call:
+        # benchmarks are run eagerly
+        pytest.skip()
+    result = ivy.bench.benchmark(op, f, 16, 'float32', batch_shape, num_warmup=1, num_iterations=5, dev_str=dev_str)
+    assert result['op'] == op
+    assert result['backend'] == f.__name__.split('.')[-1]
+    assert result['batch_shape'] == list(batch_shape)
+    assert 0 < result['min'] <= result['median'] <= result['max']
+    assert 0 <= result['native_median']
+    assert 0 <= result['overhead_median'] <= result['median']
+    assert 0 <= result['overhead_fraction'] <= 1
+    inputs = ivy.bench.make_inputs(op, f, 16, 'float32', batch_shape, dev_str)
+    assert tuple(inputs[0].shape[:len(batch_shape)]) == batch_shape
+
+
+def test_sweep_and_crossovers(dev_str, f, call):
+    if call is helpers.tf_graph_call:
+        # benchmarks are run eagerly
+        pytest.skip()
+    backend = f.__name__.split('.')[-1]
+    results = ivy.bench.sweep(['sin'], [backend], [1, 1000], num_warmup=1, num_iterations=3)
+    assert [result['size'] for result in results] == [1, 1000]
+    crossovers = ivy.bench.overhead_crossovers(results, threshold=np.inf)
+    assert crossovers == [{'op': 'sin', 'backend': backend, 'dtype': 'float32', 'batch_shape': [],
+                           'num_threads': None, 'crossover_size': 1}]
+    crossovers = ivy.bench.overhead_crossovers(results, threshold=0.)
+    assert crossovers[0]['crossover_size'] is None
+    # failing combinations are reported rather than raised
+    results = ivy.bench.sweep(['sin'], [backend], [4], ['not_a_dtype'], num_warmup=1, num_iterations=3)
+    assert len(results) == 1 and 'error' in results[0]
+
+
+def test_thread_sweep_and_layouts(dev_str, f, call):
+    if call is helpers.tf_graph_call:
+        # benchmarks are run eagerly
+        pytest.skip()
+    backend = f.__name__.split('.')[-1]
+    results = ivy.bench.sweep(['sin'], [backend], [100], num_warmup=1, num_iterations=3, thread_counts=[1, 2])
+    assert [result['num_threads'] for result in results] == [1, 2]
+    layouts = ivy.bench.thread_layouts(results, num_cores=4)
+    assert len(layouts) == 1
+    layout = layouts[0]
+    assert layout['num_threads'] * layout['num_processes'] == 4
+    assert layout['throughput'] > 0
+    # thread counts above the number of cores are left out
+    assert ivy.bench.thread_layouts(results, num_cores=1)[0]['num_threads'] == 1
+    # results without thread counts have no layouts
+    assert ivy.bench.thread_layouts(ivy.bench.sweep(['sin'], [backend], [100], num_warmup=1, num_iterations=3)) == []
+
+
+def test_cli(tmp_path, capsys, dev_str, f, call):
+    if call is helpers.tf_graph_call:
+        # benchmarks are run eagerly
+        pytest.skip()
+    backend = f.__name__.split('.')[-1]
+    json_path = str(tmp_path / 'results.json')
+    main(['--ops', 'sin,reduce_sum', '--backends', backend, '--sizes', '1,1e2', '--batch_shapes', 'none,2x3',
+          '--warmup', '1', '--iterations', '3', '-o', json_path])
+    with open(json_path, 'r') as file:
+        results = json.loads(file.read())
+    assert len(results) == 8
+    assert sorted(set(tuple(result['batch_shape']) for result in results)) == [(), (2, 3)]
+    csv_path = str(tmp_path / 'results.csv')
+    main(['--ops', 'sin', '--backends', backend, '--sizes', '10', '--iterations', '3', '-o', csv_path])
+    with open(csv_path, 'r') as file:
+        rows = list(csv.DictReader(file))
+    assert len(rows) == 1
+    assert rows[0]['batch_shape'] == 'none'
+    assert 'times' not in rows[0]
+    assert float(rows[0]['median_ci_low']) <= float(rows[0]['median']) <= float(rows[0]['median_ci_high'])
+    capsys.readouterr()
+    # without an output file, the results are written to stdout, and the crossovers to stderr
+    main(['--ops', 'sin', '--backends', backend, '--sizes', '10', '--iterations', '3'])
+    captured = capsys.readouterr()
+    assert len(json.loads(captured.out)) == 1
+    assert 'sin {} float32 batch none: overhead'.format(backend) in captured.err
+
+
+def _stored_result(op, size, times, backend_version='1.0'):
+    result = {'op': op, 'backend': 'numpy', 'backend_version': backend_version, 'size': size, 'dtype': 'float32',
+              'batch_shape': [2], 'mode': 'eager', 'times': list(times), 'overhead_median': 0.}
+    result.update(ivy.bench.summarise(times))
+    return result
+
+
+def test_result_store(tmp_path, dev_str, f, call):
+    rng = np.random.RandomState(0)
+    base_times = rng.uniform(1., 1.1, 100)
+    db_path = str(tmp_path / 'results.db')
+    with ivy.bench.ResultStore(db_path) as store:
+        assert store.add([_stored_result('sin', 10, base_times), _stored_result('exp', 10, base_times),
+                          _stored_result('tanh', 10, base_times), {'op': 'cos', 'error': 'Exception'}], 'rev0') == 3
+        store.add([_stored_result('sin', 10, base_times * 1.5, '1.1'), _stored_result('exp', 10, base_times / 1.5),
+                   _stored_result('tanh', 10, rng.permutation(base_times)), _stored_result('sin', 20, base_times)],
+                  'rev1')
+    with ivy.bench.ResultStore(db_path) as store:
+        assert store.revisions() == ['rev0', 'rev1']
+        baseline = store.query('rev0')
+        current = store.query('rev1')
+        assert len(baseline) == 3 and len(current) == 4
+        assert store.query('rev1', op='sin', size=10, batch_shape=(2,))[0]['backend_version'] == '1.1'
+        assert np.allclose(store.query('rev0', op='sin')[0]['times'], base_times)
+    comparisons = ivy.bench.compare(baseline, current, threshold=0.05, alpha=0.01)
+    assert [(c['op'], c['status']) for c in comparisons] == [('sin', 'regression'), ('tanh', 'unchanged'),
+                                                             ('exp', 'improvement')]
+    assert comparisons[0]['baseline_version'] == '1.0' and comparisons[0]['current_version'] == '1.1'
+    assert 'Regressions: 1' in ivy.bench.format_report(comparisons)
+    # a regression gives a non-zero exit status, and the current revision defaults to the latest
+    json_path = str(tmp_path / 'comparisons.json')
+    assert compare_main(['--store', db_path, '--baseline', 'rev0', '-o', json_path]) == 1
+    with open(json_path, 'r') as file:
+        assert len(json.loads(file.read())) == 3
+    assert compare_main(['--store', db_path, '--baseline', 'rev0', '--ops', 'exp,tanh']) == 0
+
+
+def test_profile_memory(tmp_path, dev_str, f, call):
+    if call is helpers.tf_graph_call:
+        # memory is profiled eagerly
+        pytest.skip()
+    backend = f.__name__.split('.')[-1]
+    result = ivy.bench.profile_memory('concatenate', f, 1000, 'float32', (2,), dev_str=dev_str)
+    assert result['output_bytes'] == 2 * 2000 * 4
+    assert result['rss_peak_delta'] >= 0 and result['tracemalloc_peak'] >= 0
+    assert ('torch_peak' in result) == (backend == 'torch')
+    if backend in ['numpy', 'torch']:
+        # the allocator sees at least the output being allocated
+        assert result['peak_bytes'] >= result['output_bytes']
+    assert result['bytes_per_output_byte'] == result['peak_bytes'] / result['output_bytes']
+    results = ivy.bench.memory_sweep(['sin', 'concatenate'], [backend], [10, 100]) + [{'op': 'cos', 'error': ''}]
+    ranked = ivy.bench.rank_by_allocation(results)
+    assert len(ranked) == 4
+    assert [r['bytes_per_output_byte'] for r in ranked] == sorted([r['bytes_per_output_byte'] for r in ranked],
+                                                                   reverse=True)
+    assert len(ivy.bench.format_memory_report(results, 2).split('\n')) == 4
+    json_path = str(tmp_path / 'memory.json')
+    main(['--memory', '--ops', 'sin', '--backends', backend, '--sizes', '10', '-o', json_path])
+    with open(json_path, 'r') as file:
+        assert 'peak_bytes' in json.loads(file.read())[0]
+
+
+def test_break_even_calls(dev_str, f, call):
+    # compiling costs 10 more than the first eager call, and saves 2 on each later call
+    assert ivy.bench.break_even_calls(1., 3., 11., 1.) == 6
+    assert ivy.bench.break_even_calls(1., 3., 0.5, 1.) == 1
+    assert ivy.bench.break_even_calls(1., 3., 11., 3.) is None
+
+
+def test_compile_matrix(tmp_path, dev_str, f, call):
+    if call is helpers.tf_graph_call:
+        # compiling is benchmarked from eager mode
+        pytest.skip()
+    backend = f.__name__.split('.')[-1]
+    results = ivy.bench.compile_matrix(['sin', 'mlp'], [backend], [16], num_iterations=3, dev_str=dev_str)
+    assert [result['op'] for result in results] == ['sin', 'mlp']
+    for result in results:
+        assert 'error' not in result
+        assert result['compile_latency'] == result['compile_time'] + result['compiled_first']
+        assert result['eager_median'] > 0 and result['compiled_median'] > 0
+        assert result['break_even_calls'] is None or result['break_even_calls'] >= 1
+    json_path = str(tmp_path / 'compile.json')
+    compile_main(['--ops', 'sin', '--backends', backend, '--sizes', '16', '--iterations', '3', '-o', json_path])
+    with open(json_path, 'r') as file:
+        assert len(json.loads(file.read())) == 1
@@ -2,12 +2,14 @@
 import os
 import pytest
 import random
+import multiprocessing
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 # local
 import ivy
 import ivy_tests.helpers as helpers
-from ivy.core.container import Container
+from ivy.core.container import Container, ContainerBuffer
 
 
 def test_container_from_dict(dev_str, call):
@@ -35,6 +37,100 @@ def test_container_expand_dims(dev_str, call):
     assert (container_expanded_dims.b.d == ivy.array([[3]]))[0, 0]
 
 
+def test_container_unstack(dev_str, call):
+    dict_in = {'a': ivy.array([[1., 2.], [3., 4.], [5., 6.]]),
+               'b': {'c': ivy.array([1, 2, 3]), 'd': ivy.array([[[1.]], [[2.]], [[3.]]])}}
+    container = Container(dict_in)
+    containers = container.unstack(0)
+    assert len(containers) == 3
+    for i, cont in enumerate(containers):
+        assert np.allclose(call(lambda x: x, cont.a), np.array([2. * i + 1., 2. * i + 2.]))
+        assert np.allclose(call(lambda x: x, cont.b.c), np.array(i + 1))
+        assert np.allclose(call(lambda x: x, cont.b.d), np.array([[i + 1.]]))
+
+    # leaves which are not arrays are repeated in each container
+    containers = Container({'a': ivy.array([1., 2.]), 'b': {'c': 'label', 'd': None}}).unstack(0)
+    assert len(containers) == 2
+    for i, cont in enumerate(containers):
+        assert np.allclose(call(lambda x: x, cont.a), np.array(i + 1.))
+        assert cont.b.c == 'label'
+        assert cont.b.d is None
+
+    # array leaves which cannot be unstacked raise, rather than being repeated
+    with pytest.raises(Exception):
+        Container({'a': ivy.array([[1., 2.], [3., 4.], [5., 6.]]), 'b': ivy.array([1., 2., 3.])}).unstack(1)
+
+
+def test_container_concat(dev_str, call):
+    container0 = Container({'a': ivy.array([[1., 2.]]), 'b': {'c': ivy.array([3.]), 'd': ivy.array(4.)}})
+    container1 = Container({'a': ivy.array([[5., 6.], [7., 8.]]), 'b': {'c': ivy.array([9.]), 'd': ivy.array(10.)}})
+    container_concatenated = Container.concat([container0, container1], 0)
+    assert np.allclose(call(lambda x: x, container_concatenated.a), np.array([[1., 2.], [5., 6.], [7., 8.]]))
+    assert np.allclose(call(lambda x: x, container_concatenated.b.c), np.array([3., 9.]))
+    assert np.allclose(call(lambda x: x, container_concatenated.b.d), np.array([4., 10.]))
+
+    # inner dimensions
+    container0 = Container({'a': ivy.array([[1., 2.], [4., 5.]]), 'b': ivy.array(1.)})
+    container1 = Container({'a': ivy.array([[3.], [6.]]), 'b': ivy.array(2.)})
+    container_concatenated = Container.concat([container0, container1], -1)
+    assert np.allclose(call(lambda x: x, container_concatenated.a), np.array([[1., 2., 3.], [4., 5., 6.]]))
+    assert np.allclose(call(lambda x: x, container_concatenated.b), np.array([1., 2.]))
+
+    # mismatched inner dimensions raise rather than being broadcast into place
+    container0 = Container({'a': ivy.array([[1., 2., 3.], [4., 5., 6.]])})
+    container1 = Container({'a': ivy.array([[7.], [8.]])})
+    with pytest.raises(Exception):
+        Container.concat([container0, container1], 0)
+
+    # gradients flow through the concatenation, which is not written into place while they are recorded
+    func = lambda xs_in: ivy.reduce_sum(Container.concat([Container({'a': xs_in['w0']}),
+                                                          Container({'a': xs_in['w1'] * 2.})], 0).a)
+    xs = Container({'w0': ivy.variable(ivy.array([1., 2.])), 'w1': ivy.variable(ivy.array([3.]))})
+    y, dydxs = call(ivy.execute_with_gradients, func, xs)
+    assert np.allclose(y, np.array(9.))
+    if call is not helpers.np_call:
+        assert np.allclose(ivy.to_numpy(dydxs['w0']), np.array([1., 1.]))
+        assert np.allclose(ivy.to_numpy(dydxs['w1']), np.array([2.]))
+
+
+def test_container_buffer(dev_str, call):
+    if call is helpers.tf_graph_call:
+        # container buffers require eager execution
+        pytest.skip()
+    buffer = ContainerBuffer(initial_capacity=2)
+    for i in range(5):
+        buffer.append(Container({'a': ivy.array([[float(i), float(i)], [float(i), float(i)]]),
+                                 'b': {'c': ivy.array([i, i])}}))
+        assert buffer.size == 2 * (i + 1)
+    data = buffer.data
+    # the data is cached until the next append
+    assert buffer.data is data
+    assert np.allclose(call(lambda x: x, data.a), np.array([[i, i] for i in range(5) for _ in range(2)]))
+    assert np.array_equal(call(lambda x: x, data.b.c), np.array([i for i in range(5) for _ in range(2)]))
+    buffer.clear()
+    assert buffer.size == 0
+    buffer.append(Container({'a': ivy.array([[5., 5.]]), 'b': {'c': ivy.array([5])}}))
+    assert buffer.data is not data
+    assert np.allclose(call(lambda x: x, buffer.data.a), np.array([[5., 5.]]))
+    # mismatched batches raise rather than being broadcast into the storage, or on reading for immutable frameworks
+    with pytest.raises(Exception):
+        buffer.append(Container({'a': ivy.array([[6.]]), 'b': {'c': ivy.array([6])}}))
+        _ = buffer.data
+
+
+def test_container_stack(dev_str, call):
+    containers = [Container({'a': ivy.array([1., 2.]), 'b': {'c': ivy.array([3.])}}),
+                  Container({'a': ivy.array([4., 5.]), 'b': {'c': ivy.array([6.])}})]
+    container_stacked = Container.stack(containers, 0)
+    assert np.allclose(call(lambda x: x, container_stacked.a), np.array([[1., 2.], [4., 5.]]))
+    assert np.allclose(call(lambda x: x, container_stacked.b.c), np.array([[3.], [6.]]))
+
+    # round trip with unstack
+    containers_unstacked = container_stacked.unstack(0)
+    assert np.allclose(call(lambda x: x, containers_unstacked[1].a), np.array([4., 5.]))
+    assert np.allclose(call(lambda x: x, containers_unstacked[1].b.c), np.array([6.]))
+
+
 def test_container_at_key_chain(dev_str, call):
     dict_in = {'a': ivy.array([1]),
                'b': {'c': ivy.array([2]), 'd': ivy.array([3])}}
@@ -102,16 +198,26 @@ def test_container_prune_empty(dev_str, call):
 
 
 def test_container_shuffle(dev_str, call):
-    if call is helpers.tf_graph_call:
-        # tf.random.set_seed is not compiled. The shuffle is then not aligned between container items.
-        pytest.skip()
     dict_in = {'a': ivy.array([1, 2, 3]),
                'b': {'c': ivy.array([1, 2, 3]), 'd': ivy.array([1, 2, 3])}}
     container = Container(dict_in)
+    if call is helpers.mx_call:
+        # mxnet has no explicit PRNG keys, so the permutation is drawn from the seeded global random state
+        container_shuffled = container.shuffle(0)
+        assert np.array_equal(call(lambda x: x, container.shuffle(0).a), call(lambda x: x, container_shuffled.a))
+        shuffled_data = call(lambda x: x, container_shuffled.a)
+        assert np.array_equal(np.sort(shuffled_data), np.array([1, 2, 3]))
+        assert np.array_equal(call(lambda x: x, container_shuffled.b.c), shuffled_data)
+        assert np.array_equal(call(lambda x: x, container_shuffled.b.d), shuffled_data)
+        return
+    ivy.core.random.seed(1)
+    state = ivy.core.random.random_uniform(0., 1., [4])
+    ivy.core.random.seed(1)
     container_shuffled = container.shuffle(0)
+    # the global random state is left alone
+    assert np.allclose(call(lambda x: x, ivy.core.random.random_uniform(0., 1., [4])), call(lambda x: x, state))
     data = ivy.array([1, 2, 3])
-    ivy.core.random.seed()
-    shuffled_data = ivy.core.random.shuffle(data)
+    shuffled_data = ivy.core.random.shuffle(data, ivy.core.random.prng_key(0))
 
     assert np.array(container_shuffled['a'] == shuffled_data).all()
     assert np.array(container_shuffled.a == shuffled_data).all()
@@ -121,6 +227,34 @@ def test_container_shuffle(dev_str, call):
     assert np.array(container_shuffled.b.d == shuffled_data).all()
 
 
+def test_container_shuffle_aligned(dev_str, call):
+    dict_in = {'a': ivy.array([0., 1., 2., 3.]),
+               'b': {'c': ivy.array([[0., 0.], [1., 1.], [2., 2.], [3., 3.]]), 'd': ivy.array([0, 1, 2, 3])}}
+    container = Container(dict_in)
+    permutation = container.batch_permutation(0)
+    container_shuffled = container.shuffle(permutation=permutation)
+    expected = call(lambda x: x, ivy.cast(permutation, 'float32'))
+
+    # leaves stay aligned
+    assert np.allclose(call(lambda x: x, container_shuffled.a), expected)
+    assert np.allclose(call(lambda x: x, container_shuffled.b.c), np.stack([expected] * 2, -1))
+    assert np.allclose(call(lambda x: x, container_shuffled.b.d), expected)
+
+    # the permutation is reusable across containers
+    other_shuffled = Container({'e': ivy.array([0., 1., 2., 3.])}).shuffle(permutation=permutation)
+    assert np.allclose(call(lambda x: x, other_shuffled.e), expected)
+
+    # the input container is not modified, unless shuffled in place
+    assert np.allclose(call(lambda x: x, container.a), np.array([0., 1., 2., 3.]))
+    container.shuffle(permutation=permutation, in_place=True)
+    assert np.allclose(call(lambda x: x, container.a), expected)
+
+    # unseeded permutations are drawn from the full seed range, rather than from a few distinct seeds
+    container = Container({'a': ivy.arange(20)})
+    permutations = [tuple(call(lambda x: x, container.batch_permutation()).tolist()) for _ in range(100)]
+    assert len(set(permutations)) == 100
+
+
 def test_container_to_iterator(dev_str, call):
     dict_in = {'a': ivy.array([1]),
                'b': {'c': ivy.array([2]), 'd': ivy.array([3])}}
@@ -141,14 +275,48 @@ def test_container_map(dev_str, call):
         assert call(lambda x: x, value) == call(lambda x: x, expected_value)
 
 
+def test_container_map_parallel(dev_str, call):
+    dict_in = {'a': ivy.array([1.]),
+               'b': {'c': ivy.array([2.]), 'd': ivy.array([3.])}}
+    container = Container(dict_in)
+    container_mapped = container.map(lambda x, kc: (x + 1, kc), parallel=True, min_parallel_size=0)
+    assert list(container_mapped.keys()) == ['a', 'b']
+    assert list(container_mapped.b.keys()) == ['c', 'd']
+    for (key, (value, key_chain)), expected_value, expected_key_chain in zip(
+            container_mapped.to_iterator(), [2., 3., 4.], ['a', 'b/c', 'b/d']):
+        assert np.allclose(call(lambda x: x, value), np.array([expected_value]))
+        assert key_chain == expected_key_chain
+
+    # nested parallel maps are run serially, rather than waiting on the executor from one of its own threads
+    executor = ThreadPoolExecutor(max_workers=1)
+    container_mapped = container.map(
+        lambda x, _: Container({'y': x}).map(lambda y, _: y + 1, parallel=True, executor=executor,
+                                             min_parallel_size=0).y, parallel=True, executor=executor,
+        min_parallel_size=0)
+    executor.shutdown()
+    assert np.allclose(call(lambda x: x, container_mapped.b.d), np.array([4.]))
+
+
 def test_container_to_random(dev_str, call):
     dict_in = {'a': ivy.array([1.]),
                'b': {'c': ivy.array([2.]), 'd': ivy.array([3.])}}
     container = Container(dict_in)
-    random_container = container.to_random()
-    for (key, value), orig_value in zip(random_container.to_iterator(),
-                                        [ivy.array([2]), ivy.array([3]), ivy.array([4])]):
-        assert call(ivy.shape, value) == call(ivy.shape, orig_value)
+    for random_container in [container.to_random(), container.to_random(parallel=True)]:
+        for (key, value), orig_value in zip(random_container.to_iterator(),
+                                            [ivy.array([2]), ivy.array([3]), ivy.array([4])]):
+            assert call(ivy.shape, value) == call(ivy.shape, orig_value)
+    if call is helpers.mx_call:
+        # mxnet does not support explicit prng keys
+        return
+    # each entry is drawn from its own key, so entries drawn in parallel differ, and the same key gives the same values
+    container = Container(dict([(str(i), ivy.array([0., 0., 0.])) for i in range(8)]))
+    random_container = container.to_random(parallel=True)
+    values = [call(lambda x: x, value) for _, value in random_container.to_iterator()]
+    assert all([not np.array_equal(values[0], value) for value in values[1:]])
+    key = ivy.prng_key(0)
+    random_container = container.to_random(parallel=True, key=key)
+    assert np.array_equal(call(lambda x: x, random_container['3']),
+                          call(lambda x: x, container.to_random(key=key)['3']))
 
 
 def test_container_dtype(dev_str, call):
@@ -170,12 +338,13 @@ def test_container_with_entries_as_lists(dev_str, call):
     dict_in = {'a': ivy.array([1]),
                'b': {'c': ivy.array([2.]), 'd': 'some string'}}
     container = Container(dict_in)
-    container_w_list_entries = container.with_entries_as_lists()
-    for (key, value), expected_value in zip(container_w_list_entries.to_iterator(),
-                                            [[1],
-                                             [2.],
-                                             'some string']):
-        assert value == expected_value
+    for container_w_list_entries in [container.with_entries_as_lists(),
+                                     container.with_entries_as_lists(parallel=True)]:
+        for (key, value), expected_value in zip(container_w_list_entries.to_iterator(),
+                                                [[1],
+                                                 [2.],
+                                                 'some string']):
+            assert value == expected_value
 
 
 def test_container_to_and_from_disk(dev_str, call):
@@ -225,6 +394,213 @@ def test_container_to_and_from_disk(dev_str, call):
     os.remove(save_filepath)
 
 
+def test_container_pack_and_unpack(dev_str, call):
+    dict_in = {'a': ivy.array([[1., 2.], [3., 4.]]),
+               'b': {'c': ivy.array([1, 2, 3]), 'd': ivy.array([5.])}}
+    container = Container(dict_in)
+
+    # packing
+    buffers, layout = container.pack()
+    assert [leaf[0] for leaf in layout['leaves']] == ['a', 'b/c', 'b/d']
+    assert np.allclose(call(lambda x: x, buffers[ivy.dtype_str(container.a)]), np.array([1., 2., 3., 4., 5.]))
+    assert np.array_equal(call(lambda x: x, buffers[ivy.dtype_str(container.b.c)]), np.array([1, 2, 3]))
+
+    # unpacking
+    unpacked_container = Container.unpack(buffers, layout)
+    assert np.allclose(call(lambda x: x, unpacked_container.a), np.array([[1., 2.], [3., 4.]]))
+    assert np.array_equal(call(lambda x: x, unpacked_container.b.c), np.array([1, 2, 3]))
+    assert np.allclose(call(lambda x: x, unpacked_container.b.d), np.array([5.]))
+
+    # packing again with the same layout
+    buffers, layout = container.map(lambda x, _: x * 2).pack(layout, buffers)
+    assert np.allclose(call(lambda x: x, Container.unpack(buffers, layout).a), np.array([[2., 4.], [6., 8.]]))
+
+
+def test_container_to_and_from_shared_memory(dev_str, call):
+    if call in [helpers.tf_graph_call]:
+        # container shared memory transport requires eager execution
+        pytest.skip()
+    dict_in = {'a': ivy.array([[1., 2.], [3., 4.]]),
+               'b': {'c': ivy.array([1, 2, 3]), 'd': ivy.array(True)}}
+    container = Container(dict_in)
+
+    # saving
+    handle = container.to_shared_memory()
+    assert [leaf[0] for leaf in handle['leaves']] == ['a', 'b/c', 'b/d']
+
+    # loading
+    loaded_container = Container.from_shared_memory(handle)
+    assert np.array_equal(loaded_container.a, call(lambda x: x, container.a))
+    assert np.array_equal(loaded_container.b.c, call(lambda x: x, container.b.c))
+    assert np.array_equal(loaded_container.b.d, call(lambda x: x, container.b.d))
+    assert loaded_container.b.d.shape == ()
+
+    # the block is unlinked once loaded
+    with pytest.raises(FileNotFoundError):
+        Container.from_shared_memory(handle)
+
+    # unlinking a block which will not be loaded
+    handle = container.to_shared_memory()
+    Container.unlink_shared_memory(handle)
+    with pytest.raises(FileNotFoundError):
+        Container.from_shared_memory(handle)
+
+
+def _load_shared_memory_in_child(handle):
+    import gc
+    loaded_container = Container.from_shared_memory(handle)
+    values = (loaded_container.a.tolist(), loaded_container.b.c.tolist())
+
+    def _num_mappings():
+        # the block stays mapped, as a deleted file, until the last of the loaded arrays is released
+        with open('/proc/self/maps', 'r') as maps_file:
+            return len([line for line in maps_file if handle['name'].strip('/') in line])
+    num_mappings_before = _num_mappings()
+    del loaded_container
+    gc.collect()
+    return values, num_mappings_before, _num_mappings()
+
+
+def test_container_shared_memory_across_processes(dev_str, call):
+    if call in [helpers.tf_graph_call]:
+        # container shared memory transport requires eager execution
+        pytest.skip()
+    if not os.path.exists('/proc/self/maps'):
+        # the mappings of the child process are inspected through procfs
+        pytest.skip()
+    container = Container({'a': ivy.array([[1., 2.], [3., 4.]]), 'b': {'c': ivy.array([1, 2, 3])}})
+    handle = container.to_shared_memory()
+
+    # the block is loaded in a fresh process
+    with multiprocessing.get_context('spawn').Pool(1) as pool:
+        (a, c), num_mappings_before, num_mappings_after = pool.apply(_load_shared_memory_in_child, (handle,))
+    assert np.array_equal(np.array(a), call(lambda x: x, container.a))
+    assert np.array_equal(np.array(c), call(lambda x: x, container.b.c))
+
+    # the block is freed once the child releases its arrays
+    assert num_mappings_before == 1
+    assert num_mappings_after == 0
+    with pytest.raises(FileNotFoundError):
+        Container.from_shared_memory(handle)
+
+
+def test_container_to_and_from_flat_file(dev_str, call):
+    if call in [helpers.tf_graph_call]:
+        # container flat file saving requires eager execution
+        pytest.skip()
+    save_filepath = 'container_on_disk.bin'
+    dict_in = {'a': ivy.array([[1., 2.], [3., 4.]]),
+               'b': {'c': ivy.array([1, 2, 3]), 'd': ivy.array(True)}}
+    container = Container(dict_in)
+
+    # saving
+    container.to_flat_file(save_filepath)
+    assert os.path.exists(save_filepath)
+    assert os.path.exists(save_filepath + '.json')
+
+    # loading, with each array converted to the active framework on access
+    loaded_container = Container.from_flat_file(save_filepath)
+    assert loaded_container.size == 2
+    assert not isinstance(dict.__getitem__(loaded_container, 'a'), type(container.a))
+    if call is helpers.np_call:
+        # numpy arrays are memory-mapped views
+        assert isinstance(loaded_container.a, np.memmap)
+    else:
+        assert isinstance(loaded_container.a, type(container.a))
+    assert isinstance(loaded_container.b.c, type(container.b.c))
+    assert np.array_equal(call(lambda x: x, loaded_container.a), call(lambda x: x, container.a))
+    assert np.array_equal(call(lambda x: x, loaded_container.b.c), call(lambda x: x, container.b.c))
+    assert np.array_equal(call(lambda x: x, loaded_container.slice(slice(1, 2)).b.c), np.array([2]))
+    assert np.array_equal(call(lambda x: x, loaded_container.b.d), call(lambda x: x, container.b.d))
+    assert tuple(loaded_container.b.d.shape) == ()
+
+    del loaded_container
+    os.remove(save_filepath)
+    os.remove(save_filepath + '.json')
+
+
+def test_container_from_disk_lazy(dev_str, call):
+    if call in [helpers.tf_graph_call]:
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = 'container_on_disk.hdf5'
+    dict_in = {'a': ivy.array([1., 2., 3.]),
+               'b': {'c': ivy.array([4., 5., 6.]), 'd': ivy.array([7., 8., 9.])}}
+    container = Container(dict_in)
+    container.to_disk(save_filepath, mode='w')
+
+    # loading
+    loaded_container = Container.from_disk(save_filepath, lazy=True)
+    assert loaded_container.size == 3
+
+    # pruning and querying without reading
+    pruned_container = loaded_container.prune_key_chain('b/c')
+    assert list(pruned_container.b.keys()) == ['d']
+    assert not isinstance(dict.__getitem__(pruned_container.b, 'd'), type(call(lambda x: x, container.a)))
+
+    # reading on access, slicing and mapping
+    assert np.allclose(call(lambda x: x, loaded_container.a), np.array([1., 2., 3.]))
+    assert np.allclose(call(lambda x: x, loaded_container.slice(slice(1, 3)).b.c), np.array([5., 6.]))
+    assert np.allclose(call(lambda x: x, loaded_container.map(lambda x, _: x * 2).b.d), np.array([14., 16., 18.]))
+
+    os.remove(save_filepath)
+
+
+def test_container_incremental_checkpoint(tmp_path, dev_str, call):
+    if call in [helpers.tf_graph_call]:
+        # container checkpointing requires eager execution
+        pytest.skip()
+    # a fresh directory for each run, as checkpoints left over from a previous run would be extended
+    save_dir = str(tmp_path / 'container_checkpoint')
+    container = Container({'a': ivy.array([1., 2., 3.]),
+                           'b': {'c': ivy.array([4., 5., 6.]), 'd': ivy.array([7., 8., 9.])}})
+
+    # first checkpoint writes everything
+    assert container.to_incremental_checkpoint(save_dir) == ['a', 'b/c', 'b/d']
+
+    # only changed arrays are written
+    container = Container({'a': container.a, 'b': {'c': container.b.c * 2, 'd': container.b.d}})
+    assert container.to_incremental_checkpoint(save_dir) == ['b/c']
+    assert container.to_incremental_checkpoint(save_dir) == []
+
+    # loading composes the layers
+    loaded_container = Container.from_incremental_checkpoint(save_dir)
+    assert np.allclose(loaded_container.a, np.array([1., 2., 3.]))
+    assert np.allclose(loaded_container.b.c, np.array([8., 10., 12.]))
+    assert np.allclose(loaded_container.b.d, np.array([7., 8., 9.]))
+
+    # compaction
+    Container.compact_incremental_checkpoint(save_dir)
+    assert len([fname for fname in os.listdir(save_dir) if fname.endswith('.bin')]) == 1
+    loaded_container = Container.from_incremental_checkpoint(save_dir)
+    assert np.allclose(loaded_container.b.c, np.array([8., 10., 12.]))
+
+
+@pytest.mark.parametrize(
+    "mmap", [False, True])
+def test_container_to_and_from_sharded_disk(mmap, tmp_path, dev_str, call):
+    if call in [helpers.tf_graph_call]:
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_dir = str(tmp_path / 'container_shards')
+    container = Container({'a': ivy.array([1., 2., 3.]),
+                           'b': {'c': ivy.array([[4., 5.], [6., 7.]]), 'd': ivy.array([8, 9])}})
+
+    # saving
+    container.to_sharded_disk(save_dir, num_shards=2)
+    assert len([fname for fname in os.listdir(save_dir) if fname.endswith('.bin')]) == 2
+
+    # loading
+    loaded_container = Container.from_sharded_disk(save_dir, mmap)
+    assert np.allclose(loaded_container.a, np.array([1., 2., 3.]))
+    assert np.allclose(loaded_container.b.c, np.array([[4., 5.], [6., 7.]]))
+    assert np.array_equal(loaded_container.b.d, np.array([8, 9]))
+
+    # leaves are arrays of the active framework, whether memory-mapped or not
+    assert isinstance(loaded_container.a, type(container.a))
+    assert isinstance(loaded_container.b.d, type(container.b.d))
+
+
 def test_container_to_disk_shuffle_and_from_disk(dev_str, call):
     if call in [helpers.tf_graph_call]:
         # container disk saving requires eager execution
@@ -1322,7 +1322,7 @@ def test_scatter_nd(inds_n_upd_n_shape, red, dtype_str, tensor_fn, dev_str, call
 
 # gather_flat
 @pytest.mark.parametrize(
-    "prms_n_inds", [([9, 8, 7, 6, 5, 4, 3, 2, 1, 0], [0, 4, 7])])
+    "prms_n_inds", [([9, 8, 7, 6, 5, 4, 3, 2, 1, 0], [0, 4, 7]), ([[9, 8], [7, 6], [5, 4], [3, 2]], [3, 0, 2])])
 @pytest.mark.parametrize(
     "dtype_str", ['float32'])
 @pytest.mark.parametrize(
@@ -1336,7 +1336,7 @@ def test_gather_flat(prms_n_inds, dtype_str, tensor_fn, dev_str, call):
     # type test
     assert isinstance(ret, ivy.Array)
     # cardinality test
-    assert ret.shape == inds.shape
+    assert ret.shape == inds.shape + prms.shape[1:]
     # value test
     assert np.allclose(call(ivy.gather_flat, prms, inds, dev_str),
                        ivy.numpy.gather_flat(ivy.to_numpy(prms), ivy.to_numpy(inds), dev_str))
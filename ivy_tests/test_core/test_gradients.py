@@ -5,6 +5,7 @@ Collection of tests for templated gradient functions
 # global
 import pytest
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 # local
 import ivy
@@ -74,6 +75,10 @@ def test_gradient_descent_update(dev_str, call):
     dcdws = Container({'w': ivy.array([6.])})
     w_new = ivy.array(ivy.gradient_descent_update(ws, dcdws, 0.1)['w'])
     assert np.allclose(ivy.to_numpy(w_new), np.array([2.4]))
+    ws = Container({'w': ivy.variable(ivy.array([3.]))})
+    with ThreadPoolExecutor(2) as executor:
+        w_new = ivy.array(ivy.gradient_descent_update(ws, dcdws, 0.1, parallel=True, executor=executor)['w'])
+    assert np.allclose(ivy.to_numpy(w_new), np.array([2.4]))
     if call in [helpers.torch_call]:
         # pytorch scripting does not support internal function definitions
         return
@@ -87,6 +92,11 @@ def test_adam_update(dev_str, call):
     vw = dcdws.map(lambda x, _: x ** 2)
     w_new = ivy.array(ivy.adam_update(ws, dcdws, 0.1, mw, vw, ivy.array(1))[0]['w'])
     assert np.allclose(ivy.to_numpy(w_new), np.array([2.96837726]))
+    ws = Container({'w': ivy.variable(ivy.array([3.]))})
+    with ThreadPoolExecutor(2) as executor:
+        w_new = ivy.array(ivy.adam_update(ws, dcdws, 0.1, mw, vw, ivy.array(1), parallel=True,
+                                          executor=executor)[0]['w'])
+    assert np.allclose(ivy.to_numpy(w_new), np.array([2.96837726]))
     if call in [helpers.torch_call]:
         # pytorch scripting does not support internal function definitions
         return
@@ -0,0 +1,69 @@
+"""
+Collection of tests for the dispatch overhead of ivy core functions, against stored per-case budgets
+"""
+
+# global
+import os
+import pytest
+
+# local
+import ivy_tests.helpers as helpers
+from ivy.bench import overhead
+
+# regenerate with: ivy-bench-budgets -o ivy_tests/test_core/overhead_budgets.json --backends <backends>
+# or by running these tests with --record_overhead_budgets
+BUDGETS_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'overhead_budgets.json')
+BUDGETS = overhead.load_budgets(BUDGETS_PATH)
+
+# further measurements of a case over its budget, before it is failed
+MAX_REMEASURES = 2
+
+# backends without recorded budgets, and why
+UNBUDGETED_BACKENDS = {
+    'jax': 'no jax budgets are recorded, as ivy.jax needs the jax DeviceArray API, which no jax release installable '
+           'on the python version the budgets were recorded with provides',
+    'mxnd': 'no mxnd budgets are recorded, as no mxnet release was installable alongside the numpy version the '
+            'budgets were recorded with'}
+
+# cases without recorded budgets for a backend, and why
+UNBUDGETED_CASES = {
+    ('torch', 'scatter_flat'): 'the torch scatter functions need the optional torch_scatter package',
+    ('torch', 'scatter_nd'): 'the torch scatter functions need the optional torch_scatter package'}
+
+
+def test_every_core_function_has_a_case(dev_str, f, call):
+    assert sorted(overhead.core_functions().keys()) == sorted(overhead.CASES.keys())
+    assert all([fn_name in overhead.CASES for fn_name, _ in overhead.INPUT_CASES.values()])
+
+
+@pytest.mark.parametrize(
+    "case_name", list(overhead.cases().keys()))
+def test_dispatch_overhead(case_name, request, dev_str, f, call):
+    if call is helpers.tf_graph_call:
+        pytest.skip('dispatch overhead is measured eagerly')
+    backend = f.__name__.split('.')[-1]
+    if request.config.getoption('--record_overhead_budgets'):
+        budgets = overhead.measure_budgets([backend], dev_str=dev_str, case_names=[case_name])
+        if case_name not in budgets[backend]:
+            pytest.skip('{} could not be measured for {}'.format(case_name, backend))
+        overhead.save_budgets(budgets, BUDGETS_PATH)
+        return
+    if backend in UNBUDGETED_BACKENDS:
+        pytest.skip(UNBUDGETED_BACKENDS[backend])
+    if (backend, case_name) in UNBUDGETED_CASES:
+        pytest.skip(UNBUDGETED_CASES[(backend, case_name)])
+    budget = BUDGETS.get(backend, dict()).get(case_name)
+    assert budget is not None, 'no overhead budget is recorded for {} with {}, record one with ' \
+                               '--record_overhead_budgets'.format(case_name, backend)
+    tolerance = request.config.getoption('--overhead_tolerance')
+    measured = overhead.measure_overhead(case_name, f, dev_str) / overhead.calibration_time()
+    for _ in range(MAX_REMEASURES):
+        if measured <= budget * (1 + tolerance):
+            break
+        # timing noise only adds time, so the smallest of several measurements is kept, each against a fresh
+        # calibration so that load on the machine slows both alike
+        unit = overhead.calibration_time()
+        measured = min(measured, overhead.measure_overhead(case_name, f, dev_str) / unit)
+    assert measured <= budget * (1 + tolerance), \
+        'ivy overhead of {} is {:.1f} python calls, over its budget of {} with a tolerance of {:.0%}'.format(
+            case_name, measured, budget, tolerance)
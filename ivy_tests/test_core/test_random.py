@@ -3,6 +3,7 @@ Collection of tests for templated reduction functions
 """
 
 # global
+import pytest
 import numpy as np
 
 # local
@@ -44,3 +45,60 @@ def test_random_shuffle(dev_str, call):
     second_shuffle = call(ivy.shuffle, ivy.array([1, 2, 3]))
     assert np.array(first_shuffle == second_shuffle).all()
     helpers.assert_compilable(ivy.shuffle)
+
+
+def test_prng_key(dev_str, call):
+    if call is helpers.mx_call:
+        # mxnet does not support explicit prng keys
+        pytest.skip()
+    key = ivy.prng_key(0)
+    key0, key1 = ivy.split_key(key)
+    assert len(ivy.split_key(key, 3)) == 3
+    # same key, same values
+    assert np.array_equal(call(ivy.random_uniform, 0, 1, (3,), key=key0),
+                          call(ivy.random_uniform, 0, 1, (3,), key=key0))
+    assert np.array_equal(call(ivy.randint, 0, 10, (3,), key=key0), call(ivy.randint, 0, 10, (3,), key=key0))
+    assert np.array_equal(call(ivy.shuffle, ivy.array([1, 2, 3]), key=key0),
+                          call(ivy.shuffle, ivy.array([1, 2, 3]), key=key0))
+    # split keys, different values
+    assert not np.array_equal(call(ivy.random_uniform, 0, 1, (3,), key=key0),
+                              call(ivy.random_uniform, 0, 1, (3,), key=key1))
+    # negative seeds
+    assert np.array_equal(call(ivy.random_uniform, 0, 1, (3,), key=ivy.prng_key(-1)),
+                          call(ivy.random_uniform, 0, 1, (3,), key=ivy.prng_key(-1)))
+    # the global random state is not used
+    call(ivy.seed, 0)
+    first_shuffle = call(ivy.shuffle, ivy.array([1, 2, 3]))
+    call(ivy.seed, 0)
+    call(ivy.random_uniform, 0, 1, (3,), key=key0)
+    second_shuffle = call(ivy.shuffle, ivy.array([1, 2, 3]))
+    assert np.array_equal(first_shuffle, second_shuffle)
+
+
+def test_prng_key_compiled(dev_str, call):
+    if call is not helpers.torch_call:
+        # torch samples keyed values on the host
+        pytest.skip()
+    key0, key1 = ivy.split_key(ivy.prng_key(0))
+    # traced functions would record the samples as constants, so keyed sampling raises rather than reusing them
+    with pytest.raises(Exception):
+        ivy.compile_fn(lambda key: ivy.random_uniform(0, 1, (3,), key=key), False, (key0,))
+    with pytest.raises(Exception):
+        ivy.compile_fn(lambda key: ivy.shuffle(ivy.array([1, 2, 3]), key=key), False, (key0,))
+    # the keyed samples are unchanged outside of tracing
+    assert not np.array_equal(call(ivy.random_uniform, 0, 1, (3,), key=key0),
+                              call(ivy.random_uniform, 0, 1, (3,), key=key1))
+
+
+def test_fold_in(dev_str, call):
+    if call is helpers.mx_call:
+        # mxnet does not support explicit prng keys
+        pytest.skip()
+    root_key = ivy.prng_key(0)
+    worker_samples = [call(ivy.random_uniform, 0, 1, (3,), key=ivy.fold_in(root_key, worker_id))
+                      for worker_id in range(3)]
+    # deterministic for each worker
+    assert np.array_equal(call(ivy.random_uniform, 0, 1, (3,), key=ivy.fold_in(root_key, 1)), worker_samples[1])
+    # independent across workers
+    assert not np.array_equal(worker_samples[0], worker_samples[1])
+    assert not np.array_equal(worker_samples[1], worker_samples[2])
@@ -0,0 +1,70 @@
+"""
+Collection of tests for runtime instrumentation hooks
+"""
+
+# global
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+# local
+import ivy
+import ivy.core.general as ivy_gen
+import ivy_tests.helpers as helpers
+from ivy.instrumentation import add_hook, remove_hook, hooks, CallTimer
+
+
+def test_hooks(dev_str, f, call):
+    if call is helpers.tf_graph_call:
+        # hooks are called at trace time in graph mode
+        return
+    x = ivy.array([[0., 1.], [2., 3.]], 'float32', dev_str)
+    original_concatenate = ivy.concatenate
+    pre_calls = list()
+    post_calls = list()
+    with hooks(pre=lambda *args: pre_calls.append(args[0:2]), post=lambda *args: post_calls.append(args[0:2])):
+        ret = ivy.concatenate([x, x], 0)
+    assert pre_calls[0] == ('backend', f.__name__ + '.concatenate')
+    assert 'native' in [layer for layer, _ in pre_calls]
+    assert post_calls[-1] == pre_calls[0]
+    assert np.allclose(call(lambda: ret), np.concatenate([call(lambda: x)] * 2, 0))
+    # originals are restored once the last hook is removed
+    assert ivy.concatenate is original_concatenate
+    handle_a = add_hook(post=lambda *_: None)
+    handle_b = add_hook(pre=lambda *_: None)
+    remove_hook(handle_a)
+    assert ivy.concatenate is not original_concatenate
+    remove_hook(handle_b)
+    assert ivy.concatenate is original_concatenate
+
+
+def test_call_timer(dev_str, f, call):
+    if call is helpers.tf_graph_call:
+        # hooks are called at trace time in graph mode
+        return
+    x = ivy.array([[0., 1.], [2., 3.]], 'float32', dev_str)
+    with CallTimer() as timer:
+        ivy_gen.concatenate([x, x], 0)
+        ivy.concatenate([x, x], 0)
+    assert len(timer.calls) == 2
+    ivy_call, backend_call = timer.calls
+    assert ivy_call.name == 'ivy.concatenate'
+    assert ivy_call.ivy_time >= ivy_call.backend_time >= ivy_call.native_time > 0
+    assert backend_call.name == f.__name__ + '.concatenate'
+    assert backend_call.ivy_time == backend_call.backend_time >= backend_call.native_time > 0
+    # the cost of the hooks around each nested call is calibrated on entry, and subtracted
+    assert timer.hook_cost > 0
+
+
+def test_call_timer_threads(dev_str, f, call):
+    if call is helpers.tf_graph_call:
+        # hooks are called at trace time in graph mode
+        return
+    x = ivy.array([[0., 1.], [2., 3.]], 'float32', dev_str)
+    executor = ThreadPoolExecutor(max_workers=4)
+    # calls on concurrent threads are tracked separately, rather than being merged into one another
+    with CallTimer() as timer:
+        list(executor.map(lambda _: ivy_gen.concatenate([x, x], 0), range(64)))
+    executor.shutdown()
+    assert len(timer.calls) == 64
+    assert all([call_.name == 'ivy.concatenate' for call_ in timer.calls])
+    assert all([call_.ivy_time >= call_.backend_time >= call_.native_time > 0 for call_ in timer.calls])
@@ -12,8 +12,8 @@ import ivy_tests.helpers as helpers
 
 
 def test_conv1d(dev_str, call):
-    if call in [helpers.np_call, helpers.jnp_call]:
-        # numpy and jax do not yet support 1d convolutions
+    if call is helpers.np_call:
+        # numpy does not yet support 1d convolutions
         pytest.skip()
     x = ivy.array([[[0.], [3.], [0.]]])
     x_batched = ivy.tile(x, (5, 1, 1))
@@ -31,8 +31,8 @@ def test_conv1d(dev_str, call):
 
 
 def test_conv1d_transpose(dev_str, call):
-    if call in [helpers.np_call, helpers.jnp_call]:
-        # numpy and jax do not yet support 1d transpose convolutions
+    if call is helpers.np_call:
+        # numpy does not yet support 1d transpose convolutions
         pytest.skip()
     x = ivy.array([[[0.], [3.], [0.]]])
     x_batched = ivy.tile(x, (5, 1, 1))
@@ -78,8 +78,8 @@ def test_conv2d(dev_str, call):
 
 
 def test_conv2d_transpose(dev_str, call):
-    if call in [helpers.np_call, helpers.jnp_call]:
-        # numpy and jax do not yet support 2d transpose convolutions
+    if call is helpers.np_call:
+        # numpy does not yet support 2d transpose convolutions
         pytest.skip()
     x = ivy.array([[[[0.], [0.], [0.]],
                      [[0.], [3.], [0.]],
@@ -107,8 +107,8 @@ def test_conv2d_transpose(dev_str, call):
 
 
 def test_depthwise_conv2d(dev_str, call):
-    if call in [helpers.np_call, helpers.jnp_call]:
-        # numpy and jax do not yet support depthwise 2d convolutions
+    if call is helpers.np_call:
+        # numpy does not yet support depthwise 2d convolutions
         pytest.skip()
     x1 = ivy.array([[[[0.], [0.], [0.]],
                       [[0.], [3.], [0.]],
@@ -137,8 +137,8 @@ def test_depthwise_conv2d(dev_str, call):
 
 
 def test_conv3d(dev_str, call):
-    if call in [helpers.np_call, helpers.jnp_call]:
-        # numpy and jax do not yet support 3d convolutions
+    if call is helpers.np_call:
+        # numpy does not yet support 3d convolutions
         pytest.skip()
     x = ivy.array([[[[[0.], [0.], [0.]], [[0.], [0.], [0.]], [[0.], [0.], [0.]]],
                      [[[0.], [0.], [0.]], [[0.], [3.], [0.]], [[0.], [0.], [0.]]],
@@ -162,8 +162,8 @@ def test_conv3d(dev_str, call):
 
 
 def test_conv3d_transpose(dev_str, call):
-    if call in [helpers.np_call, helpers.jnp_call, helpers.mx_call]:
-        # numpy and jax do not yet support 3d convolutions, and mxnet only supports with CUDNN
+    if call in [helpers.np_call, helpers.mx_call]:
+        # numpy does not yet support 3d convolutions, and mxnet only supports with CUDNN
         pytest.skip()
     x = ivy.array([[[[[0.], [0.], [0.]], [[0.], [0.], [0.]], [[0.], [0.], [0.]]],
                      [[[0.], [0.], [0.]], [[0.], [3.], [0.]], [[0.], [0.], [0.]]],
@@ -190,6 +190,45 @@ def test_conv3d_transpose(dev_str, call):
     helpers.assert_compilable(ivy.conv3d_transpose)
 
 
+def _np_conv_transpose(x, filters, strides, padding, output_shape):
+    # channels last reference, with filters [*filter_shape, d_out, d_in] as in tensorflow
+    spatial_shape = x.shape[1:-1]
+    filter_shape = filters.shape[:-2]
+    # positions beyond the last window, up to the largest output shape, are zero
+    full_shape = [max((size - 1) * strides + kernel, out_size)
+                  for size, kernel, out_size in zip(spatial_shape, filter_shape, output_shape[1:-1])]
+    full = np.zeros([x.shape[0]] + full_shape + [filters.shape[-2]])
+    for idx in np.ndindex(*spatial_shape):
+        window = tuple([slice(None)] + [slice(i * strides, i * strides + k) for i, k in zip(idx, filter_shape)])
+        full[window] += np.einsum('bi,...oi->b...o', x[(slice(None),) + idx], filters)
+    slices = [slice(None)]
+    for size, kernel, out_size in zip(spatial_shape, filter_shape, output_shape[1:-1]):
+        pad_before = max((size - 1) * strides + kernel - out_size, 0) // 2 if padding == 'SAME' else 0
+        slices.append(slice(pad_before, pad_before + out_size))
+    return full[tuple(slices)]
+
+
+@pytest.mark.parametrize(
+    "x_shape, filters_shape, strides, padding, output_shape",
+    [((2, 5, 3), (3, 4, 3), 2, 'SAME', (2, 9, 4)),
+     ((2, 5, 3), (3, 4, 3), 2, 'VALID', (2, 12, 4)),
+     ((2, 5, 5, 3), (3, 3, 4, 3), 2, 'SAME', (2, 9, 9, 4)),
+     ((2, 5, 5, 3), (3, 3, 4, 3), 2, 'SAME', (2, 10, 10, 4)),
+     ((2, 5, 5, 3), (3, 3, 4, 3), 2, 'VALID', (2, 11, 11, 4)),
+     ((1, 3, 3, 3, 2), (3, 3, 3, 4, 2), 2, 'SAME', (1, 5, 5, 5, 4))])
+def test_conv_transpose_output_shape(x_shape, filters_shape, strides, padding, output_shape, dev_str, call):
+    if call in [helpers.np_call, helpers.mx_call]:
+        # numpy does not yet support transpose convolutions, and mxnet ignores the output shape
+        pytest.skip()
+    rng = np.random.RandomState(0)
+    x = rng.uniform(0., 1., x_shape).astype('float32')
+    filters = rng.uniform(0., 1., filters_shape).astype('float32')
+    conv_transpose = {3: ivy.conv1d_transpose, 4: ivy.conv2d_transpose, 5: ivy.conv3d_transpose}[len(x_shape)]
+    ret = call(conv_transpose, ivy.array(x), ivy.array(filters), strides, padding, output_shape)
+    assert ret.shape == output_shape
+    assert np.allclose(ret, _np_conv_transpose(x, filters, strides, padding, output_shape), atol=1e-4)
+
+
 def test_linear(dev_str, call):
     x = ivy.array([[1., 2., 3.]])
     weight = ivy.array([[1., 1., 1.], [1., 1., 1.]])
@@ -0,0 +1,36 @@
+"""
+Collection of tests for thread pool control
+"""
+
+# global
+import os
+import sys
+import pytest
+
+# local
+import ivy
+from ivy.threads import BLAS_ENV_VARS
+
+
+def test_num_threads(dev_str, f, call):
+    env = dict([(env_var, os.environ.get(env_var)) for env_var in BLAS_ENV_VARS + ['XLA_FLAGS']])
+    torch = sys.modules.get('torch')
+    torch_intra = torch.get_num_threads() if torch is not None else None
+    with ivy.num_threads(intra=1) as thread_control:
+        assert thread_control.applied['env']
+        assert all([os.environ[env_var] == '1' for env_var in BLAS_ENV_VARS])
+        assert '--xla_cpu_multi_thread_eigen=false' in os.environ['XLA_FLAGS'].split()
+        counts = ivy.get_num_threads()
+        if torch is not None:
+            assert thread_control.applied['torch']
+            assert counts['torch']['intra'] == 1
+    # settings which can be changed at runtime are restored on exit
+    assert dict([(env_var, os.environ.get(env_var)) for env_var in BLAS_ENV_VARS + ['XLA_FLAGS']]) == env
+    if torch is not None:
+        assert torch.get_num_threads() == torch_intra
+    # leaving the thread counts unset changes nothing
+    with ivy.num_threads() as thread_control:
+        assert not thread_control.applied['env']
+        assert dict([(env_var, os.environ.get(env_var)) for env_var in BLAS_ENV_VARS + ['XLA_FLAGS']]) == env
+    with pytest.raises(Exception):
+        ivy.set_num_threads(intra=0)
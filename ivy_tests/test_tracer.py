@@ -0,0 +1,62 @@
+"""
+Collection of tests for chrome trace export of ivy calls
+"""
+
+# global
+import json
+import threading
+
+# local
+import ivy
+import ivy.core.math as ivy_math
+import ivy.core.general as ivy_gen
+import ivy_tests.helpers as helpers
+from ivy.tracer import Tracer
+from ivy.core.container import Container
+
+
+def test_tracer(tmp_path, dev_str, f, call):
+    if call is helpers.tf_graph_call:
+        # hooks are called at trace time in graph mode
+        return
+    backend = f.__name__.split('.')[-1]
+    x = ivy.array([[0., 1.], [2., 3.]], 'float32', dev_str)
+    container = Container({'a': x, 'b': {'c': ivy.array([0., 1.], 'float32', dev_str)}})
+    original_map = Container.map
+    trace_path = str(tmp_path / 'trace.json')
+    with Tracer(trace_path):
+        ivy_gen.concatenate([x, x], 0)
+        Container.concat([container, container], 0)
+        container.map(lambda value, _: ivy_math.sin(value))
+    assert Container.map is original_map
+    with open(trace_path, 'r') as file:
+        events = json.loads(file.read())['traceEvents']
+    metadata = [event for event in events if event['ph'] == 'M']
+    assert metadata[0]['args']['name'] == threading.current_thread().name
+    events = [event for event in events if event['ph'] == 'X']
+    names = [event['name'] for event in events]
+    map_idx = names.index('Container.map')
+    assert names[0:2] == ['ivy.concatenate', 'Container.concat']
+    assert names[map_idx:] == ['Container.map', 'ivy.sin', 'ivy.sin']
+    # container concat calls the backend directly, preallocating its outputs where the framework allows
+    assert map_idx > 2 and all([name.startswith(f.__name__ + '.') for name in names[2:map_idx]])
+    assert events[0]['args'] == {'backend': backend, 'shapes': [[2, 2], [2, 2]], 'dtypes': ['float32', 'float32']}
+    assert all([event['tid'] == threading.get_ident() for event in events])
+    # ops called within a container operation are nested inside its span
+    concat_span, map_span = events[1], events[map_idx]
+    for span, children in [(concat_span, events[2:map_idx]), (map_span, events[map_idx + 1:])]:
+        for child in children:
+            assert span['ts'] <= child['ts'] and child['ts'] + child['dur'] <= span['ts'] + span['dur']
+
+
+def test_tracer_threads(dev_str, f, call):
+    if call is helpers.tf_graph_call:
+        # hooks are called at trace time in graph mode
+        return
+    container = Container({'a': ivy.array([0., 1.], 'float32', dev_str),
+                           'b': ivy.array([2., 3.], 'float32', dev_str)})
+    with Tracer() as tracer:
+        container.map(lambda value, _: ivy_math.sin(value), parallel=True, min_parallel_size=0)
+    sin_events = [event for event in tracer.trace()['traceEvents'] if event['name'] == 'ivy.sin']
+    assert len(sin_events) == 2
+    assert all([event['tid'] != threading.get_ident() for event in sin_events])
@@ -0,0 +1,46 @@
+"""
+Collection of tests for runtime profiling of ivy op usage
+"""
+
+# global
+import csv
+import json
+
+# local
+import ivy
+import ivy.core.math as ivy_math
+import ivy.core.general as ivy_gen
+import ivy_tests.helpers as helpers
+from ivy.usage import UsageProfiler
+
+
+def test_usage_profiler(tmp_path, dev_str, f, call):
+    if call is helpers.tf_graph_call:
+        # hooks are called at trace time in graph mode
+        return
+    backend = f.__name__.split('.')[-1]
+    x = ivy.array([[0., 1.], [2., 3.]], 'float32', dev_str)
+    y = ivy.array([0., 1.], 'float32', dev_str)
+    with UsageProfiler() as profiler:
+        for _ in range(3):
+            ivy_gen.concatenate([x, x], 0)
+        ivy_math.sin(x)
+        ivy.sin(y)
+    usage = profiler.usage()
+    assert list(usage.keys()) == ['ivy_tests', 'all']
+    assert list(usage['all'].items()) == [('concatenate', 3), ('sin', 2)]
+    details = profiler.details()
+    assert details['concatenate'][backend]['count'] == 3
+    assert details['concatenate'][backend]['time'] > 0
+    assert details['concatenate'][backend]['shapes'] == {'2x2,2x2': 3}
+    assert details['sin'][backend]['shapes'] == {'2x2': 1, '2': 1}
+    # calls from other libraries are only counted in the all group
+    with UsageProfiler(['ivy_mech']) as profiler:
+        ivy_math.sin(x)
+    assert list(profiler.usage().keys()) == ['all']
+    json_path, csv_path = str(tmp_path / 'library_usage.json'), str(tmp_path / 'library_usage.csv')
+    profiler.save(json_path, csv_path)
+    with open(json_path, 'r') as file:
+        assert json.loads(file.read()) == {'all': {'sin': 1}}
+    with open(csv_path, 'r') as file:
+        assert list(csv.reader(file)) == [['all'], ['sin', '1'], [''], ['']]
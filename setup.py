@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License..
 # ==============================================================================
-from distutils.core import setup
+from setuptools import setup
 import setuptools
 
 setup(name='ivy-core',
@@ -24,6 +24,10 @@ setup(name='ivy-core',
       author_email='ivydl.team@gmail.com',
       packages=setuptools.find_packages(),
       install_requires=['h5py', 'numpy', 'termcolor'],
+      entry_points={'console_scripts': ['ivy-bench=ivy.bench.cli:main',
+                                        'ivy-bench-compare=ivy.bench.cli:compare_main',
+                                        'ivy-bench-budgets=ivy.bench.cli:budgets_main',
+                                        'ivy-bench-compile=ivy.bench.cli:compile_main']},
       classifiers=['License :: OSI Approved :: Apache Software License'],
       license='Apache 2.0'
       )
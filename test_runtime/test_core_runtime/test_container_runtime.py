@@ -0,0 +1,241 @@
+"""
+Collection of runtime tests for container methods
+"""
+
+BATCH_SIZES = [1000, 4000]
+
+
+# global
+import os
+import random
+
+# local
+import ivy.core.general as ivy_gen
+import ivy.core.random as ivy_random
+from ivy.core.container import Container, ContainerBuffer
+this_file_dir = os.path.dirname(os.path.realpath(__file__))
+
+from ivy import torch as _ivy_torch
+from ivy import tensorflow as _ivy_tf
+from ivy import mxnd as _ivy_mxnd
+from ivy import jax as _ivy_jnp
+from ivy import numpy as _ivy_np
+
+# local
+import ivy_tests.helpers as helpers
+from test_runtime.utils import append_to_file, log_time, write_times, TIMES_DICT
+
+
+def _replay_buffer_container(batch_size, lib):
+    return Container({'obs': {'image': ivy_gen.tensor([[random.uniform(0, 1) for _ in range(64)]
+                                                       for _ in range(batch_size)], f=lib),
+                              'state': ivy_gen.tensor([[random.uniform(0, 1) for _ in range(8)]
+                                                       for _ in range(batch_size)], f=lib)},
+                      'action': ivy_gen.tensor([[random.uniform(0, 1) for _ in range(4)]
+                                                for _ in range(batch_size)], f=lib),
+                      'reward': ivy_gen.tensor([random.uniform(0, 1) for _ in range(batch_size)], f=lib)})
+
+
+def test_container_unstack():
+
+    for batch_size in BATCH_SIZES:
+
+        fname = os.path.join(this_file_dir, 'runtime_analysis/{}/container/unstack.txt'.format(batch_size))
+        if os.path.exists(fname):
+            os.remove(fname)
+        for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
+
+            append_to_file(fname, '{}'.format(lib))
+
+            container = _replay_buffer_container(batch_size, lib)
+
+            # previous implementation, with one slice of the full container per index
+            def sliced_unstack():
+                return [container.slice(slice(i, i + 1, 1)) for i in range(batch_size)]
+
+            sliced_unstack()
+            container.unstack(0)
+            TIMES_DICT.clear()
+
+            for _ in range(10):
+
+                log_time(fname, 'tb0')
+                sliced_unstack()
+                log_time(fname, 'tb4', time_at_start=True)
+
+                log_time(fname, 'tt0')
+                container.unstack(0)
+                log_time(fname, 'tt1', time_at_start=True)
+
+            write_times()
+
+        append_to_file(fname, 'end of analysis')
+
+
+def test_container_stack():
+
+    for batch_size in BATCH_SIZES:
+
+        fname = os.path.join(this_file_dir, 'runtime_analysis/{}/container/stack.txt'.format(batch_size))
+        if os.path.exists(fname):
+            os.remove(fname)
+        for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
+
+            append_to_file(fname, '{}'.format(lib))
+
+            containers = _replay_buffer_container(batch_size, lib).unstack(0)
+
+            # collating by concatenating containers with expanded dims
+            def concat_collate():
+                return Container.concat([cont.expand_dims(0) for cont in containers], 0)
+
+            concat_collate()
+            Container.stack(containers, 0)
+            TIMES_DICT.clear()
+
+            for _ in range(10):
+
+                log_time(fname, 'tb0')
+                concat_collate()
+                log_time(fname, 'tb4', time_at_start=True)
+
+                log_time(fname, 'tt0')
+                Container.stack(containers, 0)
+                log_time(fname, 'tt1', time_at_start=True)
+
+            write_times()
+
+        append_to_file(fname, 'end of analysis')
+
+
+def test_container_buffer_append():
+
+    for batch_size in BATCH_SIZES:
+
+        num_appends = batch_size // 10
+
+        fname = os.path.join(this_file_dir, 'runtime_analysis/{}/container/buffer_append.txt'.format(batch_size))
+        if os.path.exists(fname):
+            os.remove(fname)
+        for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
+
+            append_to_file(fname, '{}'.format(lib))
+
+            rollout = _replay_buffer_container(10, lib)
+
+            # growing the rollout by repeated concatenation
+            def concat_rollout():
+                container = rollout
+                for _ in range(num_appends - 1):
+                    container = Container.concat([container, rollout], 0)
+                return container
+
+            # appending the rollout to an amortised buffer
+            def buffer_rollout():
+                buffer = ContainerBuffer()
+                for _ in range(num_appends):
+                    buffer.append(rollout)
+                return buffer.data
+
+            concat_rollout()
+            buffer_rollout()
+            TIMES_DICT.clear()
+
+            for _ in range(10):
+
+                log_time(fname, 'tb0')
+                concat_rollout()
+                log_time(fname, 'tb4', time_at_start=True)
+
+                log_time(fname, 'tt0')
+                buffer_rollout()
+                log_time(fname, 'tt1', time_at_start=True)
+
+            write_times()
+
+        append_to_file(fname, 'end of analysis')
+
+
+def test_container_map_parallel():
+
+    num_layers = 8
+    layer_dim = 512
+
+    for workload in ['to_random', 'with_entries_as_lists', 'adam_update']:
+
+        fname = os.path.join(this_file_dir, 'runtime_analysis/{}/container/map_parallel_{}.txt'.format(
+            layer_dim, workload))
+        if os.path.exists(fname):
+            os.remove(fname)
+        for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
+
+            append_to_file(fname, '{}'.format(lib))
+
+            weights = Container(dict([('layer{}'.format(i), ivy_random.random_uniform(
+                0, 1, (layer_dim, layer_dim), f=lib)) for i in range(num_layers)]))
+
+            func = {'to_random': lambda w, _: ivy_random.random_uniform(0, 1, w.shape, f=lib),
+                    'with_entries_as_lists': lambda w, _: ivy_gen.to_list(w, f=lib),
+                    'adam_update': lambda w, _: w - 1e-3 * (0.9 * w + 0.1 * w) / ((0.999 * w ** 2) ** 0.5 + 1e-7)
+                    }[workload]
+
+            weights.map(func)
+            weights.map(func, parallel=True)
+            TIMES_DICT.clear()
+
+            for _ in range(10):
+
+                log_time(fname, 'tb0')
+                weights.map(func)
+                log_time(fname, 'tb4', time_at_start=True)
+
+                log_time(fname, 'tt0')
+                weights.map(func, parallel=True)
+                log_time(fname, 'tt1', time_at_start=True)
+
+            write_times()
+
+        append_to_file(fname, 'end of analysis')
+
+
+def test_container_flat_file_load():
+
+    num_leaves = 1000
+
+    fname = os.path.join(this_file_dir, 'runtime_analysis/{}/container/flat_file_load.txt'.format(num_leaves))
+    if os.path.exists(fname):
+        os.remove(fname)
+
+    append_to_file(fname, '{}'.format(_ivy_np))
+
+    container = Container(dict([('layer{}'.format(i), {'w': ivy_random.random_uniform(0, 1, (16, 16), f=_ivy_np),
+                                                        'b': ivy_random.random_uniform(0, 1, (16,), f=_ivy_np)})
+                                for i in range(num_leaves // 2)]))
+    h5_filepath = os.path.join(this_file_dir, 'container.hdf5')
+    flat_filepath = os.path.join(this_file_dir, 'container.bin')
+    container.to_disk(h5_filepath, mode='w')
+    container.to_flat_file(flat_filepath)
+
+    with _ivy_np.use:
+
+        Container.from_disk(h5_filepath)
+        Container.from_flat_file(flat_filepath)
+        TIMES_DICT.clear()
+
+        for _ in range(10):
+
+            log_time(fname, 'tb0')
+            Container.from_disk(h5_filepath)
+            log_time(fname, 'tb4', time_at_start=True)
+
+            log_time(fname, 'tt0')
+            Container.from_flat_file(flat_filepath)
+            log_time(fname, 'tt1', time_at_start=True)
+
+        write_times()
+
+    os.remove(h5_filepath)
+    os.remove(flat_filepath)
+    os.remove(flat_filepath + '.json')
+
+    append_to_file(fname, 'end of analysis')
@@ -12,7 +12,6 @@ import random
 # local
 import ivy.core.general as ivy_gen
 this_file_dir = os.path.dirname(os.path.realpath(__file__))
-import with_time_logs.ivy.core.general as ivy_gen_w_time
 
 from ivy import torch as _ivy_torch
 from ivy import tensorflow as _ivy_tf
@@ -20,21 +19,9 @@ from ivy import mxnd as _ivy_mxnd
 from ivy import jax as _ivy_jnp
 from ivy import numpy as _ivy_np
 
-from with_time_logs.ivy import torch as _ivy_torch_w_time
-from with_time_logs.ivy import tensorflow as _ivy_tf_w_time
-from with_time_logs.ivy import mxnd as _ivy_mxnd_w_time
-from with_time_logs.ivy import jax as _ivy_jnp_w_time
-from with_time_logs.ivy import numpy as _ivy_np_w_time
-
-LIB_DICT = {_ivy_torch: _ivy_torch_w_time,
-            _ivy_tf: _ivy_tf_w_time,
-            _ivy_mxnd: _ivy_mxnd_w_time,
-            _ivy_jnp: _ivy_jnp_w_time,
-            _ivy_np: _ivy_np_w_time}
-
 # local
 import ivy_tests.helpers as helpers
-from test_runtime.utils import append_to_file, log_time, write_times, TIMES_DICT
+from test_runtime.utils import append_to_file, log_time, log_backend_times, write_times, TIMES_DICT
 
 
 def test_array():
@@ -44,21 +31,21 @@ def test_array():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = [random.uniform(0, 1) for _ in range(DIM)]
 
         ivy_gen.tensor(x0, f=lib)
-        ivy_gen_w_time.tensor(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.tensor(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.tensor(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.tensor(x0, f=lib)
@@ -76,21 +63,21 @@ def test_to_numpy():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.to_numpy(x0, f=lib)
-        ivy_gen_w_time.to_numpy(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.to_numpy(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.to_numpy(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.to_numpy(x0, f=lib)
@@ -108,21 +95,21 @@ def test_to_list():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.to_list(x0, f=lib)
-        ivy_gen_w_time.to_list(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.to_list(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.to_list(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.to_list(x0, f=lib)
@@ -140,21 +127,21 @@ def test_shape():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.shape(x0, f=lib)
-        ivy_gen_w_time.shape(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.shape(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.shape(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.shape(x0, f=lib)
@@ -172,21 +159,21 @@ def test_get_num_dims():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.get_num_dims(x0, f=lib)
-        ivy_gen_w_time.get_num_dims(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.get_num_dims(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.get_num_dims(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.get_num_dims(x0, f=lib)
@@ -204,22 +191,22 @@ def test_minimum():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
         x1 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.minimum(x0, x1, f=lib)
-        ivy_gen_w_time.minimum(x0, x1, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.minimum(x0, x1, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.minimum(x0, x1, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.minimum(x0, x1, f=lib)
@@ -237,22 +224,22 @@ def test_maximum():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
         x1 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.maximum(x0, x1, f=lib)
-        ivy_gen_w_time.maximum(x0, x1, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.maximum(x0, x1, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.maximum(x0, x1, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.maximum(x0, x1, f=lib)
@@ -270,21 +257,21 @@ def test_clip():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.clip(x0, 0, 1, f=lib)
-        ivy_gen_w_time.clip(x0, 0, 1, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.clip(x0, 0, 1, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.clip(x0, 0, 1, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.clip(x0, 0, 1, f=lib)
@@ -302,21 +289,21 @@ def test_round():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.round(x0, f=lib)
-        ivy_gen_w_time.round(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.round(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.round(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.round(x0, f=lib)
@@ -334,22 +321,22 @@ def test_floormod():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
         x1 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.floormod(x0, x1, f=lib)
-        ivy_gen_w_time.floormod(x0, x1, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.floormod(x0, x1, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.floormod(x0, x1, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.floormod(x0, x1, f=lib)
@@ -367,21 +354,21 @@ def test_floor():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.floor(x0, f=lib)
-        ivy_gen_w_time.floor(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.floor(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.floor(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.floor(x0, f=lib)
@@ -399,21 +386,21 @@ def test_ceil():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.ceil(x0, f=lib)
-        ivy_gen_w_time.ceil(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.ceil(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.ceil(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.ceil(x0, f=lib)
@@ -431,21 +418,21 @@ def test_abs():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.abs(x0, f=lib)
-        ivy_gen_w_time.abs(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.abs(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.abs(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.abs(x0, f=lib)
@@ -463,21 +450,21 @@ def test_argmax():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.argmax(x0, f=lib)
-        ivy_gen_w_time.argmax(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.argmax(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.argmax(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.argmax(x0, f=lib)
@@ -495,21 +482,21 @@ def test_argmin():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.argmin(x0, f=lib)
-        ivy_gen_w_time.argmin(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.argmin(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.argmin(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.argmin(x0, f=lib)
@@ -527,21 +514,21 @@ def test_cast():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.cast(x0, 'float32', f=lib)
-        ivy_gen_w_time.cast(x0, 'float32', f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.cast(x0, 'float32', f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.cast(x0, 'float32', f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.cast(x0, 'float32', f=lib)
@@ -559,19 +546,19 @@ def test_arange():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         ivy_gen.arange(DIM, f=lib)
-        ivy_gen_w_time.arange(DIM, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.arange(DIM, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.arange(DIM, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.arange(DIM, f=lib)
@@ -589,19 +576,19 @@ def test_linspace():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         ivy_gen.linspace(0, DIM, DIM, f=lib)
-        ivy_gen_w_time.linspace(0, DIM, DIM, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.linspace(0, DIM, DIM, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.linspace(0, DIM, DIM, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.linspace(0, DIM, DIM, f=lib)
@@ -619,22 +606,23 @@ def test_concatenate():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
         x1 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.concatenate([x0, x1], f=lib)
-        ivy_gen_w_time.concatenate(x0, f=time_lib)
+        ivy_gen.concatenate(x0, f=lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.concatenate([x0, x1], 0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.concatenate([x0, x1], 0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.concatenate([x0, x1], 0, f=lib)
@@ -652,21 +640,22 @@ def test_flip():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.flip(x0, 0, f=lib)
-        ivy_gen_w_time.flip(x0, f=time_lib)
+        ivy_gen.flip(x0, f=lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.flip(x0, 0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.flip(x0, 0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.flip(x0, 0, f=lib)
@@ -684,22 +673,22 @@ def test_stack():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
         x1 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.stack([x0, x1], f=lib)
-        ivy_gen_w_time.stack([x0, x1], f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.stack([x0, x1], 0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.stack([x0, x1], 0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.stack([x0, x1], 0, f=lib)
@@ -717,21 +706,21 @@ def test_unstack():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([[random.uniform(0, 1) for _ in range(DIM)]], f=lib)
 
         ivy_gen.unstack(x0, 0, num_outputs=1, f=lib)
-        ivy_gen_w_time.unstack(x0, 0, num_outputs=1, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.unstack(x0, 0, num_outputs=1, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.unstack(x0, 0, num_outputs=1, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.unstack(x0, 0, num_outputs=1, f=lib)
@@ -749,21 +738,21 @@ def test_split():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([[random.uniform(0, 1) for _ in range(DIM)]], f=lib)
 
         ivy_gen.split(x0, 1, 0, f=lib)
-        ivy_gen_w_time.split(x0, 1, 0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.split(x0, 1, 0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.split(x0, 1, 0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.split(x0, 1, 0, f=lib)
@@ -781,21 +770,21 @@ def test_tile():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1)], f=lib)
 
         ivy_gen.tile(x0, [DIM], f=lib)
-        ivy_gen_w_time.tile(x0, [DIM], f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.tile(x0, [DIM], f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.tile(x0, [DIM], f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.tile(x0, [DIM], f=lib)
@@ -813,21 +802,21 @@ def test_zero_pad():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.zero_pad(x0, [(DIM, DIM)], x_shape=[DIM], f=lib)
-        ivy_gen_w_time.zero_pad(x0, [(DIM, DIM)], x_shape=[DIM], f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.zero_pad(x0, [(DIM, DIM)], x_shape=[DIM], f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.zero_pad(x0, [(DIM, DIM)], x_shape=[DIM], f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.zero_pad(x0, [(DIM, DIM)], x_shape=[DIM], f=lib)
@@ -845,21 +834,21 @@ def test_swapaxes():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([[random.uniform(0, 1) for _ in range(DIM)], [random.uniform(0, 1) for _ in range(DIM)]], f=lib)
 
         ivy_gen.swapaxes(x0, 1, 0, f=lib)
-        ivy_gen_w_time.swapaxes(x0, 1, 0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.swapaxes(x0, 1, 0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.swapaxes(x0, 1, 0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.swapaxes(x0, 1, 0, f=lib)
@@ -877,21 +866,22 @@ def test_transpose():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([[random.uniform(0, 1) for _ in range(DIM)], [random.uniform(0, 1) for _ in range(DIM)]], f=lib)
 
         ivy_gen.transpose(x0, (1, 0), f=lib)
-        ivy_gen_w_time.transpose(x0, f=time_lib)
+        ivy_gen.transpose(x0, f=lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.transpose(x0, (1, 0), f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.transpose(x0, (1, 0), f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.transpose(x0, (1, 0), f=lib)
@@ -909,21 +899,21 @@ def test_expand_dims():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.expand_dims(x0, 0, f=lib)
-        ivy_gen_w_time.expand_dims(x0, 0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.expand_dims(x0, 0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.expand_dims(x0, 0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.expand_dims(x0, 0, f=lib)
@@ -941,8 +931,6 @@ def test_where():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib) > 0
@@ -950,14 +938,17 @@ def test_where():
         x2 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.where(x0, x1, x2, condition_shape=[DIM], x_shape=[DIM], f=lib)
-        ivy_gen_w_time.where(x0, x1, x2, f=time_lib)
+        ivy_gen.where(x0, x1, x2, f=lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.where(x0, x1, x2, condition_shape=[DIM], x_shape=[DIM], f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.where(x0, x1, x2, condition_shape=[DIM], x_shape=[DIM], f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.where(x0, x1, x2, condition_shape=[DIM], x_shape=[DIM], f=lib)
@@ -975,21 +966,21 @@ def test_indices_where():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(-1, 1) for _ in range(DIM)], f=lib) > 0
 
         ivy_gen.indices_where(x0, f=lib)
-        ivy_gen_w_time.indices_where(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.indices_where(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.indices_where(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.indices_where(x0, f=lib)
@@ -1007,21 +998,21 @@ def test_reshape():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.reshape(x0, [1, DIM], f=lib)
-        ivy_gen_w_time.reshape(x0, [1, DIM], f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.reshape(x0, [1, DIM], f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.reshape(x0, [1, DIM], f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.reshape(x0, [1, DIM], f=lib)
@@ -1039,21 +1030,21 @@ def test_squeeze():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([[random.uniform(0, 1) for _ in range(DIM)]], f=lib)
 
         ivy_gen.squeeze(x0, f=lib)
-        ivy_gen_w_time.squeeze(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.squeeze(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.squeeze(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.squeeze(x0, f=lib)
@@ -1071,19 +1062,19 @@ def test_zeros():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         ivy_gen.zeros([DIM], f=lib)
-        ivy_gen_w_time.zeros([DIM], f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.zeros([DIM], f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.zeros([DIM], f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.zeros([DIM], f=lib)
@@ -1101,21 +1092,21 @@ def test_zeros_like():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.zeros_like(x0, f=lib)
-        ivy_gen_w_time.zeros_like(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.zeros_like(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.zeros_like(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.zeros_like(x0, f=lib)
@@ -1133,19 +1124,19 @@ def test_ones():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         ivy_gen.ones([DIM], f=lib)
-        ivy_gen_w_time.ones([DIM], f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.ones([DIM], f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.ones([DIM], f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.ones([DIM], f=lib)
@@ -1163,21 +1154,21 @@ def test_ones_like():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.ones_like(x0, f=lib)
-        ivy_gen_w_time.ones_like(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.ones_like(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.ones_like(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.ones_like(x0, f=lib)
@@ -1195,22 +1186,22 @@ def test_one_hot():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.cast(ivy_gen.tensor([random.randint(0, int(DIM ** 0.5) - 1)
                                           for _ in range(int(DIM**0.5))], f=lib), 'int64')
 
         ivy_gen.one_hot(x0, int(DIM**0.5), f=lib)
-        ivy_gen_w_time.one_hot(x0, int(DIM**0.5), f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.one_hot(x0, int(DIM**0.5), f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.one_hot(x0, int(DIM**0.5), f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.one_hot(x0, int(DIM**0.5), f=lib)
@@ -1228,22 +1219,22 @@ def test_cross():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([[random.uniform(0, 1)] * 3 for _ in range(DIM)], f=lib)
         x1 = ivy_gen.tensor([[random.uniform(0, 1)] * 3 for _ in range(DIM)], f=lib)
 
         ivy_gen.cross(x0, x1, f=lib)
-        ivy_gen_w_time.cross(x0, x1, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.cross(x0, x1, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.cross(x0, x1, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.cross(x0, x1, f=lib)
@@ -1261,22 +1252,22 @@ def test_matmul():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([[[random.uniform(0, 1) for _ in range(DIM)]]], f=lib)
         x1 = ivy_gen.tensor([[[random.uniform(0, 1)] for _ in range(DIM)]], f=lib)
 
         ivy_gen.matmul(x0, x1, batch_shape=[1], f=lib)
-        ivy_gen_w_time.matmul(x0, x1, batch_shape=[1], f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.matmul(x0, x1, batch_shape=[1], f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.matmul(x0, x1, batch_shape=[1], f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.matmul(x0, x1, batch_shape=[1], f=lib)
@@ -1294,21 +1285,22 @@ def test_cumsum():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.cumsum(x0, 0, f=lib)
-        ivy_gen_w_time.cumsum(x0, f=time_lib)
+        ivy_gen.cumsum(x0, f=lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.cumsum(x0, 0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.cumsum(x0, 0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.cumsum(x0, 0, f=lib)
@@ -1326,19 +1318,19 @@ def test_identity():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         ivy_gen.identity(int(DIM**0.5), f=lib)
-        ivy_gen_w_time.identity(int(DIM**0.5), f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.identity(int(DIM**0.5), f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.identity(int(DIM**0.5), f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.identity(int(DIM**0.5), f=lib)
@@ -1356,22 +1348,22 @@ def test_scatter_flat():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.randint(0, DIM - 1) for _ in range(DIM)], f=lib)
         x1 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.scatter_flat(x0, x1, DIM, f=lib)
-        ivy_gen_w_time.scatter_flat(x0, x1, DIM, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.scatter_flat(x0, x1, DIM, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.scatter_flat(x0, x1, DIM, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.scatter_flat(x0, x1, DIM, f=lib)
@@ -1389,22 +1381,22 @@ def test_scatter_nd():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([[random.randint(0, DIM - 1)] for _ in range(DIM)], f=lib)
         x1 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.scatter_nd(x0, x1, [DIM], f=lib)
-        ivy_gen_w_time.scatter_nd(x0, x1, [DIM], f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.scatter_nd(x0, x1, [DIM], f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.scatter_nd(x0, x1, [DIM], f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.scatter_nd(x0, x1, [DIM], f=lib)
@@ -1415,6 +1407,50 @@ def test_scatter_nd():
     append_to_file(fname, 'end of analysis')
 
 
+def test_scatter_min_max_graph():
+
+    import tensorflow as _tf
+
+    x0 = ivy_gen.array([random.randint(0, DIM - 1) for _ in range(DIM)], 'int32', f=_ivy_tf)
+    x0_nd = ivy_gen.expand_dims(x0, -1, f=_ivy_tf)
+    x1 = ivy_gen.array([random.uniform(0, 1) for _ in range(DIM)], 'float32', f=_ivy_tf)
+
+    for reduction in ['min', 'max']:
+
+        for method_name, fn, inds in [('scatter_flat', lambda i, u: ivy_gen.scatter_flat(i, u, DIM, reduction, f=_ivy_tf), x0),
+                                      ('scatter_nd', lambda i, u: ivy_gen.scatter_nd(i, u, [DIM], reduction, f=_ivy_tf), x0_nd)]:
+
+            fname = os.path.join(this_file_dir, 'runtime_analysis/{}/general/{}_{}_graph.txt'.format(
+                DIM, method_name, reduction))
+            if os.path.exists(fname):
+                os.remove(fname)
+
+            append_to_file(fname, '{}'.format(_ivy_tf))
+
+            graph_fn = _tf.function(fn)
+            graph_fn(inds, x1)
+            fn(inds, x1)
+            TIMES_DICT.clear()
+
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                graph_fn(inds, x1)
+                log_time(fname, 'tb4', time_at_start=True)
+
+                log_time(fname, 'tt0')
+                fn(inds, x1)
+                log_time(fname, 'tt1', time_at_start=True)
+
+            write_times()
+
+            # the graph is traced once, and no variables are created or captured between calls
+            assert graph_fn.experimental_get_tracing_count() == 1
+            assert not graph_fn.get_concrete_function(inds, x1).variables
+
+            append_to_file(fname, 'end of analysis')
+
+
 def test_gather_flat():
 
     fname = os.path.join(this_file_dir, 'runtime_analysis/{}/general/gather_flat.txt'.format(DIM))
@@ -1422,22 +1458,22 @@ def test_gather_flat():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
         x1 = ivy_gen.tensor([random.randint(0, DIM - 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.gather_flat(x0, x1, f=lib)
-        ivy_gen_w_time.gather_flat(x0, x1, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.gather_flat(x0, x1, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.gather_flat(x0, x1, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.gather_flat(x0, x1, f=lib)
@@ -1455,22 +1491,22 @@ def test_gather_nd():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
         x1 = ivy_gen.tensor([[random.randint(0, DIM - 1)] for _ in range(DIM)], f=lib)
 
         ivy_gen.gather_nd(x0, x1, indices_shape=[DIM, 1], f=lib)
-        ivy_gen_w_time.gather_nd(x0, x1, indices_shape=[DIM, 1], f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.gather_nd(x0, x1, indices_shape=[DIM, 1], f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.gather_nd(x0, x1, indices_shape=[DIM, 1], f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.gather_nd(x0, x1, indices_shape=[DIM, 1], f=lib)
@@ -1488,21 +1524,21 @@ def test_get_device():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.dev_str(x0, f=lib)
-        ivy_gen_w_time.dev_str(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.dev_str(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.dev_str(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.dev_str(x0, f=lib)
@@ -1520,21 +1556,21 @@ def test_dtype():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.dtype(x0, f=lib)
-        ivy_gen_w_time.dtype(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.dtype(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_gen.dtype(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.dtype(x0, f=lib)
@@ -1552,8 +1588,6 @@ def test_compile_fn():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         if call is helpers.mx_call:
             continue
 
@@ -1563,14 +1597,16 @@ def test_compile_fn():
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_gen.dtype(x0, f=lib)
-        ivy_gen_w_time.dtype(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_gen.compile_fn(some_fn, x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_gen_w_time.compile_fn(some_fn, x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_gen.compile_fn(some_fn, x0, f=lib)
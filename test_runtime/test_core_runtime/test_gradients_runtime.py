@@ -13,7 +13,6 @@ import random
 import ivy.core.general as ivy_gen
 import ivy.core.gradients as ivy_grad
 this_file_dir = os.path.dirname(os.path.realpath(__file__))
-import with_time_logs.ivy.core.gradients as ivy_grad_w_time
 
 from ivy import torch as _ivy_torch
 from ivy import tensorflow as _ivy_tf
@@ -21,21 +20,9 @@ from ivy import mxnd as _ivy_mxnd
 from ivy import jax as _ivy_jnp
 from ivy import numpy as _ivy_np
 
-from with_time_logs.ivy import torch as _ivy_torch_w_time
-from with_time_logs.ivy import tensorflow as _ivy_tf_w_time
-from with_time_logs.ivy import mxnd as _ivy_mxnd_w_time
-from with_time_logs.ivy import jax as _ivy_jnp_w_time
-from with_time_logs.ivy import numpy as _ivy_np_w_time
-
-LIB_DICT = {_ivy_torch: _ivy_torch_w_time,
-            _ivy_tf: _ivy_tf_w_time,
-            _ivy_mxnd: _ivy_mxnd_w_time,
-            _ivy_jnp: _ivy_jnp_w_time,
-            _ivy_np: _ivy_np_w_time}
-
 # local
 import ivy_tests.helpers as helpers
-from test_runtime.utils import append_to_file, log_time, write_times, TIMES_DICT
+from test_runtime.utils import append_to_file, log_time, log_backend_times, write_times, TIMES_DICT
 
 
 def test_variable():
@@ -45,21 +32,21 @@ def test_variable():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_grad.variable(x0, f=lib)
-        ivy_grad_w_time.variable(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_grad_w_time.variable(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_grad.variable(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_grad.variable(x0, f=lib)
@@ -77,8 +64,6 @@ def test_execute_with_gradients():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
@@ -86,14 +71,16 @@ def test_execute_with_gradients():
         xs = [ivy_grad.variable(x0)]
 
         ivy_grad.execute_with_gradients(func, xs, f=lib)
-        ivy_grad_w_time.execute_with_gradients(func, xs, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_grad.execute_with_gradients(func, xs, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_grad_w_time.execute_with_gradients(func, xs, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_grad.execute_with_gradients(func, xs, f=lib)
@@ -111,8 +98,6 @@ def test_gradient_descent_update():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
@@ -121,14 +106,16 @@ def test_gradient_descent_update():
         dcdws = [x1]
 
         ivy_grad.gradient_descent_update(ws, dcdws, 0.1, f=lib)
-        ivy_grad_w_time.gradient_descent_update(ws, dcdws, 0.1, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_grad_w_time.gradient_descent_update(ws, dcdws, 0.1, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_grad.gradient_descent_update(ws, dcdws, 0.1, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_grad.gradient_descent_update(ws, dcdws, 0.1, f=lib)
@@ -146,21 +133,21 @@ def test_stop_gradient():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_grad.stop_gradient(x0, f=lib)
-        ivy_grad_w_time.stop_gradient(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_grad_w_time.stop_gradient(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_grad.stop_gradient(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_grad.stop_gradient(x0, f=lib)
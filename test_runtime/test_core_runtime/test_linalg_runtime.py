@@ -13,7 +13,6 @@ import random
 import ivy.core.general as ivy_gen
 import ivy.core.linalg as ivy_linalg
 this_file_dir = os.path.dirname(os.path.realpath(__file__))
-import with_time_logs.ivy.core.linalg as ivy_linalg_w_time
 
 from ivy import torch as _ivy_torch
 from ivy import tensorflow as _ivy_tf
@@ -21,21 +20,9 @@ from ivy import mxnd as _ivy_mxnd
 from ivy import jax as _ivy_jnp
 from ivy import numpy as _ivy_np
 
-from with_time_logs.ivy import torch as _ivy_torch_w_time
-from with_time_logs.ivy import tensorflow as _ivy_tf_w_time
-from with_time_logs.ivy import mxnd as _ivy_mxnd_w_time
-from with_time_logs.ivy import jax as _ivy_jnp_w_time
-from with_time_logs.ivy import numpy as _ivy_np_w_time
-
-LIB_DICT = {_ivy_torch: _ivy_torch_w_time,
-            _ivy_tf: _ivy_tf_w_time,
-            _ivy_mxnd: _ivy_mxnd_w_time,
-            _ivy_jnp: _ivy_jnp_w_time,
-            _ivy_np: _ivy_np_w_time}
-
 # local
 import ivy_tests.helpers as helpers
-from test_runtime.utils import append_to_file, log_time, write_times, TIMES_DICT
+from test_runtime.utils import append_to_file, log_time, log_backend_times, write_times, TIMES_DICT
 
 
 def test_svd():
@@ -45,22 +32,22 @@ def test_svd():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([[[random.uniform(0, 1), random.uniform(0, 1)],
                               [random.uniform(0, 1), random.uniform(0, 1)]] for _ in range(DIM)], f=lib)
 
         ivy_linalg.svd(x0, f=lib)
-        ivy_linalg_w_time.svd(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_linalg.svd(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_linalg_w_time.svd(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_linalg.svd(x0, f=lib)
@@ -78,22 +65,22 @@ def test_norm():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([[[random.uniform(0, 1), random.uniform(0, 1)],
                               [random.uniform(0, 1), random.uniform(0, 1)]] for _ in range(DIM)], f=lib)
 
         ivy_linalg.norm(x0, f=lib)
-        ivy_linalg_w_time.norm(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_linalg_w_time.norm(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_linalg.norm(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_linalg.norm(x0, f=lib)
@@ -111,22 +98,22 @@ def test_inv():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([[[random.uniform(0, 1), random.uniform(0, 1)],
                               [random.uniform(0, 1), random.uniform(0, 1)]] for _ in range(DIM)], f=lib)
 
         ivy_linalg.inv(x0, f=lib)
-        ivy_linalg_w_time.inv(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_linalg.inv(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_linalg_w_time.inv(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_linalg.inv(x0, f=lib)
@@ -144,22 +131,22 @@ def test_pinv():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([[[random.uniform(0, 1), random.uniform(0, 1)],
                               [random.uniform(0, 1), random.uniform(0, 1)]] for _ in range(DIM)], f=lib)
 
         ivy_linalg.pinv(x0, f=lib)
-        ivy_linalg_w_time.pinv(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_linalg_w_time.pinv(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_linalg.pinv(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_linalg.pinv(x0, f=lib)
@@ -177,22 +164,22 @@ def test_vector_to_skew_symmetric_matrix():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([[random.uniform(0, 1), random.uniform(0, 1), random.uniform(0, 1)]
                              for _ in range(DIM)], f=lib)
 
         ivy_linalg.vector_to_skew_symmetric_matrix(x0, f=lib)
-        ivy_linalg_w_time.vector_to_skew_symmetric_matrix(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_linalg_w_time.vector_to_skew_symmetric_matrix(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_linalg.vector_to_skew_symmetric_matrix(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_linalg.vector_to_skew_symmetric_matrix(x0, f=lib)
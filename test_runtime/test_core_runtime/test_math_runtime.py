@@ -13,7 +13,6 @@ import random
 import ivy.core.general as ivy_gen
 import ivy.core.math as ivy_math
 this_file_dir = os.path.dirname(os.path.realpath(__file__))
-import with_time_logs.ivy.core.math as ivy_math_w_time
 
 from ivy import torch as _ivy_torch
 from ivy import tensorflow as _ivy_tf
@@ -21,21 +20,9 @@ from ivy import mxnd as _ivy_mxnd
 from ivy import jax as _ivy_jnp
 from ivy import numpy as _ivy_np
 
-from with_time_logs.ivy import torch as _ivy_torch_w_time
-from with_time_logs.ivy import tensorflow as _ivy_tf_w_time
-from with_time_logs.ivy import mxnd as _ivy_mxnd_w_time
-from with_time_logs.ivy import jax as _ivy_jnp_w_time
-from with_time_logs.ivy import numpy as _ivy_np_w_time
-
-LIB_DICT = {_ivy_torch: _ivy_torch_w_time,
-            _ivy_tf: _ivy_tf_w_time,
-            _ivy_mxnd: _ivy_mxnd_w_time,
-            _ivy_jnp: _ivy_jnp_w_time,
-            _ivy_np: _ivy_np_w_time}
-
 # local
 import ivy_tests.helpers as helpers
-from test_runtime.utils import append_to_file, log_time, write_times, TIMES_DICT
+from test_runtime.utils import append_to_file, log_time, log_backend_times, write_times, TIMES_DICT
 
 
 def test_sin():
@@ -45,21 +32,21 @@ def test_sin():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_math.sin(x0, f=lib)
-        ivy_math_w_time.sin(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_math_w_time.sin(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_math.sin(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_math.sin(x0, f=lib)
@@ -77,21 +64,21 @@ def test_cos():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_math.cos(x0, f=lib)
-        ivy_math_w_time.cos(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_math_w_time.cos(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_math.cos(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_math.cos(x0, f=lib)
@@ -109,21 +96,21 @@ def test_tan():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_math.tan(x0, f=lib)
-        ivy_math_w_time.tan(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_math_w_time.tan(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_math.tan(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_math.tan(x0, f=lib)
@@ -141,21 +128,21 @@ def test_asin():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_math.asin(x0, f=lib)
-        ivy_math_w_time.asin(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_math_w_time.asin(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_math.asin(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_math.asin(x0, f=lib)
@@ -173,21 +160,21 @@ def test_acos():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_math.acos(x0, f=lib)
-        ivy_math_w_time.acos(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_math_w_time.acos(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_math.acos(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_math.acos(x0, f=lib)
@@ -205,21 +192,21 @@ def test_atan():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_math.atan(x0, f=lib)
-        ivy_math_w_time.atan(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_math_w_time.atan(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_math.atan(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_math.atan(x0, f=lib)
@@ -237,22 +224,22 @@ def test_atan2():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
         x1 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_math.atan2(x0, x1, f=lib)
-        ivy_math_w_time.atan2(x0, x1, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_math_w_time.atan2(x0, x1, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_math.atan2(x0, x1, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_math.atan2(x0, x1, f=lib)
@@ -270,21 +257,21 @@ def test_sinh():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_math.sinh(x0, f=lib)
-        ivy_math_w_time.sinh(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_math.sinh(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_math_w_time.sinh(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_math.sinh(x0, f=lib)
@@ -302,21 +289,21 @@ def test_cosh():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_math.cosh(x0, f=lib)
-        ivy_math_w_time.cosh(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_math.cosh(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_math_w_time.cosh(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_math.cosh(x0, f=lib)
@@ -334,21 +321,21 @@ def test_tanh():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_math.tanh(x0, f=lib)
-        ivy_math_w_time.tanh(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_math.tanh(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_math_w_time.tanh(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_math.tanh(x0, f=lib)
@@ -366,21 +353,21 @@ def test_asinh():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_math.asinh(x0, f=lib)
-        ivy_math_w_time.asinh(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_math.asinh(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_math_w_time.asinh(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_math.asinh(x0, f=lib)
@@ -398,21 +385,21 @@ def test_acosh():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_math.acosh(x0, f=lib)
-        ivy_math_w_time.acosh(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_math.acosh(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_math_w_time.acosh(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_math.acosh(x0, f=lib)
@@ -430,21 +417,21 @@ def test_atanh():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_math.atanh(x0, f=lib)
-        ivy_math_w_time.atanh(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_math.atanh(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_math_w_time.atanh(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_math.atanh(x0, f=lib)
@@ -462,21 +449,21 @@ def test_log():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_math.log(x0, f=lib)
-        ivy_math_w_time.log(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_math.log(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_math_w_time.log(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_math.log(x0, f=lib)
@@ -494,21 +481,21 @@ def test_exp():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([random.uniform(0, 1) for _ in range(DIM)], f=lib)
 
         ivy_math.exp(x0, f=lib)
-        ivy_math_w_time.exp(x0, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_math.exp(x0, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
 
-            log_time(fname, 'tb0')
-            ivy_math_w_time.exp(x0, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_math.exp(x0, f=lib)
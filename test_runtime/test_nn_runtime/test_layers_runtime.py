@@ -13,7 +13,6 @@ import random
 import ivy.core.general as ivy_gen
 import ivy.neural_net.layers as ivy_layers
 this_file_dir = os.path.dirname(os.path.realpath(__file__))
-import with_time_logs.ivy.neural_net.layers as ivy_layers_w_time
 
 from ivy import torch as _ivy_torch
 from ivy import tensorflow as _ivy_tf
@@ -21,21 +20,9 @@ from ivy import mxnd as _ivy_mxnd
 from ivy import jax as _ivy_jnp
 from ivy import numpy as _ivy_np
 
-from with_time_logs.ivy import torch as _ivy_torch_w_time
-from with_time_logs.ivy import tensorflow as _ivy_tf_w_time
-from with_time_logs.ivy import mxnd as _ivy_mxnd_w_time
-from with_time_logs.ivy import jax as _ivy_jnp_w_time
-from with_time_logs.ivy import numpy as _ivy_np_w_time
-
-LIB_DICT = {_ivy_torch: _ivy_torch_w_time,
-            _ivy_tf: _ivy_tf_w_time,
-            _ivy_mxnd: _ivy_mxnd_w_time,
-            _ivy_jnp: _ivy_jnp_w_time,
-            _ivy_np: _ivy_np_w_time}
-
 # local
 import ivy_tests.helpers as helpers
-from test_runtime.utils import append_to_file, log_time, write_times, TIMES_DICT
+from test_runtime.utils import append_to_file, log_time, log_backend_times, write_times, TIMES_DICT
 
 
 def test_conv1d():
@@ -45,10 +32,8 @@ def test_conv1d():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
-        if call in [helpers.np_call, helpers.jnp_call]:
-            # numpy and jax do not yet support 2d convolutions
+        if call is helpers.np_call:
+            # numpy does not yet support 2d convolutions
             continue
 
         x0 = ivy_gen.tensor([[[random.uniform(0, 1)], [random.uniform(0, 1)]] for _ in range(DIM)], f=lib)
@@ -62,14 +47,16 @@ def test_conv1d():
 
         filters = ivy_gen.tensor([[[0.]], [[1.]]], f=lib)
         ivy_layers.conv1d(x0, filters, 1, "SAME", data_format, filter_shape=[2], num_filters=1, f=lib)
-        ivy_layers_w_time.conv1d(x0, filters, 1, "SAME", data_format, filter_shape=[2], num_filters=1, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_layers_w_time.conv1d(x0, filters, 1, "SAME", data_format, filter_shape=[2], num_filters=1, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_layers.conv1d(x0, filters, 1, "SAME", data_format, filter_shape=[2], num_filters=1, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_layers.conv1d(x0, filters, 1, "SAME", data_format, filter_shape=[2], num_filters=1, f=lib)
@@ -87,10 +74,8 @@ def test_conv1d_transpose():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
-        if call in [helpers.np_call, helpers.jnp_call]:
-            # numpy and jax do not yet support 2d convolutions
+        if call is helpers.np_call:
+            # numpy does not yet support 2d convolutions
             continue
 
         x0 = ivy_gen.tensor([[[random.uniform(0, 1)], [random.uniform(0, 1)]] for _ in range(DIM)], f=lib)
@@ -105,16 +90,17 @@ def test_conv1d_transpose():
         filters = ivy_gen.tensor([[[0.]], [[1.]]], f=lib)
         ivy_layers.conv1d_transpose(x0, filters, 1, "SAME", (DIM, 2, 1), data_format, filter_shape=[2], num_filters=1,
                                     f=lib)
-        ivy_layers_w_time.conv1d_transpose(x0, filters, 1, "SAME", (DIM, 2, 1), data_format, filter_shape=[2],
-                                           num_filters=1, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_layers_w_time.conv1d_transpose(x0, filters, 1, "SAME", (DIM, 2, 1), data_format, filter_shape=[2],
-                                               num_filters=1, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_layers.conv1d_transpose(x0, filters, 1, "SAME", (DIM, 2, 1), data_format, filter_shape=[2],
+                                            num_filters=1, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_layers.conv1d_transpose(x0, filters, 1, "SAME", (DIM, 2, 1), data_format, filter_shape=[2],
@@ -133,10 +119,8 @@ def test_conv2d():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
-        if call in [helpers.np_call, helpers.jnp_call]:
-            # numpy and jax do not yet support 2d convolutions
+        if call is helpers.np_call:
+            # numpy does not yet support 2d convolutions
             continue
 
         x0 = ivy_gen.tensor([[[[random.uniform(0, 1)], [random.uniform(0, 1)]],
@@ -152,15 +136,16 @@ def test_conv2d():
         filters = ivy_gen.tensor([[[[0.]], [[1.]]],
                                   [[[1.]], [[0.]]]], f=lib)
         ivy_layers.conv2d(x0, filters, 1, "SAME", data_format, filter_shape=[2, 2], num_filters=1, f=lib)
-        ivy_layers_w_time.conv2d(x0, filters, 1, "SAME", data_format, filter_shape=[2, 2], num_filters=1, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_layers_w_time.conv2d(x0, filters, 1, "SAME", data_format, filter_shape=[2, 2], num_filters=1,
-                                     f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_layers.conv2d(x0, filters, 1, "SAME", data_format, filter_shape=[2, 2], num_filters=1, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_layers.conv2d(x0, filters, 1, "SAME", data_format, filter_shape=[2, 2], num_filters=1, f=lib)
@@ -178,10 +163,8 @@ def test_conv2d_transpose():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
-        if call in [helpers.np_call, helpers.jnp_call]:
-            # numpy and jax do not yet support 2d convolutions
+        if call is helpers.np_call:
+            # numpy does not yet support 2d convolutions
             continue
 
         x0 = ivy_gen.tensor([[[[random.uniform(0, 1)], [random.uniform(0, 1)]],
@@ -198,16 +181,17 @@ def test_conv2d_transpose():
                                   [[[1.]], [[0.]]]], f=lib)
         ivy_layers.conv2d_transpose(x0, filters, 1, "SAME", (DIM, 2, 2, 1), data_format, filter_shape=[2, 2],
                                     num_filters=1, f=lib)
-        ivy_layers_w_time.conv2d_transpose(x0, filters, 1, "SAME", (DIM, 2, 2, 1), data_format, filter_shape=[2, 2],
-                                           num_filters=1, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_layers_w_time.conv2d_transpose(x0, filters, 1, "SAME", (DIM, 2, 2, 1), data_format, filter_shape=[2, 2],
-                                               num_filters=1, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_layers.conv2d_transpose(x0, filters, 1, "SAME", (DIM, 2, 2, 1), data_format, filter_shape=[2, 2],
+                                            num_filters=1, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_layers.conv2d_transpose(x0, filters, 1, "SAME", (DIM, 2, 2, 1), data_format, filter_shape=[2, 2],
@@ -226,10 +210,8 @@ def test_depthwise_conv2d():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
-        if call in [helpers.np_call, helpers.jnp_call]:
-            # numpy and jax do not yet support 2d convolutions
+        if call is helpers.np_call:
+            # numpy does not yet support 2d convolutions
             continue
 
         x0 = ivy_gen.tensor([[[[random.uniform(0, 1)], [random.uniform(0, 1)]],
@@ -246,16 +228,17 @@ def test_depthwise_conv2d():
                                   [[1.], [0.]]], f=lib)
         ivy_layers.depthwise_conv2d(x0, filters, 1, "SAME", data_format, filter_shape=[2, 2], num_filters=1,
                                     num_channels=1, f=lib)
-        ivy_layers_w_time.depthwise_conv2d(x0, filters, 1, "SAME", data_format, filter_shape=[2, 2], num_filters=1,
-                                           f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_layers_w_time.depthwise_conv2d(x0, filters, 1, "SAME", data_format, filter_shape=[2, 2], num_filters=1,
-                                               f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_layers.depthwise_conv2d(x0, filters, 1, "SAME", data_format, filter_shape=[2, 2], num_filters=1,
+                                            f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_layers.depthwise_conv2d(x0, filters, 1, "SAME", data_format, filter_shape=[2, 2], num_filters=1, f=lib)
@@ -273,10 +256,8 @@ def test_conv3d():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
-        if call in [helpers.np_call, helpers.jnp_call]:
-            # numpy and jax do not yet support 3d convolutions
+        if call is helpers.np_call:
+            # numpy does not yet support 3d convolutions
             continue
 
         x0 = ivy_gen.tensor([[[[[random.uniform(0, 1)], [random.uniform(0, 1)]],
@@ -294,15 +275,16 @@ def test_conv3d():
         filters = ivy_gen.tensor([[[[[0.]], [[0.]]], [[[1.]], [[1.]]]],
                                   [[[[1.]], [[1.]]], [[[0.]], [[0.]]]]], f=lib)
         ivy_layers.conv3d(x0, filters, 1, "SAME", data_format, filter_shape=[2, 2, 2], num_filters=1, f=lib)
-        ivy_layers_w_time.conv3d(x0, filters, 1, "SAME", data_format, filter_shape=[2, 2, 2], num_filters=1, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_layers_w_time.conv3d(x0, filters, 1, "SAME", data_format, filter_shape=[2, 2, 2], num_filters=1,
-                                     f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_layers.conv3d(x0, filters, 1, "SAME", data_format, filter_shape=[2, 2, 2], num_filters=1, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_layers.conv3d(x0, filters, 1, "SAME", data_format, filter_shape=[2, 2, 2], num_filters=1, f=lib)
@@ -320,10 +302,8 @@ def test_conv3d_transpose():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
-        if call in [helpers.np_call, helpers.jnp_call, helpers.mx_call, helpers.mx_graph_call]:
-            # numpy and jax do not yet support 3d convolutions, and mxnet only supports with CUDNN
+        if call in [helpers.np_call, helpers.mx_call, helpers.mx_graph_call]:
+            # numpy does not yet support 3d convolutions, and mxnet only supports with CUDNN
             continue
 
         x0 = ivy_gen.tensor([[[[[random.uniform(0, 1)], [random.uniform(0, 1)]],
@@ -342,16 +322,17 @@ def test_conv3d_transpose():
                                   [[[[1.]], [[1.]]], [[[0.]], [[0.]]]]], f=lib)
         ivy_layers.conv3d_transpose(x0, filters, 1, "SAME", (DIM, 2, 2, 2, 1), data_format, filter_shape=[2, 2, 2],
                                     num_filters=1, f=lib)
-        ivy_layers_w_time.conv3d_transpose(x0, filters, 1, "SAME", (DIM, 2, 2, 2, 1), data_format,
-                                           filter_shape=[2, 2, 2], num_filters=1, f=time_lib)
         TIMES_DICT.clear()
 
-        for _ in range(100):
+        with log_backend_times(fname):
+            for _ in range(100):
 
-            log_time(fname, 'tb0')
-            ivy_layers_w_time.conv3d_transpose(x0, filters, 1, "SAME", (DIM, 2, 2, 2, 1), data_format,
-                                               filter_shape=[2, 2, 2], num_filters=1, f=time_lib)
-            log_time(fname, 'tb4', time_at_start=True)
+                log_time(fname, 'tb0')
+                ivy_layers.conv3d_transpose(x0, filters, 1, "SAME", (DIM, 2, 2, 2, 1), data_format,
+                                            filter_shape=[2, 2, 2], num_filters=1, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
 
             log_time(fname, 'tt0')
             ivy_layers.conv3d_transpose(x0, filters, 1, "SAME", (DIM, 2, 2, 2, 1), data_format, filter_shape=[2, 2, 2],
@@ -370,8 +351,6 @@ def test_linear():
         os.remove(fname)
     for lib, call in [(l, c) for l, c in helpers.calls if c not in [helpers.tf_graph_call, helpers.mx_graph_call]]:
 
-        time_lib = LIB_DICT[lib]
-
         append_to_file(fname, '{}'.format(lib))
 
         x0 = ivy_gen.tensor([[random.uniform(0, 1) for _ in range(DIM)]], f=lib)
@@ -380,17 +359,72 @@ def test_linear():
         bias = ivy_gen.tensor([random.uniform(0, 1), random.uniform(0, 1)], f=lib)
 
         ivy_layers.linear(x0, weight, bias, num_hidden=2, f=lib)
-        ivy_layers_w_time.linear(x0, weight, bias, num_hidden=2, f=time_lib)
+        TIMES_DICT.clear()
+
+        with log_backend_times(fname):
+            for _ in range(100):
+
+                log_time(fname, 'tb0')
+                ivy_layers.linear(x0, weight, bias, num_hidden=2, f=lib)
+                log_time(fname, 'tb4', time_at_start=True)
+
+        for _ in range(100):
+
+            log_time(fname, 'tt0')
+            ivy_layers.linear(x0, weight, bias, num_hidden=2, f=lib)
+            log_time(fname, 'tt1', time_at_start=True)
+
+        write_times()
+
+    append_to_file(fname, 'end of analysis')
+
+
+def test_conv2d_stack():
+
+    import torch as _torch
+
+    num_layers = 8
+    batch_size = 8
+    channels = 32
+
+    fname = os.path.join(this_file_dir, 'runtime_analysis/{}/layers/conv2d_stack.txt'.format(DIM))
+    if os.path.exists(fname):
+        os.remove(fname)
+
+    append_to_file(fname, '{}'.format(_ivy_torch))
+
+    # ivy NHWC layer stack, with HWIO filters
+    x0 = _torch.rand(batch_size, 64, 64, channels)
+    filters = [_torch.rand(3, 3, channels, channels) for _ in range(num_layers)]
+
+    def ivy_stack(x):
+        for filt in filters:
+            x = ivy_layers.conv2d(x, filt, 1, "SAME", "NHWC", f=_ivy_torch)
+        return x
+
+    # native channels_last layer stack, with pre-packed OIHW filters
+    x0_native = x0.permute(0, 3, 1, 2)
+    filters_native = [filt.permute(3, 2, 0, 1).contiguous(memory_format=_torch.channels_last) for filt in filters]
+
+    def native_stack(x):
+        for filt in filters_native:
+            x = _torch.nn.functional.conv2d(x, filt, None, 1, [1, 1])
+        return x
+
+    with _torch.no_grad():
+
+        ivy_stack(x0)
+        native_stack(x0_native)
         TIMES_DICT.clear()
 
         for _ in range(100):
 
             log_time(fname, 'tb0')
-            ivy_layers_w_time.linear(x0, weight, bias, num_hidden=2, f=time_lib)
+            native_stack(x0_native)
             log_time(fname, 'tb4', time_at_start=True)
 
             log_time(fname, 'tt0')
-            ivy_layers.linear(x0, weight, bias, num_hidden=2, f=lib)
+            ivy_stack(x0)
             log_time(fname, 'tt1', time_at_start=True)
 
         write_times()